@@ -0,0 +1 @@
+# Pacote comum (código compartilhado entre os geradores simples e power-law)
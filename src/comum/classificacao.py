@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Classificação do tipo de grafo (0, 1, 20, 21, 30, 31) a partir das arestas.
+
+Compartilhada pelo gerador simples (arestas.py, utils.tipoGrafo) e pelo
+power-law (pwl.tipoGrafo). Depende apenas de NumPy, sem constants.py: os
+dois diretórios têm o seu, e este módulo não pode depender de nenhum deles.
+"""
+import numpy as np
+
+
+def _chaveRepetida(u, v, numV, dirigido):
+    """Se algum par (u, v) se repete (em não dirigidos, (u, v) e (v, u) são o mesmo par)."""
+    if not dirigido:
+        u, v = np.minimum(u, v), np.maximum(u, v)
+    chaves = np.sort(u * numV + v)
+    return bool(np.any(chaves[1:] == chaves[:-1]))
+
+
+def classificaTipo(dirigido, multipla, laco):
+    """
+    Código do tipo do grafo (0, 1, 20, 21, 30, 31) a partir das características.
+
+    Mesma classificação de utils.tipoGrafo e pwl.tipoGrafo.
+    """
+    if dirigido and multipla and laco:
+        return 31  # Pseudografo-Dirigido
+    elif dirigido and multipla:
+        return 21  # Multigrafo-Dirigido
+    elif dirigido:
+        return 1   # Digrafo
+    elif laco:
+        return 30  # Pseudografo
+    elif multipla:
+        return 20  # Multigrafo
+    else:
+        return 0   # Simples
+
+
+def tipoDirigido(tipo):
+    """Se o código de tipo (ver classificaTipo) é de um grafo dirigido (1, 21 ou 31)."""
+    return tipo in (1, 21, 31)
+
+
+def caracteristicasArestas(arestas, numV=None, dirigido=None):
+    """
+    Detecta direção, arestas múltiplas e laços de um array de arestas em O(E log E).
+
+    - Laços: ``u == v``
+    - Arestas múltiplas: chave ``u * numV + v`` repetida (com ``u <= v`` em
+      não dirigidos)
+    - Direção (dirigido=None): alguma chave (u, v) sem a reversa (v, u) com a
+      mesma multiplicidade (multiconjuntos de chaves e de reversas diferem),
+      como a assimetria da matriz em utils.tipoGrafo; nesse caso as múltiplas
+      são contadas por par ordenado
+
+    Args:
+        arestas: Array (E, 2) ou lista de tuplas (u, v)
+        numV (int): Número de vértices (None: maior vértice + 1)
+        dirigido (bool): Direção conhecida do grafo, ou None para detectar
+
+    Returns:
+        tuple: (dirigido, multipla, laco)
+
+    Example:
+        >>> caracteristicasArestas([(0, 1), (1, 0), (2, 2)])
+        (False, False, True)
+        >>> caracteristicasArestas([(0, 1), (1, 0), (2, 2)], dirigido=False)
+        (False, True, True)
+    """
+    arestas = np.asarray(arestas, dtype=np.int64).reshape(-1, 2)
+    if arestas.size == 0:
+        return bool(dirigido), False, False
+    u, v = arestas[:, 0], arestas[:, 1]
+    if numV is None:
+        numV = int(arestas.max()) + 1
+    laco = bool(np.any(u == v))
+    if dirigido is not None:
+        return dirigido, _chaveRepetida(u, v, numV, dirigido), laco
+
+    # Simétrica se as chaves reversas formam o mesmo multiconjunto
+    chaves = np.sort(u * numV + v)
+    multipla = bool(np.any(chaves[1:] == chaves[:-1]))
+    simetrica = np.array_equal(chaves, np.sort(v * numV + u))
+    return not simetrica, multipla, laco
+
+
+def tipoArestas(arestas, numV=None, dirigido=None):
+    """
+    Tipo do grafo (0, 1, 20, 21, 30, 31) a partir do array de arestas.
+
+    Ver caracteristicasArestas e classificaTipo.
+
+    Example:
+        >>> tipoArestas([(0, 1), (0, 1), (1, 2)], dirigido=True)
+        21
+    """
+    return classificaTipo(*caracteristicasArestas(arestas, numV, dirigido))
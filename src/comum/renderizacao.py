@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Renderização escalável e em cache de grafos a partir de arrays de arestas.
+
+Etapas de renderizaGrafo:
+
+1. Redução: acima de maxVertices vértices, desenha uma amostra estratificada
+   por grau (amostraEstratificada) ou o grafo reduzido por contração de
+   vizinhanças (reduzGrafo), com no máximo maxVertices vértices
+2. Layout: Kamada-Kawai até limiarKK vértices, Fruchterman-Reingold acima;
+   as posições ficam em cache em dir_cache, com a hash do grafo desenhado
+   (hashGrafo) no nome do arquivo, e não são recalculadas
+3. PNG headless: matplotlib com o canvas Agg, sem pyplot nem janela
+
+Usado por simples/visualizacao.py e por pwl/visualizacao.py. Os limites são
+parâmetros, com os padrões deste módulo: ele não lê nenhum constants.py.
+renderizaLote desenha um lote de arquivos de arestas (ex.: a saída de
+lote.py) em um pool de processos.
+
+Example:
+    $ python comum/renderizacao.py --manifesto datasets/manifesto.csv --saida plots --workers 4
+    $ python comum/renderizacao.py datasets/*.npy --saida plots --modo reduzido
+"""
+import argparse
+import csv
+import hashlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import networkx as nx
+
+# Execução direta (python comum/renderizacao.py): src no sys.path, como em pwl.py
+_src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+if _src_dir not in sys.path:
+    sys.path.append(_src_dir)
+from comum.classificacao import tipoDirigido
+
+# Modos de redução de grafos acima de maxVertices
+MODOS_REDUCAO = ('amostra', 'reduzido')
+MAX_VERTICES_DESENHO = 1000  # Acima disso, desenha uma amostra ou o grafo reduzido
+LIMIAR_KAMADA_KAWAI = 300   # Até este tamanho, layout Kamada-Kawai; acima, spring (Fruchterman-Reingold)
+# PNGs (src/plots, como ../plots em main.py) e cache em disco das posições, por hash
+# do grafo; relativos a este arquivo, não ao diretório atual
+DIR_PLOTS = os.path.normpath(os.path.join(_src_dir, 'plots'))
+DIR_CACHE_LAYOUTS = os.path.join(DIR_PLOTS, 'layouts')
+
+
+def _comoArray(arestas):
+    return np.asarray(arestas, dtype=np.int64).reshape(-1, 2)
+
+
+def hashGrafo(arestas, numV, dirigido=False):
+    """
+    Hash (SHA-1, hexadecimal) da estrutura do grafo.
+
+    Depende apenas de numV, da direção e do conjunto de pares distintos: a
+    ordem das arestas e as cópias de arestas múltiplas não alteram a hash.
+    """
+    arestas = _comoArray(arestas)
+    u, v = arestas[:, 0], arestas[:, 1]
+    if not dirigido:
+        u, v = np.minimum(u, v), np.maximum(u, v)
+    hash_ = hashlib.sha1(f"{numV}:{int(dirigido)}:".encode())
+    hash_.update(np.unique(u * numV + v).tobytes())
+    return hash_.hexdigest()
+
+
+def carregaLayout(chave, dir_cache=DIR_CACHE_LAYOUTS):
+    """Posições (numV, 2) salvas com a chave, ou None se não estão em cache."""
+    if dir_cache is None:
+        return None
+    caminho = os.path.join(dir_cache, f"{chave}.npy")
+    return np.load(caminho) if os.path.exists(caminho) else None
+
+
+def salvaLayout(chave, posicoes, dir_cache=DIR_CACHE_LAYOUTS):
+    """Grava as posições no cache (escrita atômica: workers podem gravar a mesma chave)."""
+    if dir_cache is None:
+        return
+    os.makedirs(dir_cache, exist_ok=True)
+    temporario = os.path.join(dir_cache, f".{chave}.{os.getpid()}.npy")
+    np.save(temporario, np.asarray(posicoes, dtype=np.float64))
+    os.replace(temporario, os.path.join(dir_cache, f"{chave}.npy"))
+
+
+def calculaLayout(arestas, numV, algoritmo=None, seed=0, limiarKK=LIMIAR_KAMADA_KAWAI):
+    """
+    Posições 2-D dos vértices 0..numV-1 (a direção das arestas é ignorada).
+
+    Args:
+        algoritmo (str): 'kk' (Kamada-Kawai), 'spring' (Fruchterman-Reingold)
+            ou None (kk até limiarKK vértices, spring acima)
+        seed (int): Semente do layout spring
+        limiarKK (int): Maior grafo com Kamada-Kawai quando algoritmo é None
+
+    Returns:
+        np.ndarray: Posições (numV, 2)
+    """
+    G = nx.Graph()
+    G.add_nodes_from(range(numV))
+    G.add_edges_from(_comoArray(arestas).tolist())
+    if algoritmo is None:
+        algoritmo = 'kk' if numV <= limiarKK else 'spring'
+    if numV == 0:
+        return np.zeros((0, 2))
+    if algoritmo == 'kk':
+        pos = nx.kamada_kawai_layout(G)
+    else:
+        pos = nx.spring_layout(G, seed=seed)
+    return np.array([pos[i] for i in range(numV)], dtype=np.float64)
+
+
+def layoutEmCache(arestas, numV, algoritmo=None, seed=0, dir_cache=DIR_CACHE_LAYOUTS, limiarKK=LIMIAR_KAMADA_KAWAI):
+    """
+    calculaLayout com cache em disco.
+
+    A chave é hashGrafo (sem direção, que o layout ignora) mais o algoritmo e
+    a semente, de modo que o mesmo grafo em execuções diferentes reaproveita
+    o layout.
+
+    Returns:
+        tuple: (posicoes, chave, em_cache)
+    """
+    if algoritmo is None:
+        algoritmo = 'kk' if numV <= limiarKK else 'spring'
+    chave = f"{hashGrafo(arestas, numV)}-{algoritmo}-{seed}"
+    posicoes = carregaLayout(chave, dir_cache)
+    if posicoes is not None:
+        return posicoes, chave, True
+    posicoes = calculaLayout(arestas, numV, algoritmo, seed)
+    salvaLayout(chave, posicoes, dir_cache)
+    return posicoes, chave, False
+
+
+def amostraEstratificada(arestas, numV, maxVertices, rng=None):
+    """
+    Subgrafo induzido por uma amostra de até maxVertices vértices, estratificada por grau.
+
+    Metade da amostra são sementes: os vértices são agrupados em faixas
+    log2(grau + 1) e cada faixa contribui com uma fração do seu tamanho igual
+    à da amostra, e com ao menos um vértice, de modo que os hubs raros da
+    cauda (power-law) aparecem no desenho. O restante são vizinhos das
+    sementes, sorteados: em grafos esparsos, o subgrafo induzido só pelas
+    sementes quase não tem arestas.
+
+    Args:
+        arestas: Array (E, 2) ou lista de tuplas (u, v)
+        numV (int): Número de vértices
+        maxVertices (int): Tamanho máximo da amostra
+        rng: Semente ou np.random.Generator
+
+    Returns:
+        tuple: (vertices, arestasAmostra): vértices amostrados (rótulos
+        originais, em ordem crescente) e arestas do subgrafo induzido,
+        renumeradas para 0..len(vertices)-1
+    """
+    arestas = _comoArray(arestas)
+    if numV <= maxVertices:
+        return np.arange(numV), arestas
+    gen = np.random.default_rng(rng)
+    graus = np.bincount(arestas.ravel(), minlength=numV)
+    faixas = np.log2(graus + 1).astype(np.int64)
+    tamanhos = np.bincount(faixas)
+    numSementes = max(1, maxVertices // 2)
+    cotas = np.minimum(tamanhos, np.maximum(1, tamanhos * numSementes // numV))
+    cotas[tamanhos == 0] = 0
+
+    # Vértices em ordem aleatória dentro de cada faixa; cada faixa fica com os primeiros
+    embaralhados = gen.permutation(numV)
+    embaralhados = embaralhados[np.argsort(faixas[embaralhados], kind='stable')]
+    posicao = np.arange(numV) - np.repeat(np.cumsum(tamanhos) - tamanhos, tamanhos)
+    sementes = embaralhados[posicao < np.repeat(cotas, tamanhos)][:maxVertices]
+
+    # Vizinhos das sementes, em ordem aleatória, até completar maxVertices
+    escolhido = np.zeros(numV, dtype=bool)
+    escolhido[sementes] = True
+    u, v = arestas[:, 0], arestas[:, 1]
+    vizinhos = np.concatenate((v[escolhido[u]], u[escolhido[v]]))
+    vizinhos = gen.permutation(vizinhos[~escolhido[vizinhos]])
+    vizinhos, primeira = np.unique(vizinhos, return_index=True)
+    vizinhos = vizinhos[np.argsort(primeira)][:maxVertices - sementes.size]
+    vertices = np.sort(np.concatenate((sementes, vizinhos)))
+
+    novos = np.full(numV, -1, dtype=np.int64)
+    novos[vertices] = np.arange(vertices.size)
+    u, v = novos[u], novos[v]
+    mantidas = (u >= 0) & (v >= 0)
+    return vertices, np.column_stack((u[mantidas], v[mantidas]))
+
+
+def reduzGrafo(arestas, numV, maxVertices):
+    """
+    Grafo reduzido por contrações sucessivas de vizinhanças.
+
+    A cada rodada, cada vértice se junta ao vizinho de maior grau (empates
+    pelo menor rótulo), se esse vizinho vem antes dele nessa ordem; as
+    cadeias são resolvidas por saltos de ponteiro, e cada máximo local vira
+    um grupo. Rodadas se repetem até restarem no máximo maxVertices grupos
+    ou nenhuma contração ser possível. Grupos isolados (sem vizinhos) se
+    juntam em um único grupo. A última rodada faz só as contrações
+    necessárias, as de menor grau.
+
+    Returns:
+        tuple: (grupos, arestasReduzidas, multiplicidades, tamanhos)
+            - grupos: grupo de cada vértice original
+            - arestasReduzidas: pares distintos de grupos, sem laços
+            - multiplicidades: arestas originais entre cada par
+            - tamanhos: vértices em cada grupo
+    """
+    arestas = _comoArray(arestas)
+    grupos = np.arange(numV)
+    u, v = np.minimum(arestas[:, 0], arestas[:, 1]), np.maximum(arestas[:, 0], arestas[:, 1])
+    fora = u != v
+    chaves, pesos = np.unique(u[fora] * numV + v[fora], return_counts=True)
+    u, v = chaves // numV, chaves % numV
+    numG = numV
+
+    while numG > maxVertices:
+        graus = np.bincount(u, pesos, minlength=numG) + np.bincount(v, pesos, minlength=numG)
+        origem, destino = np.concatenate((u, v)), np.concatenate((v, u))
+        # Para cada origem, o vizinho de maior grau (empate: menor rótulo) primeiro
+        ordem = np.lexsort((destino, -graus[destino], origem))
+        origem, destino = origem[ordem], destino[ordem]
+        primeiros = np.flatnonzero(np.diff(origem, prepend=-1))
+        origem, destino = origem[primeiros], destino[primeiros]
+        sobe = (graus[destino] > graus[origem]) | ((graus[destino] == graus[origem]) & (destino < origem))
+        origem, destino = origem[sobe], destino[sobe]
+        isolados = np.flatnonzero(graus == 0)
+        if isolados.size > 1:
+            origem = np.concatenate((isolados[1:], origem))
+            destino = np.concatenate((np.full(isolados.size - 1, isolados[0]), destino))
+        excesso = numG - maxVertices
+        if origem.size > excesso:
+            # Cada contração remove um grupo: na última rodada, só as de menor grau, até maxVertices
+            menores = np.argsort(graus[origem], kind='stable')[:excesso]
+            origem, destino = origem[menores], destino[menores]
+        alvo = np.arange(numG)
+        alvo[origem] = destino
+        while True:
+            proximo = alvo[alvo]
+            if np.array_equal(proximo, alvo):
+                break
+            alvo = proximo
+        raizes, novos = np.unique(alvo, return_inverse=True)
+        if raizes.size == numG:
+            break
+        numG = raizes.size
+        grupos = novos[grupos]
+        u, v = novos[u], novos[v]
+        fora = u != v
+        u, v = np.minimum(u[fora], v[fora]), np.maximum(u[fora], v[fora])
+        chaves, inverso = np.unique(u * numG + v, return_inverse=True)
+        pesos = np.bincount(inverso, pesos[fora])
+        u, v = chaves // numG, chaves % numG
+
+    return grupos, np.column_stack((u, v)), pesos.astype(np.int64), np.bincount(grupos, minlength=numG)
+
+
+def desenhaPNG(posicoes, arestas, caminho, dirigido=False, tamanhos=None, larguras=None, titulo=None):
+    """
+    Grava o desenho em PNG sem pyplot (canvas Agg, sem janela nem backend interativo).
+
+    Args:
+        posicoes (np.ndarray): Posições (numV, 2)
+        arestas: Array (E, 2) de índices em posicoes
+        caminho (str): Arquivo PNG de saída
+        dirigido (bool): Desenha a ponta de seta no meio de cada aresta
+        tamanhos (np.ndarray): Peso de cada vértice no tamanho do marcador (grupos)
+        larguras (np.ndarray): Peso de cada aresta na espessura (multiplicidades)
+        titulo (str): Título do desenho
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.collections import LineCollection
+
+    arestas = _comoArray(arestas)
+    figura = Figure(figsize=(10, 10), dpi=100)
+    FigureCanvasAgg(figura)
+    eixo = figura.add_subplot()
+    numV = len(posicoes)
+
+    espessuras = 0.5 if larguras is None else 0.5 + np.log2(larguras)
+    eixo.add_collection(LineCollection(posicoes[arestas], linewidths=espessuras, colors='gray', alpha=0.4))
+    if dirigido and arestas.size:
+        # Pontas de tamanho fixo no meio da aresta (na ponta ficariam sob o marcador do vértice)
+        inicio, fim = posicoes[arestas[:, 0]], posicoes[arestas[:, 1]]
+        direcao = fim - inicio
+        norma = np.hypot(direcao[:, 0], direcao[:, 1])
+        validas = norma > 0
+        meio, direcao = (inicio + fim)[validas] / 2, direcao[validas] / norma[validas, None]
+        eixo.quiver(meio[:, 0], meio[:, 1], direcao[:, 0], direcao[:, 1], angles='xy', pivot='mid',
+                    scale_units='inches', scale=12, width=0.002, headwidth=4, headlength=5,
+                    headaxislength=4.5, color='dimgray', alpha=0.6)
+
+    area = 10 + 2000 / max(numV, 1) if tamanhos is None else 10 + 40 * np.sqrt(tamanhos / np.mean(tamanhos))
+    eixo.scatter(posicoes[:, 0], posicoes[:, 1], s=area, c='skyblue', edgecolors='steelblue',
+                 linewidths=0.3, zorder=2)
+    if titulo:
+        eixo.set_title(titulo)
+    eixo.set_axis_off()
+    eixo.autoscale()
+    figura.savefig(caminho)
+
+
+def renderizaGrafo(arestas, numV, caminho, dirigido=False, maxVertices=MAX_VERTICES_DESENHO, modo='amostra',
+                   seed=0, dir_cache=DIR_CACHE_LAYOUTS, titulo=None, limiarKK=LIMIAR_KAMADA_KAWAI):
+    """
+    Desenha o grafo em PNG a partir do array de arestas (ver o módulo).
+
+    Args:
+        arestas: Array (E, 2) ou lista de tuplas (u, v)
+        numV (int): Número de vértices
+        caminho (str): Arquivo PNG de saída
+        dirigido (bool): Se o grafo é dirigido (o desenho reduzido não tem setas)
+        maxVertices (int): Acima disso, desenha a redução do grafo
+        modo (str): 'amostra' (amostraEstratificada) ou 'reduzido' (reduzGrafo)
+        seed (int): Semente da amostra e do layout
+        dir_cache (str): Diretório do cache de layouts (None: sem cache)
+        titulo (str): Título (padrão: tamanho do grafo e da redução)
+        limiarKK (int): Maior desenho com layout Kamada-Kawai
+
+    Returns:
+        dict: vertices e arestas desenhados, modo, chave do layout e se
+        veio do cache
+    """
+    if modo not in MODOS_REDUCAO:
+        raise ValueError(f"Modo inválido: {modo} (use um de {MODOS_REDUCAO})")
+    arestas = _comoArray(arestas)
+    tamanhos = larguras = None
+    if numV <= maxVertices:
+        modo, desenho, numDesenho = 'completo', arestas, numV
+    elif modo == 'amostra':
+        vertices, desenho = amostraEstratificada(arestas, numV, maxVertices, seed)
+        numDesenho = vertices.size
+    else:
+        # Arestas entre grupos guardadas como (min, max): o desenho reduzido não tem direção
+        _, desenho, larguras, tamanhos = reduzGrafo(arestas, numV, maxVertices)
+        numDesenho = tamanhos.size
+        dirigido = False
+        if numDesenho > maxVertices:
+            # Sobram grupos isolados: amostra do grafo reduzido
+            vertices, desenho = amostraEstratificada(desenho, numDesenho, maxVertices, seed)
+            tamanhos, numDesenho = tamanhos[vertices], vertices.size
+            larguras = None
+
+    posicoes, chave, em_cache = layoutEmCache(desenho, numDesenho, seed=seed, dir_cache=dir_cache,
+                                              limiarKK=limiarKK)
+    if titulo is None:
+        titulo = f"{numV} vértices, {len(arestas)} arestas"
+        if modo != 'completo':
+            titulo += f" ({modo}: {numDesenho} vértices)"
+    desenhaPNG(posicoes, desenho, caminho, dirigido, tamanhos, larguras, titulo)
+    return {'vertices': numDesenho, 'arestas': len(desenho), 'modo': modo, 'chave': chave, 'em_cache': em_cache}
+
+
+def leArestas(caminho):
+    """Lê um arquivo de arestas nos formatos de lote.gravaArestas (npy, npz ou txt)."""
+    if caminho.endswith('.npy'):
+        return np.load(caminho)
+    if caminho.endswith('.npz'):
+        with np.load(caminho) as arquivo:
+            return arquivo['arestas']
+    return np.loadtxt(caminho, dtype=np.int64, ndmin=2)
+
+
+def _renderizaArquivo(tarefa):
+    """Lê e desenha um arquivo de arestas (executado nos processos do pool)."""
+    arquivo, numV, dirigido, saida, maxVertices, modo, seed, dir_cache, limiarKK = tarefa
+    arestas = leArestas(arquivo)
+    if numV is None:
+        numV = int(arestas.max()) + 1 if arestas.size else 0
+    png = os.path.join(saida, os.path.splitext(os.path.basename(arquivo))[0] + '.png')
+    info = renderizaGrafo(arestas, numV, png, dirigido, maxVertices, modo, seed, dir_cache,
+                          titulo=os.path.basename(arquivo), limiarKK=limiarKK)
+    return png, info
+
+
+def tarefasManifesto(caminho):
+    """Arquivos, numV e direção dos grafos de um manifesto de lote.py (ignora os que falharam)."""
+    diretorio = os.path.dirname(caminho)
+    with open(caminho, newline='') as arquivo:
+        return [(os.path.join(diretorio, linha['arquivo']), int(linha['numV']), tipoDirigido(int(linha['tipo'])))
+                for linha in csv.DictReader(arquivo) if linha['arquivo']]
+
+
+def renderizaLote(grafos, saida, maxVertices=MAX_VERTICES_DESENHO, modo='amostra', seed=0,
+                  dir_cache=DIR_CACHE_LAYOUTS, workers=None, limiarKK=LIMIAR_KAMADA_KAWAI):
+    """
+    Desenha um lote de arquivos de arestas em PNG, em um pool de processos.
+
+    Args:
+        grafos (list): Tuplas (arquivo, numV ou None, dirigido)
+        saida (str): Diretório dos PNGs (criado se não existe)
+        workers (int): Processos do pool (None: os.cpu_count(); 1: sequencial)
+        Demais: ver renderizaGrafo
+
+    Returns:
+        list: (png, info) por grafo, na ordem de grafos
+    """
+    os.makedirs(saida, exist_ok=True)
+    tarefas = [(arquivo, numV, dirigido, saida, maxVertices, modo, seed, dir_cache, limiarKK)
+               for arquivo, numV, dirigido in grafos]
+    if workers == 1:
+        return [_renderizaArquivo(t) for t in tarefas]
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as executor:
+        return list(executor.map(_renderizaArquivo, tarefas))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Renderização em lote de grafos (PNG, sem janela)')
+    parser.add_argument('arquivos', nargs='*', help='Arquivos de arestas (npy, npz ou txt)')
+    parser.add_argument('--manifesto', help='manifesto.csv de lote.py (dá numV e tipo de cada arquivo)')
+    parser.add_argument('--dirigido', action='store_true', help='Arquivos avulsos são dirigidos')
+    parser.add_argument('--saida', default=DIR_PLOTS, help=f'Diretório dos PNGs (padrão: {DIR_PLOTS})')
+    parser.add_argument('--max_vertices', type=int, default=MAX_VERTICES_DESENHO,
+                        help=f'Acima disso, desenha a redução (padrão: {MAX_VERTICES_DESENHO})')
+    parser.add_argument('--limiar_kk', type=int, default=LIMIAR_KAMADA_KAWAI,
+                        help=f'Até este tamanho, layout Kamada-Kawai (padrão: {LIMIAR_KAMADA_KAWAI})')
+    parser.add_argument('--modo', choices=MODOS_REDUCAO, default='amostra', help='Redução de grafos grandes')
+    parser.add_argument('--seed', type=int, default=0, help='Semente da amostra e do layout')
+    parser.add_argument('--cache', default=DIR_CACHE_LAYOUTS, help=f'Cache de layouts (padrão: {DIR_CACHE_LAYOUTS})')
+    parser.add_argument('--sem_cache', action='store_true', help='Não lê nem grava o cache de layouts')
+    parser.add_argument('--workers', type=int, default=None, help='Processos do pool (padrão: todos os núcleos)')
+    args = parser.parse_args(argv)
+
+    grafos = tarefasManifesto(args.manifesto) if args.manifesto else []
+    grafos += [(arquivo, None, args.dirigido) for arquivo in args.arquivos]
+    if not grafos:
+        parser.error('informe arquivos de arestas ou --manifesto')
+
+    resultados = renderizaLote(grafos, args.saida, args.max_vertices, args.modo, args.seed,
+                               None if args.sem_cache else args.cache, args.workers, args.limiar_kk)
+    em_cache = sum(info['em_cache'] for _, info in resultados)
+    print(f"{len(resultados)} PNGs em {args.saida} ({em_cache} layouts do cache)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
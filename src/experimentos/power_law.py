@@ -72,6 +72,8 @@ GAMMA_MIN = pwl_constants.GAMMA_MIN
 GAMMA_MAX = pwl_constants.GAMMA_MAX
 GRAU_MIN_PADRAO = pwl_constants.GRAU_MIN_PADRAO
 
+from sementes import rng_replica, semente_contexto
+
 def gera_gamma_aleatorio(categoria):
     """
     Gera um valor gamma aleatório dentro da categoria especificada.
@@ -138,8 +140,31 @@ def calcula_qualidade_powerlaw(graus):
         print(f"ERRO no cálculo power-law: {e}")
         return 0.0, 0.0, 0.0, 0.0
 
-def calcula_metricas_completas_por_grafo(G, tipo_grafo, graus=None, seed_metrics: int | None = None):
-    """Calcula todas as métricas possíveis do grafo diretamente do objeto Graph."""
+def arestas_e_graus(G, registro=None, verificar=False):
+    """
+    Número de arestas e graus de G, do registro de geração quando disponível.
+    
+    Com verificar=True (ou sem registro), varre G; havendo registro, avisa
+    se ele divergir e usa os valores medidos.
+    """
+    if registro is not None and not verificar:
+        return registro['num_arestas'], registro['graus']
+    num_arestas = G.number_of_edges()
+    graus_grafo = [d for n, d in G.degree()]
+    if registro is not None and (num_arestas, graus_grafo) != (registro['num_arestas'], list(registro['graus'])):
+        print("  [AVISO] Registro de geração diverge do grafo (arestas/graus)")
+    return num_arestas, graus_grafo
+
+
+def calcula_metricas_completas_por_grafo(G, tipo_grafo, graus=None, seed_metrics: int | None = None,
+                                         registro=None, verificar=False):
+    """
+    Calcula todas as métricas possíveis do grafo diretamente do objeto Graph.
+    
+    Com registro (geraGrafoPwl(registro=True)), o número de arestas e os
+    graus vêm da construção, sem varrer G; verificar=True varre mesmo assim
+    e avisa se o registro divergir.
+    """
     metricas = {}
     n = int(G.number_of_nodes())
     # Perfis por tamanho
@@ -148,8 +173,9 @@ def calcula_metricas_completas_por_grafo(G, tipo_grafo, graus=None, seed_metrics
     perfil_large = n > 100000
     
     # ===== MÉTRICAS BÁSICAS =====
+    num_arestas, graus_grafo = arestas_e_graus(G, registro, verificar)
     metricas['num_vertices'] = G.number_of_nodes()
-    metricas['num_arestas'] = G.number_of_edges()
+    metricas['num_arestas'] = num_arestas
     metricas['tipo_detectado'] = tipo_grafo
     
     # Densidade
@@ -157,13 +183,12 @@ def calcula_metricas_completas_por_grafo(G, tipo_grafo, graus=None, seed_metrics
         max_arestas = G.number_of_nodes() * (G.number_of_nodes() - 1)
         if not G.is_directed():
             max_arestas //= 2
-        metricas['densidade'] = G.number_of_edges() / max_arestas
+        metricas['densidade'] = num_arestas / max_arestas
     else:
         metricas['densidade'] = 0.0
     
     # ===== MÉTRICAS DE GRAU =====
     if G.number_of_nodes() > 0:
-        graus_grafo = [d for n, d in G.degree()]
         metricas['grau_medio'] = np.mean(graus_grafo)
         metricas['grau_max'] = max(graus_grafo)
         metricas['grau_min'] = min(graus_grafo)
@@ -309,8 +334,15 @@ def calcula_metricas_completas_por_grafo(G, tipo_grafo, graus=None, seed_metrics
     
     return metricas
 
-def executa_teste_powerlaw_completo(tipo, numV, gamma, seed, output_format='consolidated_csv', output_dir='./resultados', naming_pattern='metricas_{seed}_tipo{tipo}_v{vertices}_gamma{gamma}_{numero}.csv', num_grafos=50, timeout_por_grafo_s: int = 0):
-    """Executa teste do gerador power-law com todas as métricas."""
+def executa_teste_powerlaw_completo(tipo, numV, gamma, seed, output_format='consolidated_csv', output_dir='./resultados', naming_pattern='metricas_{seed}_tipo{tipo}_v{vertices}_gamma{gamma}_{numero}.csv', num_grafos=50, timeout_por_grafo_s: int = 0, replicas=None, verificar_invariantes=False):
+    """
+    Executa teste do gerador power-law com todas as métricas.
+    
+    Cada réplica i usa o fluxo rng_replica('powerlaw', tipo, numV, gamma, seed, i);
+    replicas (lista de índices) restringe a execução às réplicas desejadas.
+    As métricas usam o registro de geração (graus e arestas conhecidos na
+    construção); verificar_invariantes=True os recalcula a partir do grafo.
+    """
     try:
         
         # Gera grafos com os mesmos parâmetros (configurável por --num_grafos)
@@ -318,21 +350,17 @@ def executa_teste_powerlaw_completo(tipo, numV, gamma, seed, output_format='cons
         
         todas_metricas = []
         
-        for i in range(num_grafos):
-            # Gera um grafo
-            # Compatibiliza seeds potencialmente > 2**32-1 (alguns RNGs exigem 32 bits)
-            seed_effective = int(seed) + int(i)
-            try:
-                seed_compat = int(seed_effective % (2**32 - 1))
-            except Exception:
-                seed_compat = int(abs(hash((seed_effective, tipo, numV))) & 0xFFFFFFFF)
+        indices_replicas = list(range(num_grafos)) if replicas is None else list(replicas)
+        for i in indices_replicas:
+            # Gera um grafo com o fluxo Philox da réplica i
+            rng = rng_replica('powerlaw', tipo, numV, gamma, seed, i)
             t0 = time.perf_counter()
             # Timeout por grafo somente na geração (se suportado)
             try:
                 if timeout_por_grafo_s and hasattr(signal, 'SIGALRM'):
                     signal.signal(signal.SIGALRM, lambda s, f: (_ for _ in ()).throw(TimeoutError("Timeout por grafo atingido")))
                     signal.alarm(int(timeout_por_grafo_s))
-                resultado = geraGrafoPwl(numV, gamma, dirigido, tipo, seed_compat)
+                resultado = geraGrafoPwl(numV, gamma, dirigido, tipo, rng=rng, registro=True)
             except TimeoutError:
                 if timeout_por_grafo_s and hasattr(signal, 'SIGALRM'):
                     signal.alarm(0)
@@ -344,7 +372,7 @@ def executa_teste_powerlaw_completo(tipo, numV, gamma, seed, output_format='cons
             if resultado is None:
                 continue
             
-            arestas, G, graus = resultado
+            arestas, G, graus, registro = resultado
             tempo_geracao_s = time.perf_counter() - t0
             tipo_detectado = tipo
             
@@ -353,24 +381,25 @@ def executa_teste_powerlaw_completo(tipo, numV, gamma, seed, output_format='cons
                 if timeout_por_grafo_s and hasattr(signal, 'SIGALRM'):
                     signal.signal(signal.SIGALRM, lambda s, f: (_ for _ in ()).throw(TimeoutError("Timeout por grafo atingido")))
                     signal.alarm(int(timeout_por_grafo_s))
-                metricas = calcula_metricas_completas_por_grafo(G, tipo_detectado, graus, seed_metrics=(seed + i))
+                metricas = calcula_metricas_completas_por_grafo(G, tipo_detectado, graus, seed_metrics=(seed + i),
+                                                                registro=registro, verificar=verificar_invariantes)
             except TimeoutError:
                 if timeout_por_grafo_s and hasattr(signal, 'SIGALRM'):
                     signal.alarm(0)
                 # Salva métricas básicas mesmo com timeout
                 try:
                     metricas = {}
+                    num_arestas, graus_grafo = arestas_e_graus(G, registro)
                     metricas['num_vertices'] = G.number_of_nodes()
-                    metricas['num_arestas'] = G.number_of_edges()
+                    metricas['num_arestas'] = num_arestas
                     metricas['tipo_detectado'] = tipo_detectado
                     if G.number_of_nodes() > 1:
                         max_arestas = G.number_of_nodes() * (G.number_of_nodes() - 1)
                         if not G.is_directed():
                             max_arestas //= 2
-                        metricas['densidade'] = G.number_of_edges() / max_arestas
+                        metricas['densidade'] = num_arestas / max_arestas
                     else:
                         metricas['densidade'] = 0.0
-                    graus_grafo = [d for n, d in G.degree()]
                     if graus_grafo:
                         metricas['grau_medio'] = float(np.mean(graus_grafo))
                         metricas['grau_max'] = int(max(graus_grafo))
@@ -448,7 +477,7 @@ def executa_teste_powerlaw_completo(tipo, numV, gamma, seed, output_format='cons
         
         # Adiciona métricas básicas
         metricas_medias.update({
-            'taxa_sucesso': len(todas_metricas) / num_grafos,
+            'taxa_sucesso': len(todas_metricas) / len(indices_replicas),
             'limite_atingido': False
         })
         
@@ -510,6 +539,11 @@ def main():
                        help='Executa um smoke test mínimo (parâmetros reduzidos, poucos grafos)')
     parser.add_argument('--tipos', nargs='+', type=int, default=[0, 1, 20, 21, 30, 31],
                        help='Lista de tipos de grafos para teste (padrão: todos os tipos)')
+    parser.add_argument('--replicas', nargs='+', type=int, default=None,
+                       help='Índices das réplicas a executar (padrão: todas); útil para reexecutar falhas')
+    parser.add_argument('--verificar_invariantes', action='store_true',
+                       help='Recalcula arestas e graus a partir do grafo em vez do registro de geração '
+                            'e avisa se divergirem')
     
     args = parser.parse_args()
     
@@ -561,8 +595,9 @@ def main():
                 for seed in SEEDS:
                     teste_atual += 1
                     
-                    # Gera gamma determinístico por combinação (seed, tipo, numV, categoria)
-                    seed_ctx = (hash((int(seed), int(tipo), int(numV), str(categoria_gamma))) & 0xFFFFFFFF)
+                    # Gera gamma determinístico por combinação (seed, tipo, numV, categoria),
+                    # estável entre processos (hash de str varia com PYTHONHASHSEED)
+                    seed_ctx = semente_contexto(int(seed), int(tipo), int(numV), str(categoria_gamma))
                     gamma = gera_gamma_deterministico(categoria_gamma, seed_ctx)
                     
                     print(f"[{teste_atual:6d}/{total_combinacoes}] Tipo {tipo} - V={numV} - {categoria_gamma} (gamma={gamma:.3f}) - Seed={seed}")
@@ -571,7 +606,8 @@ def main():
                     num_grafos_combo = 2
                     
                     resultado = executa_teste_powerlaw_completo(
-                        tipo, numV, gamma, seed, args.output_format, args.output_dir, args.naming_pattern, num_grafos=num_grafos_combo, timeout_por_grafo_s=args.timeout_por_grafo_s
+                        tipo, numV, gamma, seed, args.output_format, args.output_dir, args.naming_pattern, num_grafos=num_grafos_combo, timeout_por_grafo_s=args.timeout_por_grafo_s,
+                        replicas=args.replicas, verificar_invariantes=args.verificar_invariantes
                     )
                     
                     if resultado:
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SEMENTES POR RÉPLICA (ACESSO ALEATÓRIO)
+Esquema de sementes baseado em gerador contador (Philox) para os experimentos.
+
+Cada réplica recebe um fluxo aleatório próprio, derivado de uma chave completa
+(gerador, tipo, numV, numA/gamma, seed, réplica) via np.random.SeedSequence.
+Não há deslocamentos do tipo seed + i, que produzem fluxos correlacionados
+entre combinações vizinhas. Qualquer réplica pode ser regenerada em O(1), em
+qualquer nó, apenas a partir dos parâmetros registrados no CSV.
+
+Exemplo:
+    >>> rng = rng_replica('simples', 0, 1000, 45000, 2700001, 17)
+    >>> geraDataset(0, 1000, 45000, 2700001, 1, 0, 0, rng=rng)  # réplica 17
+"""
+
+import struct
+import numpy as np
+
+# Identificadores estáveis dos geradores (fazem parte da chave)
+GERADORES = {
+    'simples': 0,
+    'powerlaw': 1,
+    # Família aninhada de densidades (parametro fixo em 0: não depende de numA)
+    'simples_varredura': 2,
+}
+
+
+def _codifica_parametro(valor):
+    """Codifica numA (int) ou gamma (float) como inteiro não negativo exato."""
+    if isinstance(valor, (float, np.floating)):
+        # Bits IEEE-754 do float: o mesmo gamma gravado no CSV gera a mesma chave
+        return struct.unpack('<Q', struct.pack('<d', float(valor)))[0]
+    return int(valor)
+
+
+def chave_replica(gerador, tipo, numV, parametro, seed, replica):
+    """
+    Monta a SeedSequence que identifica uma réplica de uma combinação.
+    
+    Args:
+        gerador (str): 'simples', 'simples_varredura' ou 'powerlaw'
+        tipo (int): Tipo do grafo
+        numV (int): Número de vértices
+        parametro (int | float): numA (simples) ou gamma (power-law)
+        seed (int): Seed da combinação (não negativa)
+        replica (int): Índice da réplica (0, 1, ...)
+    
+    Returns:
+        np.random.SeedSequence: Sequência com entropia seed e spawn_key
+        (gerador, tipo, numV, parametro, replica)
+    """
+    if gerador not in GERADORES:
+        raise ValueError(f"Gerador inválido: {gerador}")
+    return np.random.SeedSequence(
+        int(seed),
+        spawn_key=(GERADORES[gerador], int(tipo), int(numV), _codifica_parametro(parametro), int(replica)),
+    )
+
+
+def rng_replica(gerador, tipo, numV, parametro, seed, replica):
+    """
+    Retorna o np.random.Generator (Philox) de uma réplica específica.
+    
+    O Philox é um gerador baseado em contador: a chave derivada de
+    chave_replica define o fluxo inteiro, e réplicas distintas têm fluxos
+    independentes, sem sobreposição, mesmo com seeds adjacentes.
+    """
+    return np.random.Generator(np.random.Philox(chave_replica(gerador, tipo, numV, parametro, seed, replica)))
+
+
+def semente_contexto(*componentes):
+    """
+    Deriva uma semente de 32 bits estável a partir de inteiros e textos.
+    
+    Substitui hash((...)), cujo valor para textos muda a cada processo
+    (PYTHONHASHSEED) e impede reproduzir a combinação em outro nó.
+    """
+    chave = []
+    for c in componentes:
+        if isinstance(c, str):
+            chave.append(int.from_bytes(c.encode('utf-8'), 'little'))
+        else:
+            chave.append(_codifica_parametro(c))
+    return int(np.random.SeedSequence(chave).generate_state(1)[0])
@@ -68,14 +68,29 @@ simples_dir = os.path.join(os.path.dirname(__file__), '..', 'simples')
 if simples_dir not in sys.path:
     sys.path.insert(0, simples_dir)
 
-from gerador import geraDataset  # type: ignore[reportMissingImports]
-from utils import criaMatrizAdjacencias, tipoGrafo  # type: ignore[reportMissingImports]
+from gerador import geraDataset, geraVarreduraDensidade, geraReplicas, replicasEmConjunto, registroGeracao, comoRandom  # type: ignore[reportMissingImports]
+from arestas import arrayParaTuplas, caracteristicasArestas  # type: ignore[reportMissingImports]
+from disco import geraGrafoEmDisco  # type: ignore[reportMissingImports]
+from estatisticas import estatisticasGrafo  # type: ignore[reportMissingImports]
+from utils import criaMatrizAdjacencias, tipoGrafo, componentesConexas  # type: ignore[reportMissingImports]
 from constants import TIPOS_GRAFOS, TIPOS_VALIDOS, DENSIDADE_ESPARSA_MAX, DENSIDADE_DENSA_MIN  # type: ignore[reportMissingImports]
+from sementes import rng_replica
 
 
 
-def calcula_metricas_completas_por_arestas(arestas, num_vertices_total, tipo_grafo, seed_metrics: int | None = None):
-    """Calcula todas as métricas possíveis do grafo a partir da lista de arestas (sem matriz)."""
+def calcula_metricas_completas_por_arestas(arestas, num_vertices_total, tipo_grafo, seed_metrics: int | None = None,
+                                           estatisticas=None, registro=None, verificar=False):
+    """
+    Calcula todas as métricas possíveis do grafo a partir da lista de arestas (sem matriz).
+    
+    Com estatisticas (EstatisticasArestas acumuladas na geração, ver
+    geraDataset(estatisticas=True)), as métricas básicas e de grau vêm dos
+    acumuladores, sem passada sobre o grafo NetworkX.
+    
+    Com registro (ver gerador.registroGeracao), o número de componentes
+    (fracas) garantido por construção dispensa a busca de componentes;
+    verificar=True calcula mesmo assim e avisa se o registro divergir.
+    """
     import networkx as nx
     
     # Cria grafo a partir de arestas
@@ -96,46 +111,61 @@ def calcula_metricas_completas_por_arestas(arestas, num_vertices_total, tipo_gra
     perfil_mid = MID_THRESHOLD < n <= LARGE_THRESHOLD
     perfil_large = n > LARGE_THRESHOLD
     
-    # ===== MÉTRICAS BÁSICAS =====
-    metricas['num_vertices'] = G.number_of_nodes()
-    metricas['num_arestas'] = G.number_of_edges()
-    metricas['tipo_detectado'] = tipo_grafo
-    
-    # Densidade
-    if G.number_of_nodes() > 1:
-        max_arestas = G.number_of_nodes() * (G.number_of_nodes() - 1)
-        if not G.is_directed():
-            max_arestas //= 2
-        metricas['densidade'] = G.number_of_edges() / max_arestas
-    else:
-        metricas['densidade'] = 0.0
-    
-    # ===== MÉTRICAS DE GRAU =====
-    if G.number_of_nodes() > 0:
-        graus = [d for n, d in G.degree()]
-        metricas['grau_medio'] = np.mean(graus)
-        metricas['grau_max'] = max(graus)
-        metricas['grau_min'] = min(graus)
-        metricas['grau_desvio'] = np.std(graus)
-        metricas['grau_mediana'] = np.median(graus)
+    if estatisticas is not None:
+        # ===== MÉTRICAS BÁSICAS E DE GRAU (acumuladas na geração) =====
+        basicas = estatisticas.metricas()
+        metricas['num_vertices'] = basicas.pop('num_vertices')
+        metricas['num_arestas'] = basicas.pop('num_arestas')
+        metricas['tipo_detectado'] = tipo_grafo
+        metricas.update(basicas)
     else:
-        metricas['grau_medio'] = metricas['grau_max'] = metricas['grau_min'] = 0
-        metricas['grau_desvio'] = metricas['grau_mediana'] = 0
+        # ===== MÉTRICAS BÁSICAS =====
+        metricas['num_vertices'] = G.number_of_nodes()
+        metricas['num_arestas'] = G.number_of_edges()
+        metricas['tipo_detectado'] = tipo_grafo
+    
+        # Densidade
+        if G.number_of_nodes() > 1:
+            max_arestas = G.number_of_nodes() * (G.number_of_nodes() - 1)
+            if not G.is_directed():
+                max_arestas //= 2
+            metricas['densidade'] = G.number_of_edges() / max_arestas
+        else:
+            metricas['densidade'] = 0.0
+    
+        # ===== MÉTRICAS DE GRAU =====
+        if G.number_of_nodes() > 0:
+            graus = [d for n, d in G.degree()]
+            metricas['grau_medio'] = np.mean(graus)
+            metricas['grau_max'] = max(graus)
+            metricas['grau_min'] = min(graus)
+            metricas['grau_desvio'] = np.std(graus)
+            metricas['grau_mediana'] = np.median(graus)
+        else:
+            metricas['grau_medio'] = metricas['grau_max'] = metricas['grau_min'] = 0
+            metricas['grau_desvio'] = metricas['grau_mediana'] = 0
     
     # ===== MÉTRICAS DE CONECTIVIDADE =====
+    componentes_garantidas = registro.get('num_componentes') if registro else None
     try:
-        if G.is_directed():
+        if componentes_garantidas is not None and not verificar:
+            # Componentes (fracas) conhecidas por construção
+            metricas['num_componentes'] = componentes_garantidas
+            metricas['conectividade'] = 1.0 if componentes_garantidas == 1 else 0.0
+        else:
             # Para grafos dirigidos, usar componentes FRACAS (mais apropriado para numC)
             # Componentes fracas são mais comuns na prática e fazem mais sentido
             # quando o usuário especifica numC (número de componentes conexas)
-            metricas['num_componentes'] = nx.number_weakly_connected_components(G)
-            metricas['conectividade'] = 1.0 if nx.is_weakly_connected(G) else 0.0
+            # Rotulação vetorizada sobre as arestas, sem percorrer o grafo networkx
+            metricas['num_componentes'] = int(componentesConexas(arestas, n)[0])
+            metricas['conectividade'] = 1.0 if metricas['num_componentes'] == 1 else 0.0
+        if componentes_garantidas is not None and metricas['num_componentes'] != componentes_garantidas:
+            print(f"  [AVISO] Registro de geração indica {componentes_garantidas} componentes; "
+                  f"o grafo tem {metricas['num_componentes']}")
+        if G.is_directed():
             # Manter componentes fortes como referência adicional
             metricas['num_componentes_fortes'] = nx.number_strongly_connected_components(G)
             metricas['conectividade_forte'] = 1.0 if nx.is_strongly_connected(G) else 0.0
-        else:
-            metricas['num_componentes'] = nx.number_connected_components(G)
-            metricas['conectividade'] = 1.0 if nx.is_connected(G) else 0.0
     except:
         metricas['num_componentes'] = 1
         metricas['conectividade'] = 0.0
@@ -276,8 +306,162 @@ def calcula_metricas_completas_por_arestas(arestas, num_vertices_total, tipo_gra
     
     return metricas
 
-def executa_teste_simples_completo(tipo, numV, numA, seed, estrategia_arestas, preferencia_densidade, numC, output_format='consolidated_csv', output_dir='./resultados', naming_pattern='metricas_{seed}_tipo{tipo}_v{vertices}_dens{densidade}_comp{componentes}_{numero}.csv', num_grafos=50, timeout_por_grafo_s: int = 0):
-    """Executa teste completo do gerador simples com 50 grafos."""
+def gera_varredura_replicas(tipo, numV, niveis, seed, indices_replicas):
+    """
+    Gera, para cada réplica, uma família aninhada de grafos com os números de
+    arestas de niveis (ver geraVarreduraDensidade).
+    
+    A família da réplica i usa o fluxo rng_replica('simples_varredura', tipo,
+    numV, 0, seed, i), que não depende de numA: todos os níveis da réplica
+    saem do mesmo sorteio, e o grafo de um nível contém o do nível anterior.
+    
+    Returns:
+        dict: numA -> {réplica: (arestas, tempo_s, 'varredura')}, no formato
+        esperado por executa_teste_simples_completo(grafos_pregerados=...)
+    """
+    familias = {int(numA): {} for numA in niveis}
+    for i in indices_replicas:
+        rng = rng_replica('simples_varredura', tipo, numV, 0, seed, i)
+        for numA, arestas, tempo_s in geraVarreduraDensidade(tipo, numV, niveis, rng=rng):
+            familias[numA][i] = (arestas, tempo_s, 'varredura')
+    return familias
+
+
+def calcula_metricas_em_disco(tipo, numV, numA, seed, replica, dir_disco):
+    """
+    Gera uma réplica em disco (geraGrafoEmDisco) e calcula as métricas básicas por blocos.
+    
+    Usado para tamanhos acima de LARGE_THRESHOLD, em que nem o grafo nem o
+    networkx cabem em memória. Só as métricas básicas e de grau são
+    calculadas (metricas_incompletas=True), acumuladas enquanto as arestas
+    são gravadas (geraGrafoEmDisco(estatisticas=True)), com as mesmas
+    convenções da análise em memória. O arquivo é removido ao final.
+    
+    Returns:
+        tuple: (metricas, tempo_geracao_s)
+    """
+    caminho = os.path.join(dir_disco, f'arestas_tipo{tipo}_v{numV}_a{numA}_s{seed}_r{replica}.npy')
+    os.makedirs(dir_disco, exist_ok=True)
+    try:
+        t0 = time.perf_counter()
+        rng = rng_replica('simples', tipo, numV, numA, seed, replica)
+        arestas, estatisticas = geraGrafoEmDisco(tipo, numV, numA, caminho, rng=rng, estatisticas=True)
+        tempo_geracao_s = time.perf_counter() - t0
+        del arestas
+    finally:
+        if os.path.exists(caminho):
+            os.remove(caminho)
+    
+    return metricas_basicas(estatisticas, tipo), tempo_geracao_s
+
+
+def confere_registro(arestas, numV, tipo, registro):
+    """
+    Checagem pós-geração, barata o bastante para todo grafo.
+    
+    Laços e arestas múltiplas medidos no array de arestas
+    (arestas.caracteristicasArestas, O(E log E), sem grafo networkx nem
+    matriz) são comparados ao registro de geração; avisa se divergirem.
+    
+    Returns:
+        bool: Se o grafo confere com o registro
+    """
+    _, multipla, laco = caracteristicasArestas(arestas, numV, tipo in [1, 21, 31])
+    confere = laco == registro['tem_lacos'] and registro['tem_multiplas'] in (None, multipla)
+    if not confere:
+        print(f"  [AVISO] Registro de geração indica laços={registro['tem_lacos']}, "
+              f"múltiplas={registro['tem_multiplas']}; o grafo tem laços={laco}, múltiplas={multipla}")
+    return confere
+
+
+def metricas_basicas(estatisticas, tipo):
+    """
+    Métricas básicas e de grau a partir das estatísticas acumuladas na geração.
+    
+    Usadas quando o grafo não é analisado por completo (em disco ou após
+    timeout nas métricas), marcadas com metricas_incompletas=True.
+    """
+    basicas = estatisticas.metricas()
+    metricas = {
+        'num_vertices': basicas.pop('num_vertices'),
+        'num_arestas': basicas.pop('num_arestas'),
+        'tipo_detectado': tipo,
+    }
+    metricas.update(basicas)
+    metricas['razao_vertices_arestas'] = (
+        metricas['num_vertices'] / metricas['num_arestas'] if metricas['num_arestas'] > 0 else 0.0
+    )
+    metricas['metricas_incompletas'] = True
+    return metricas
+
+
+def gera_replicas_conjunto(tipo, numV, numA, seed, numC, indices_replicas):
+    """
+    Gera todas as réplicas de uma combinação em uma única chamada (geraReplicas).
+    
+    Só é usada quando replicasEmConjunto(tipo, numV, numA, numC) é True
+    (até ARESTAS_MAX_REPLICAS_LOTE arestas, numC <= 1 e, nos tipos 0 e 1,
+    bitset conjunto de até 32 bytes por aresta); caso contrário geraReplicas
+    geraria réplica a réplica sob um único alarme e ainda manteria todas em
+    memória.
+    
+    Cada réplica consome o fluxo rng_replica('simples', tipo, numV, numA,
+    seed, i) como a geração individual (via comoRandom) e depende apenas
+    dele: reexecutar um subconjunto de réplicas produz os mesmos grafos, e a
+    réplica i é a mesma da geração individual (usada se a conjunta falhar).
+    Exceção nos tipos 0 e 1: quando a geração individual troca o bitset pelo
+    complemento no meio da amostragem ('bitset>complemento', taxa de
+    rejeição alta perto de LIMIAR_DENSIDADE_COMPLEMENTO), a réplica conjunta
+    tem a mesma distribuição, mas outro grafo.
+    
+    Returns:
+        tuple: (grafos, tempo_total_s), com grafos um dict réplica ->
+        (arestas, nan, metodo) no formato de
+        executa_teste_simples_completo(grafos_pregerados=...): arestas uma
+        visão (E, 2) do array empilhado e metodo o algoritmo da réplica. O
+        tempo de cada réplica não é medido isoladamente; tempo_total_s é o
+        da chamada inteira.
+    """
+    t0 = time.perf_counter()
+    rngs = [comoRandom(rng_replica('simples', tipo, numV, numA, seed, i)) for i in indices_replicas]
+    arestas, deslocamentos, metodos = geraReplicas(tipo, numV, numA, rngs, numC=numC, fator=0,
+                                                   informar_metodo=True)
+    tempo_total_s = time.perf_counter() - t0
+    grafos = {
+        i: (arestas[deslocamentos[j]:deslocamentos[j + 1]], float('nan'), metodos[j])
+        for j, i in enumerate(indices_replicas)
+    }
+    return grafos, tempo_total_s
+
+
+def executa_teste_simples_completo(tipo, numV, numA, seed, estrategia_arestas, preferencia_densidade, numC, output_format='consolidated_csv', output_dir='./resultados', naming_pattern='metricas_{seed}_tipo{tipo}_v{vertices}_dens{densidade}_comp{componentes}_{numero}.csv', num_grafos=50, timeout_por_grafo_s: int = 0, replicas=None, grafos_pregerados=None, dir_disco=None, verificar_invariantes=False):
+    """
+    Executa teste completo do gerador simples com 50 grafos.
+    
+    Cada réplica i usa o fluxo rng_replica('simples', tipo, numV, numA, seed, i),
+    de forma que replicas (lista de índices) permite reexecutar apenas as
+    réplicas desejadas, por exemplo as que falharam em outro nó.
+    
+    grafos_pregerados (dict réplica -> (arestas, tempo_s, metodo)) fornece
+    grafos já gerados, por exemplo por uma varredura de densidade
+    (gera_varredura_replicas); as réplicas ausentes do dicionário são
+    geradas normalmente. Sem grafos_pregerados, se replicasEmConjunto(tipo,
+    numV, numA, numC), todas as réplicas são geradas de uma vez por
+    gera_replicas_conjunto (geracao_conjunta=True, tempo_geracao_s nan e o
+    tempo da chamada em tempo_geracao_conjunta_s), com o mesmo alarme de um
+    grafo; caso contrário, ou se a geração conjunta falhar, cada réplica é
+    gerada e analisada por vez, com o alarme e o tempo por grafo. Com
+    ARESTAS_MAX_REPLICAS_LOTE = 2048, isso só ocorre nos tamanhos de --smoke
+    e --teste_rapido: na grade padrão (numV = 10000), numA >= 9999.
+    
+    Com dir_disco, grafos acima de LARGE_THRESHOLD vértices (e numC <= 1) são
+    gerados em disco nesse diretório, com métricas básicas calculadas por
+    blocos (calcula_metricas_em_disco).
+    
+    As métricas recebem o registro de geração de cada grafo
+    (gerador.registroGeracao) e não recalculam o que ele garante;
+    verificar_invariantes=True recalcula e avisa em caso de divergência.
+    """
     try:
         
         # Analisa grafos (com suporte a timeout por grafo)
@@ -287,91 +471,110 @@ def executa_teste_simples_completo(tipo, numV, numA, seed, estrategia_arestas, p
         def _timeout_handler(signum, frame):
             raise TimeoutError("Timeout por grafo atingido")
 
-        for i in range(num_grafos):
-            # Geração por réplica (permite timeout por grafo); usa seed variada
-            item = None
-            tempo_geracao_s = None
+        indices_replicas = list(range(num_grafos)) if replicas is None else list(replicas)
+        em_disco = dir_disco is not None and numV > LARGE_THRESHOLD and numC <= 1
+        conjunta, tempo_conjunta_s = False, float('nan')
+        if grafos_pregerados is None and not em_disco and replicasEmConjunto(tipo, numV, numA, numC):
             try:
+                # Réplicas pequenas: o lote inteiro tem o alarme de um grafo
                 if timeout_por_grafo_s and hasattr(signal, 'SIGALRM'):
                     signal.signal(signal.SIGALRM, _timeout_handler)
                     signal.alarm(int(timeout_por_grafo_s))
-                # gera 1 grafo por vez, com seed offset
-                item_list = geraDataset(tipo, numV, numA, seed + i, n=1, numC=numC, fator=0, medir_tempo=True)
-                if item_list:
-                    item = item_list[0]
-                if isinstance(item, tuple):
-                    arestas, tempo_geracao_s = item
-                else:
-                    arestas = item
-                # Cancela alarme após geração
-                if timeout_por_grafo_s and hasattr(signal, 'SIGALRM'):
-                    signal.alarm(0)
-            except TimeoutError:
-                # Cancela alarme e segue para próxima réplica
+                grafos_pregerados, tempo_conjunta_s = gera_replicas_conjunto(tipo, numV, numA, seed, numC,
+                                                                             indices_replicas)
+                conjunta = True
+            except Exception as e:
+                print(f"  [AVISO] Geração conjunta das réplicas falhou ({e}); gerando uma a uma")
+            finally:
                 if timeout_por_grafo_s and hasattr(signal, 'SIGALRM'):
                     signal.alarm(0)
-                continue
+        
+        for i in indices_replicas:
+            # Geração por réplica (permite timeout por grafo); fluxo próprio da réplica
+            item = None
+            tempo_geracao_s = None
+            metodo_geracao = None
+            if em_disco:
+                try:
+                    if timeout_por_grafo_s and hasattr(signal, 'SIGALRM'):
+                        signal.signal(signal.SIGALRM, _timeout_handler)
+                        signal.alarm(int(timeout_por_grafo_s))
+                    metricas_grafo, tempo_geracao_s = calcula_metricas_em_disco(tipo, numV, numA, seed, i, dir_disco)
+                    metodo_geracao = 'disco'
+                except TimeoutError:
+                    continue
+                finally:
+                    if timeout_por_grafo_s and hasattr(signal, 'SIGALRM'):
+                        signal.alarm(0)
+            else:
+                if grafos_pregerados is not None and i in grafos_pregerados:
+                    item = grafos_pregerados[i]
+                else:
+                    try:
+                        if timeout_por_grafo_s and hasattr(signal, 'SIGALRM'):
+                            signal.signal(signal.SIGALRM, _timeout_handler)
+                            signal.alarm(int(timeout_por_grafo_s))
+                        # gera 1 grafo por vez, com o fluxo Philox da réplica i
+                        rng = rng_replica('simples', tipo, numV, numA, seed, i)
+                        item_list = geraDataset(tipo, numV, numA, seed, n=1, numC=numC, fator=0, medir_tempo=True, rng=rng,
+                                                informar_metodo=True, estatisticas=True, registro=True)
+                        if item_list:
+                            item = item_list[0]
+                        # Cancela alarme após geração
+                        if timeout_por_grafo_s and hasattr(signal, 'SIGALRM'):
+                            signal.alarm(0)
+                    except TimeoutError:
+                        # Cancela alarme e segue para próxima réplica
+                        if timeout_por_grafo_s and hasattr(signal, 'SIGALRM'):
+                            signal.alarm(0)
+                        continue
 
-            if item is None:
-                continue
+                if item is None:
+                    continue
 
-            if isinstance(item, tuple):
-                arestas, tempo_geracao_s = item
-            else:
-                arestas = item
-                tempo_geracao_s = None
-            tipo_detectado = tipo  # evitamos reconstrução por matriz
-            # Aplica timeout também no bloco de métricas, se configurado
-            # Constrói G_nx para equivalência estrutural antes das métricas
-            import networkx as nx
-            G_nx = nx.DiGraph() if tipo in [1, 21, 31] else nx.Graph()
-            G_nx.add_nodes_from(range(numV))
-            G_nx.add_edges_from(arestas)
-            grafos_networkx.append(G_nx)
+                # item = (arestas, tempo_s, metodo[, estatisticas, registro]): o algoritmo
+                # escolhido pelo gerador permite correlacionar tempo_geracao_s com a estratégia
+                estatisticas = registro = None
+                if isinstance(item, tuple):
+                    arestas, tempo_geracao_s, metodo_geracao, *extras = item
+                    if extras:
+                        estatisticas, registro = extras
+                else:
+                    arestas = item
+                    tempo_geracao_s = None
+                if estatisticas is None:
+                    # Grafos pré-gerados: acumula sobre o array, antes da conversão para tuplas
+                    estatisticas = estatisticasGrafo(arestas, numV, tipo in [1, 21, 31])
+                if registro is None:
+                    # Grafos pré-gerados seguem as mesmas garantias de construção de geraDataset
+                    registro = registroGeracao(tipo, numV, numA, numC, 0, metodo_geracao)
+                confere_registro(arestas, numV, tipo, registro)
+                if isinstance(arestas, np.ndarray):
+                    arestas = arrayParaTuplas(arestas)
+                tipo_detectado = tipo  # evitamos reconstrução por matriz
+                # Aplica timeout também no bloco de métricas, se configurado
+                # Constrói G_nx para equivalência estrutural antes das métricas
+                import networkx as nx
+                G_nx = nx.DiGraph() if tipo in [1, 21, 31] else nx.Graph()
+                G_nx.add_nodes_from(range(numV))
+                G_nx.add_edges_from(arestas)
+                grafos_networkx.append(G_nx)
 
-            try:
-                if timeout_por_grafo_s and hasattr(signal, 'SIGALRM'):
-                    signal.signal(signal.SIGALRM, _timeout_handler)
-                    signal.alarm(int(timeout_por_grafo_s))
-                metricas_grafo = calcula_metricas_completas_por_arestas(arestas, numV, tipo_detectado, seed_metrics=(seed + i))
-            except TimeoutError:
-                if timeout_por_grafo_s and hasattr(signal, 'SIGALRM'):
-                    signal.alarm(0)
-                # Calcula e registra métricas básicas mesmo com timeout
                 try:
-                    metricas_grafo = {}
-                    metricas_grafo['num_vertices'] = G_nx.number_of_nodes()
-                    metricas_grafo['num_arestas'] = G_nx.number_of_edges()
-                    metricas_grafo['tipo_detectado'] = tipo_detectado
-                    # Densidade
-                    if G_nx.number_of_nodes() > 1:
-                        max_arestas = G_nx.number_of_nodes() * (G_nx.number_of_nodes() - 1)
-                        if not G_nx.is_directed():
-                            max_arestas //= 2
-                        metricas_grafo['densidade'] = G_nx.number_of_edges() / max_arestas
-                    else:
-                        metricas_grafo['densidade'] = 0.0
-                    # Grau básicos
-                    graus = [d for n, d in G_nx.degree()]
-                    if graus:
-                        metricas_grafo['grau_medio'] = float(np.mean(graus))
-                        metricas_grafo['grau_max'] = int(max(graus))
-                        metricas_grafo['grau_min'] = int(min(graus))
-                        metricas_grafo['grau_desvio'] = float(np.std(graus))
-                        metricas_grafo['grau_mediana'] = float(np.median(graus))
-                    else:
-                        metricas_grafo['grau_medio'] = metricas_grafo['grau_max'] = metricas_grafo['grau_min'] = 0
-                        metricas_grafo['grau_desvio'] = metricas_grafo['grau_mediana'] = 0
-                    metricas_grafo['razao_vertices_arestas'] = (
-                        metricas_grafo['num_vertices'] / metricas_grafo['num_arestas']
-                        if metricas_grafo['num_arestas'] > 0 else 0.0
-                    )
-                    metricas_grafo['metricas_incompletas'] = True
-                except Exception:
-                    continue
-            finally:
-                if timeout_por_grafo_s and hasattr(signal, 'SIGALRM'):
-                    signal.alarm(0)
+                    if timeout_por_grafo_s and hasattr(signal, 'SIGALRM'):
+                        signal.signal(signal.SIGALRM, _timeout_handler)
+                        signal.alarm(int(timeout_por_grafo_s))
+                    metricas_grafo = calcula_metricas_completas_por_arestas(arestas, numV, tipo_detectado, seed_metrics=(seed + i),
+                                                                           estatisticas=estatisticas, registro=registro,
+                                                                           verificar=verificar_invariantes)
+                except TimeoutError:
+                    if timeout_por_grafo_s and hasattr(signal, 'SIGALRM'):
+                        signal.alarm(0)
+                    # Registra as métricas básicas acumuladas na geração mesmo com timeout
+                    metricas_grafo = metricas_basicas(estatisticas, tipo_detectado)
+                finally:
+                    if timeout_por_grafo_s and hasattr(signal, 'SIGALRM'):
+                        signal.alarm(0)
             
             # Adiciona parâmetros do teste às métricas
             metricas_grafo.update({
@@ -384,7 +587,10 @@ def executa_teste_simples_completo(tipo, numV, numA, seed, estrategia_arestas, p
                 'preferencia_densidade': preferencia_densidade,
                 'numC': numC,
                 'numero': i + 1,
-                'tempo_geracao_s': tempo_geracao_s if tempo_geracao_s is not None else 0.0
+                'tempo_geracao_s': tempo_geracao_s if tempo_geracao_s is not None else 0.0,
+                'metodo_geracao': metodo_geracao,
+                'geracao_conjunta': conjunta,
+                'tempo_geracao_conjunta_s': tempo_conjunta_s
             })
             
             # Se formato individual, salva arquivo CSV imediatamente
@@ -424,19 +630,29 @@ def executa_teste_simples_completo(tipo, numV, numA, seed, estrategia_arestas, p
                     valores_numericos.append(float(v))
             if valores_numericos:
                 metricas_medias[chave] = float(np.mean(valores_numericos))
+            elif any(isinstance(m.get(chave), float) for m in todas_metricas):
+                # Só nan (ex.: tempo das réplicas da geração conjunta): mantém a coluna no CSV
+                metricas_medias[chave] = float('nan')
 
         # Agregados adicionais de tempo de geração (se existir a coluna)
         if 'tempo_geracao_s' in todas_metricas[0]:
-            tempos = [float(m.get('tempo_geracao_s', 0.0)) for m in todas_metricas]
-            if tempos:
-                metricas_medias['tempo_geracao_medio_s'] = float(np.mean(tempos))
-                metricas_medias['tempo_geracao_mediana_s'] = float(np.median(tempos))
+            # Réplicas da geração conjunta não têm tempo próprio (nan)
+            tempos = [t for t in (float(m.get('tempo_geracao_s', 0.0)) for m in todas_metricas) if not np.isnan(t)]
+            metricas_medias['tempo_geracao_medio_s'] = float(np.mean(tempos)) if tempos else float('nan')
+            metricas_medias['tempo_geracao_mediana_s'] = float(np.median(tempos)) if tempos else float('nan')
+        # Algoritmo de geração predominante entre as réplicas
+        metodos = [m.get('metodo_geracao') for m in todas_metricas if m.get('metodo_geracao')]
+        if metodos:
+            metricas_medias['metodo_geracao'] = max(set(metodos), key=metodos.count)
         
 
         
-        # Analisa equivalência estrutural entre replicações
+        # Analisa equivalência estrutural entre replicações (grafos em disco não
+        # têm networkx e ficam com os valores padrão)
         try:
             from similaridade import analisar_equivalencia_replicacoes, detectar_outliers_estruturais
+            if not grafos_networkx:
+                raise ValueError("sem grafos networkx para comparar")
             
             metricas_equivalencia = analisar_equivalencia_replicacoes(grafos_networkx)
             outliers, metricas_outliers = detectar_outliers_estruturais(grafos_networkx)
@@ -457,7 +673,7 @@ def executa_teste_simples_completo(tipo, numV, numA, seed, estrategia_arestas, p
         
         # Adiciona métricas básicas
         metricas_medias.update({
-            'taxa_sucesso': len(todas_metricas) / num_grafos,
+            'taxa_sucesso': len(todas_metricas) / len(indices_replicas),
             'limite_atingido': False
         })
         
@@ -539,6 +755,17 @@ def main():
                        help='Executa um smoke test mínimo (parâmetros reduzidos, poucos grafos)')
     parser.add_argument('--tipos', nargs='+', type=int, default=[0, 1, 20, 21, 30, 31],
                        help='Lista de tipos de grafos para teste (padrão: todos os tipos)')
+    parser.add_argument('--replicas', nargs='+', type=int, default=None,
+                       help='Índices das réplicas a executar (padrão: todas); útil para reexecutar falhas')
+    parser.add_argument('--dir_disco', default=None,
+                       help='Gera grafos acima de 100k vértices em disco neste diretório (memória limitada, '
+                            'apenas métricas básicas); inclui os tamanhos até --max_vertices')
+    parser.add_argument('--verificar_invariantes', action='store_true',
+                       help='Recalcula as propriedades garantidas pelo registro de geração (componentes) '
+                            'e avisa se divergirem')
+    parser.add_argument('--varredura', action='store_true',
+                       help='Gera as preferências de densidade de cada (tipo, V, componentes, seed) como '
+                            'uma família aninhada por réplica, reaproveitando as arestas entre os níveis')
     
     args = parser.parse_args()
     
@@ -560,6 +787,9 @@ def main():
     else:
         # Apenas 10k para teste
         TAMANHOS = [10000]
+        if args.dir_disco:
+            # Tamanhos grandes só com geração em disco
+            TAMANHOS += [n for n in (100000, 1000000) if n <= args.max_vertices]
         PREFERENCIAS_DENSIDADE = [0, 1, 2]  # Sem preferência, Esparso, Denso
         NUM_COMPONENTES = [0, 1]  # Aleatório, Conexo
         SEEDS = args.seeds
@@ -595,13 +825,14 @@ def main():
     
 
     
+    # Sorteia numA de todas as combinações na ordem original (mesma sequência
+    # de random.randint com ou sem --varredura)
+    combinacoes = []
     for tipo in TIPOS_GRAFOS:
         for numV in TAMANHOS:
             for pref_dens in PREFERENCIAS_DENSIDADE:
                 for numC in NUM_COMPONENTES:
                     for seed in SEEDS:
-                        teste_atual += 1
-                        
                         # Calcula número de arestas baseado na preferência de densidade
                         max_arestas = numV * (numV - 1) // 2
                         min_arestas = max(1, numV-1)
@@ -612,39 +843,68 @@ def main():
                             numA = random.randint(min_arestas, int(max_arestas * DENSIDADE_ESPARSA_MAX))
                         else:  # Denso (d ≥ 0.8)
                             numA = random.randint(int(max_arestas * DENSIDADE_DENSA_MIN), max_arestas)
-                        
-                        # Mapeia preferência para texto
-                        pref_texto = {0: "Sem preferência", 1: "Esparso", 2: "Denso"}[pref_dens]
-                        comp_texto = {0: "Aleatório", 1: "Conexo"}[numC]
-                        
-                        print(f"[{teste_atual:6d}/{total_combinacoes}] Tipo {tipo} - V={numV} - {pref_texto} - {comp_texto} - Seed={seed}")
-                        
-                        # 2 grafos por combinação
-                        num_grafos_combo = 2
-                        
-                        resultado = executa_teste_simples_completo(
-                            tipo, numV, numA, seed, "Proporcional", pref_dens, 
-                            numC, args.output_format, args.output_dir, args.naming_pattern, num_grafos=num_grafos_combo, timeout_por_grafo_s=args.timeout_por_grafo_s
-                        )
-                        
-                        if resultado:
-                            resultados.append(resultado)
-                            # Escrita incremental no CSV consolidado (append)
-                            try:
-                                csv_file_inc = os.path.join(args.output_dir, 'resultados_simples_completo.csv')
-                                df_inc = pd.DataFrame([resultado])
-                                write_header = not os.path.exists(csv_file_inc)
-                                # Garante diretório de saída
-                                os.makedirs(args.output_dir, exist_ok=True)
-                                df_inc.to_csv(csv_file_inc, mode='a', header=write_header, index=False)
-                            except Exception as e:
-                                print(f"  [AVISO] Falha ao escrever incremental: {e}")
-                            if resultado['limite_atingido']:
-                                print(f"  [LIMITE] {resultado.get('erro', 'Erro desconhecido')}")
-                            else:
-                                print(f"  [OK] Sucesso: {resultado['taxa_sucesso']:.1%} - Consistência: {resultado.get('consistencia_estrutural', 0):.3f}")
-                        else:
-                            print(f"  [ERRO] Falha")
+                        combinacoes.append((tipo, numV, pref_dens, numC, seed, numA))
+    
+    if args.varredura:
+        # Agrupa as preferências de densidade de cada família, para manter em
+        # memória apenas a família atual
+        combinacoes.sort(key=lambda c: (TIPOS_GRAFOS.index(c[0]), TAMANHOS.index(c[1]),
+                                        NUM_COMPONENTES.index(c[3]), SEEDS.index(c[4])))
+    
+    # 2 grafos por combinação
+    num_grafos_combo = 2
+    indices_replicas = list(range(num_grafos_combo)) if args.replicas is None else list(args.replicas)
+    familia_atual = None
+    familia = {}
+    
+    for tipo, numV, pref_dens, numC, seed, numA in combinacoes:
+        teste_atual += 1
+        
+        pregerados = None
+        if args.varredura:
+            chave_familia = (tipo, numV, numC, seed)
+            if chave_familia != familia_atual:
+                familia_atual = chave_familia
+                niveis = [c[5] for c in combinacoes if (c[0], c[1], c[3], c[4]) == chave_familia]
+                try:
+                    familia = gera_varredura_replicas(tipo, numV, niveis, seed, indices_replicas)
+                except Exception as e:
+                    # Sem a família, cada nível é gerado isoladamente
+                    print(f"  [AVISO] Falha na varredura de densidade: {e}")
+                    familia = {}
+            pregerados = familia.get(numA)
+        
+        # Mapeia preferência para texto
+        pref_texto = {0: "Sem preferência", 1: "Esparso", 2: "Denso"}[pref_dens]
+        comp_texto = {0: "Aleatório", 1: "Conexo"}[numC]
+        
+        print(f"[{teste_atual:6d}/{total_combinacoes}] Tipo {tipo} - V={numV} - {pref_texto} - {comp_texto} - Seed={seed}")
+        
+        resultado = executa_teste_simples_completo(
+            tipo, numV, numA, seed, "Proporcional", pref_dens, 
+            numC, args.output_format, args.output_dir, args.naming_pattern, num_grafos=num_grafos_combo, timeout_por_grafo_s=args.timeout_por_grafo_s,
+            replicas=args.replicas, grafos_pregerados=pregerados, dir_disco=args.dir_disco,
+            verificar_invariantes=args.verificar_invariantes
+        )
+        
+        if resultado:
+            resultados.append(resultado)
+            # Escrita incremental no CSV consolidado (append)
+            try:
+                csv_file_inc = os.path.join(args.output_dir, 'resultados_simples_completo.csv')
+                df_inc = pd.DataFrame([resultado])
+                write_header = not os.path.exists(csv_file_inc)
+                # Garante diretório de saída
+                os.makedirs(args.output_dir, exist_ok=True)
+                df_inc.to_csv(csv_file_inc, mode='a', header=write_header, index=False)
+            except Exception as e:
+                print(f"  [AVISO] Falha ao escrever incremental: {e}")
+            if resultado['limite_atingido']:
+                print(f"  [LIMITE] {resultado.get('erro', 'Erro desconhecido')}")
+            else:
+                print(f"  [OK] Sucesso: {resultado['taxa_sucesso']:.1%} - Consistência: {resultado.get('consistencia_estrutural', 0):.3f}")
+        else:
+            print(f"  [ERRO] Falha")
     
 
     
@@ -660,7 +920,7 @@ def main():
         resumo_file = os.path.join(args.output_dir, 'resumo_simples_completo.csv')
         desejadas_mean = [
             'densidade', 'grau_medio', 'grau_max', 'grau_min', 'grau_desvio', 'grau_mediana',
-            'num_componentes', 'conectividade',
+            'num_lacos', 'num_arestas_multiplas', 'num_componentes', 'conectividade',
             'pagerank_medio', 'pagerank_max', 'pagerank_min', 'pagerank_desvio', 'pagerank_mediana',
             'closeness_medio', 'closeness_max', 'closeness_min', 'closeness_desvio', 'closeness_mediana',
             'betweenness_medio', 'betweenness_max', 'betweenness_min', 'betweenness_desvio', 'betweenness_mediana',
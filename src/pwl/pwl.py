@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import os
+import sys
 import numpy as np
 import random
 import networkx as nx
@@ -8,8 +10,39 @@ from constants import (
     GRAU_MIN_PADRAO, GAMMA_MIN, GAMMA_MAX
 )
 
-
-def gerarGrausZipf(n, gamma, kMin=GRAU_MIN_PADRAO, kMax=None):
+# Classificação de tipo compartilhada com o gerador simples (src/comum). src entra
+# no fim do sys.path: o constants.py deste diretório continua tendo prioridade.
+_src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+if _src_dir not in sys.path:
+    sys.path.append(_src_dir)
+from comum.classificacao import caracteristicasArestas, classificaTipo
+
+
+def _comoRandom(rng=None):
+    """Normaliza a fonte de aleatoriedade para random.Random (None cria um fluxo novo)."""
+    if rng is None:
+        return random.Random()
+    if isinstance(rng, random.Random):
+        return rng
+    if isinstance(rng, np.random.Generator):
+        return random.Random(int(rng.integers(0, 2**63)))
+    if isinstance(rng, np.random.RandomState):
+        return random.Random(int(rng.randint(0, 2**31 - 1)))
+    raise ValueError(f"Fonte de aleatoriedade inválida: {type(rng).__name__}")
+
+
+def _comoNumpy(rng=None):
+    """Normaliza a fonte de aleatoriedade para um gerador NumPy (Generator ou RandomState)."""
+    if rng is None:
+        return np.random.default_rng()
+    if isinstance(rng, (np.random.Generator, np.random.RandomState)):
+        return rng
+    if isinstance(rng, random.Random):
+        return np.random.default_rng(rng.getrandbits(64))
+    raise ValueError(f"Fonte de aleatoriedade inválida: {type(rng).__name__}")
+
+
+def gerarGrausZipf(n, gamma, kMin=GRAU_MIN_PADRAO, kMax=None, rng=None):
     """
     Gera uma lista de graus seguindo distribuição Zipf (power-law).
     
@@ -22,6 +55,8 @@ def gerarGrausZipf(n, gamma, kMin=GRAU_MIN_PADRAO, kMax=None):
         gamma (float): Expoente da distribuição power-law (tipicamente 2.0-3.0)
         kMin (int): Grau mínimo permitido (padrão: GRAU_MIN_PADRAO)
         kMax (int): Grau máximo permitido (padrão: n-1)
+        rng: np.random.Generator ou random.Random; None usa um fluxo novo,
+            sem tocar no estado global de np.random
     
     Returns:
         list: Lista de n graus seguindo distribuição Zipf
@@ -35,6 +70,7 @@ def gerarGrausZipf(n, gamma, kMin=GRAU_MIN_PADRAO, kMax=None):
         >>> gerarGrausZipf(100, 2.5)
         [3, 1, 2, 1, 4, 1, 2, 1, 1, ...]  # 100 graus com gamma=2.5
     """
+    gen = _comoNumpy(rng)
     if kMax is None:
         kMax = n - 1
     
@@ -43,7 +79,7 @@ def gerarGrausZipf(n, gamma, kMin=GRAU_MIN_PADRAO, kMax=None):
     tentativas = 0
     
     while len(graus) < n and tentativas < tentativas_max:
-        k = np.random.zipf(gamma)
+        k = gen.zipf(gamma)
         if kMin <= k <= kMax:
             graus.append(k)
         tentativas += 1
@@ -55,17 +91,18 @@ def gerarGrausZipf(n, gamma, kMin=GRAU_MIN_PADRAO, kMax=None):
     return graus
 
 
-def geraGrausPwl(n, gamma, kMin=GRAU_MIN_PADRAO, kMax=None, desequilibrado=False):
+def geraGrausPwl(n, gamma, kMin=GRAU_MIN_PADRAO, kMax=None, desequilibrado=False, rng=None):
     """Gera graus para grafos power-law, com opção de graus desequilibrados para grafos dirigidos."""
+    gen = _comoNumpy(rng)
     if desequilibrado:
-        graus_out = gerarGrausZipf(n, gamma, kMin, kMax)
-        graus_in = gerarGrausZipf(n, gamma, kMin, kMax)
+        graus_out = gerarGrausZipf(n, gamma, kMin, kMax, gen)
+        graus_in = gerarGrausZipf(n, gamma, kMin, kMax, gen)
         return graus_out, graus_in
     else:
-        return gerarGrausZipf(n, gamma, kMin, kMax)
+        return gerarGrausZipf(n, gamma, kMin, kMax, gen)
 
 
-def ajustaGrausDirigidos(graus_out, graus_in):
+def ajustaGrausDirigidos(graus_out, graus_in, rng=None):
     """
     Ajusta graus de entrada e saída para que tenham a mesma soma.
     
@@ -76,6 +113,7 @@ def ajustaGrausDirigidos(graus_out, graus_in):
     Args:
         graus_out (list): Lista de graus de saída dos vértices
         graus_in (list): Lista de graus de entrada dos vértices
+        rng: np.random.Generator ou random.Random usado para escolher os vértices
     
     Returns:
         tuple: (graus_out_ajustado, graus_in_ajustado) com somas iguais
@@ -101,14 +139,14 @@ def ajustaGrausDirigidos(graus_out, graus_in):
         abs_diff = abs(diff)
         
         # Escolhe vértices aleatoriamente para adicionar graus
-        indices = np.random.choice(len(target), abs_diff, replace=True)
+        indices = _comoNumpy(rng).choice(len(target), abs_diff, replace=True)
         for idx in indices:
             target[idx] += 1
     
     return graus_out, graus_in
 
 
-def constroiGrafoDirigido(graus, tipo, n):
+def constroiGrafoDirigido(graus, tipo, n, rng=None, gen=None):
     """
     Constrói grafo dirigido usando algoritmo de stub matching.
     
@@ -120,9 +158,13 @@ def constroiGrafoDirigido(graus, tipo, n):
         graus: Lista de graus ou tupla (graus_out, graus_in) para grafos dirigidos
         tipo (int): Tipo do grafo (determina se é multigrafo/pseudografo)
         n (int): Número de vértices
+        rng (random.Random): Embaralhamento dos stubs
+        gen: Gerador NumPy para o ajuste dos graus (padrão: derivado de rng)
     
     Returns:
-        nx.DiGraph or nx.MultiDiGraph: Grafo dirigido construído
+        nx.DiGraph or nx.MultiDiGraph: Grafo dirigido construído. G.graph['graus']
+        guarda o grau (entrada + saída) de cada vértice e G.graph['lacos'] o
+        número de laços, contados durante o pareamento
         
     Algorithm:
         1. Cria stubs de saída e entrada baseado nos graus
@@ -136,6 +178,8 @@ def constroiGrafoDirigido(graus, tipo, n):
         >>> G.number_of_edges()
         6  # soma dos graus de saída
     """
+    rng = _comoRandom(rng)
+    gen = _comoNumpy(rng) if gen is None else gen
     multigrafo = tipo in TIPOS_MULTIGRAFOS
     laco = tipo in TIPOS_PSEUDOGRAFOS
     
@@ -150,7 +194,7 @@ def constroiGrafoDirigido(graus, tipo, n):
         graus_out = graus_in = graus
 
     # Passo 1: Ajusta graus para garantir soma igual
-    graus_out, graus_in = ajustaGrausDirigidos(graus_out, graus_in)
+    graus_out, graus_in = ajustaGrausDirigidos(graus_out, graus_in, gen)
 
     # Passo 2: Cria stubs (pontas de arestas)
     out_stubs, in_stubs = [], []
@@ -160,10 +204,12 @@ def constroiGrafoDirigido(graus, tipo, n):
         in_stubs.extend([node] * k)   # k stubs de entrada para o vértice
 
     # Passo 3: Embaralha stubs para randomização
-    random.shuffle(out_stubs)
-    random.shuffle(in_stubs)
+    rng.shuffle(out_stubs)
+    rng.shuffle(in_stubs)
 
     # Passo 4: Conecta stubs respeitando restrições
+    graus_grafo = [0] * n
+    lacos = 0
     while out_stubs and in_stubs:
         u = out_stubs.pop()  # Vértice de origem
         v = in_stubs.pop()   # Vértice de destino
@@ -176,12 +222,18 @@ def constroiGrafoDirigido(graus, tipo, n):
             continue
             
         G.add_edge(u, v)
+        graus_grafo[u] += 1
+        graus_grafo[v] += 1
+        lacos += u == v
 
+    G.graph['graus'] = graus_grafo
+    G.graph['lacos'] = lacos
     return G
 
 
-def constroiGrafoNaoDirigido(graus, tipo, n):
-    """Constrói grafo não dirigido usando stub matching."""
+def constroiGrafoNaoDirigido(graus, tipo, n, rng=None):
+    """Constrói grafo não dirigido usando stub matching (G.graph: ver constroiGrafoDirigido)."""
+    rng = _comoRandom(rng)
     multigrafo = tipo in TIPOS_MULTIGRAFOS
     laco = tipo in TIPOS_PSEUDOGRAFOS
     
@@ -192,9 +244,11 @@ def constroiGrafoNaoDirigido(graus, tipo, n):
     stubs = []
     for node, grau in enumerate(graus):
         stubs.extend([node] * grau)
-    random.shuffle(stubs)
+    rng.shuffle(stubs)
 
     # Conecta stubs
+    graus_grafo = [0] * n
+    lacos = 0
     while len(stubs) > 1:
         u = stubs.pop()
         v = stubs.pop()
@@ -203,81 +257,145 @@ def constroiGrafoNaoDirigido(graus, tipo, n):
         if not multigrafo and G.has_edge(u, v):
             continue
         G.add_edge(u, v)
+        graus_grafo[u] += 1
+        graus_grafo[v] += 1
+        lacos += u == v
 
+    G.graph['graus'] = graus_grafo
+    G.graph['lacos'] = lacos
     return G
 
 
-def adicionaCaracteristicasEspeciais(G, tipo):
-    """Adiciona características especiais como multigrafos e laços."""
+def adicionaCaracteristicasEspeciais(G, tipo, rng=None):
+    """
+    Adiciona características especiais como multigrafos e laços.
+    
+    Mantém G.graph['graus'] e G.graph['lacos'] (ver constroiGrafoDirigido)
+    atualizados, quando presentes; a existência de laços vem de
+    G.graph['lacos'] em vez de uma varredura das arestas.
+    """
+    rng = _comoRandom(rng)
     multigrafo = tipo in TIPOS_MULTIGRAFOS
     laco = tipo in TIPOS_PSEUDOGRAFOS
+    graus_grafo = G.graph.get('graus')
+
+    def adiciona(u, v):
+        G.add_edge(u, v)
+        if graus_grafo is not None:
+            graus_grafo[u] += 1
+            graus_grafo[v] += 1
+            G.graph['lacos'] += u == v
 
     # Garante que multigrafos tenham pelo menos uma aresta múltipla
     if multigrafo:
-        edges = list(G.edges())
-        if edges:
-            u, v = edges[0]
-            G.add_edge(u, v)
+        u, v = next(iter(G.edges()), (None, None))
+        if u is not None:
+            adiciona(u, v)
 
     # Garante que pseudografos tenham pelo menos um laço
-    if laco and not any(u == v for u, v in G.edges()):
-        v = random.choice(list(G.nodes()))
-        G.add_edge(v, v)
+    if 'lacos' in G.graph:
+        tem_laco = G.graph['lacos'] > 0
+    else:
+        tem_laco = any(u == v for u, v in G.edges())
+    if laco and not tem_laco:
+        v = rng.choice(list(G.nodes()))
+        adiciona(v, v)
 
     return G
 
 
-def constroiGrafo(graus, tipo):
-    """Constrói grafo baseado no tipo especificado."""
+def constroiGrafo(graus, tipo, rng=None, gen=None):
+    """Constrói grafo baseado no tipo especificado (rng/gen: ver constroiGrafoDirigido)."""
+    rng = _comoRandom(rng)
     n = len(graus) if isinstance(graus, list) else len(graus[0])
     dirigido = tipo in TIPOS_DIRIGIDOS
 
     if dirigido:
-        G = constroiGrafoDirigido(graus, tipo, n)
+        G = constroiGrafoDirigido(graus, tipo, n, rng, gen)
     else:
-        G = constroiGrafoNaoDirigido(graus, tipo, n)
+        G = constroiGrafoNaoDirigido(graus, tipo, n, rng)
 
-    G = adicionaCaracteristicasEspeciais(G, tipo)
+    G = adicionaCaracteristicasEspeciais(G, tipo, rng)
     return G
 
 
-def geraGrafoPwl(numV, gamma=2.5, dirigido=False, tipo=0, seed=None, desequilibrado=False):
-    """Função principal para gerar grafos power-law."""
-    if seed is not None:
-        random.seed(seed)
-        np.random.seed(seed)
+def geraGrafoPwl(numV, gamma=2.5, dirigido=False, tipo=0, seed=None, desequilibrado=False, rng=None,
+                 registro=False):
+    """
+    Função principal para gerar grafos power-law.
+    
+    A aleatoriedade vem de objetos próprios da chamada, nunca do estado global
+    de random/np.random. Com rng (random.Random ou np.random.Generator), seed é
+    ignorada; sem rng, usa random.Random(seed) e np.random.RandomState(seed),
+    que reproduzem os fluxos de random.seed(seed) e np.random.seed(seed).
+    
+    Retorna (arestas, G, graus). Com registro=True, acrescenta o registro de
+    geração, um dict com o que a construção já conhece:
+    - graus: grau de cada vértice em G (como G.degree(), laços contam 2)
+    - num_arestas: arestas de G, incluindo cópias
+    - num_lacos, tem_lacos: laços inseridos
+    - tem_multiplas: True nos multigrafos (uma cópia é sempre inserida)
+    - num_componentes: None (o pareamento não garante conectividade)
+    além de tipo, numV, gamma e dirigido.
+    """
+    if rng is not None:
+        gen = _comoNumpy(rng)
+        rng = _comoRandom(rng)
+    else:
+        rng = random.Random(seed)
+        gen = np.random.RandomState(seed)
 
-    graus = geraGrausPwl(numV, gamma, desequilibrado=desequilibrado)
-    G = constroiGrafo(graus, tipo)
+    graus = geraGrausPwl(numV, gamma, desequilibrado=desequilibrado, rng=gen)
+    G = constroiGrafo(graus, tipo, rng, gen)
+    graus_grafo = G.graph.pop('graus')
+    num_lacos = G.graph.pop('lacos')
 
     if dirigido:
         numA = G.number_of_edges()
         graus_out = graus[0] if isinstance(graus, tuple) else graus
         graus_resultado = graus_out
     else:
-        numA = sum(dict(G.degree()).values()) // 2
+        numA = sum(graus_grafo) // 2
         graus_resultado = graus
 
     arestas = list(G.edges())[:numA]
-    return arestas, G, graus_resultado
-
-
-def tipoGrafo(G):
-    """Detecta automaticamente o tipo do grafo."""
+    if not registro:
+        return arestas, G, graus_resultado
+    num_arestas = sum(graus_grafo) // 2
+    return arestas, G, graus_resultado, {
+        'tipo': tipo,
+        'numV': numV,
+        'gamma': gamma,
+        'dirigido': G.is_directed(),
+        'graus': graus_grafo,
+        'num_arestas': num_arestas,
+        'num_lacos': num_lacos,
+        'tem_lacos': num_lacos > 0,
+        'tem_multiplas': G.is_multigraph() and num_arestas > 0,
+        'num_componentes': None,
+    }
+
+
+def tipoGrafo(G, registro=None, verificar=False):
+    """
+    Detecta automaticamente o tipo do grafo.
+    
+    Com registro (ver geraGrafoPwl(registro=True)), laços e arestas
+    múltiplas vêm do registro, sem varrer as arestas; verificar=True varre
+    mesmo assim e dispara ValueError se o registro divergir (também com
+    python -O). A varredura é vetorizada sobre o array de arestas
+    (caracteristicasArestas, em src/comum/classificacao.py), em O(E log E).
+    """
     dirigido = G.is_directed()
-    multigrafo = G.is_multigraph()
-    laco = any(u == v for u, v in G.edges())
-    multipla = any(G.number_of_edges(u, v) > 1 for u, v in G.edges()) if multigrafo else False
-
-    if dirigido and multipla and laco:
-        return 31
-    elif dirigido and multipla:
-        return 21
-    elif dirigido:
-        return 1
-    elif laco:
-        return 30
-    elif multipla:
-        return 20
+    if registro is not None and not verificar:
+        laco = registro['tem_lacos']
+        multipla = registro['tem_multiplas']
     else:
-        return 0
+        arestas = np.fromiter((x for aresta in G.edges() for x in aresta), dtype=np.int64,
+                              count=2 * G.number_of_edges()).reshape(-1, 2)
+        _, multipla, laco = caracteristicasArestas(arestas, dirigido=dirigido)
+        if registro is not None and (laco, multipla) != (registro['tem_lacos'], registro['tem_multiplas']):
+            raise ValueError(f"Registro de geração indica laços={registro['tem_lacos']}, "
+                             f"múltiplas={registro['tem_multiplas']}; o grafo tem laços={laco}, múltiplas={multipla}")
+
+    return classificaTipo(dirigido, multipla, laco)
@@ -1,28 +1,51 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import os
+import sys
 import matplotlib.pyplot as plt
 import networkx as nx
+import numpy as np
 from constants import MAX_NOS_VISUALIZACAO, TAMANHO_NOS_PEQUENOS
 
+# Amostragem e cache de layouts compartilhados (src/comum), como em pwl.py
+_src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+if _src_dir not in sys.path:
+    sys.path.append(_src_dir)
+from comum.renderizacao import amostraEstratificada, layoutEmCache
+
 
 def visualizaGrafo(G, dirigido=False):
-    """Visualiza o grafo gerado."""
+    """
+    Visualiza o grafo gerado.
+
+    Acima de MAX_NOS_VISUALIZACAO nós, desenha uma amostra estratificada por
+    grau (mantém os hubs da cauda); os layouts ficam em cache pela hash do
+    grafo desenhado.
+    """
     num_nos = G.number_of_nodes()
+    nos = list(G.nodes())
+    indice = {no: i for i, no in enumerate(nos)}
+    arestas = np.array([(indice[u], indice[v]) for u, v in G.edges()], dtype=np.int64).reshape(-1, 2)
 
+    titulo = "Visualização do Grafo Gerado"
     if num_nos > MAX_NOS_VISUALIZACAO:
-        print("⚠️ Grafo muito grande — visualização ignorada.")
-        return
-
-    plt.figure(figsize=(10, 8))
+        vertices, arestas = amostraEstratificada(arestas, num_nos, MAX_NOS_VISUALIZACAO, rng=42)
+        nos = [nos[i] for i in vertices]
+        titulo += f" (amostra de {len(nos)} de {num_nos} nós)"
+        print(f"⚠️ Grafo muito grande — desenhando amostra de {len(nos)} nós.")
 
-    if num_nos <= TAMANHO_NOS_PEQUENOS:
-        pos = nx.spring_layout(G, seed=42)
+    if len(nos) <= TAMANHO_NOS_PEQUENOS:
+        posicoes = layoutEmCache(arestas, len(nos), 'spring', seed=42)[0]
     else:
-        pos = nx.kamada_kawai_layout(G)
+        posicoes = layoutEmCache(arestas, len(nos), 'kk')[0]
+    pos = dict(zip(nos, posicoes))
+    H = G.subgraph(nos)
+
+    plt.figure(figsize=(10, 8))
 
-    nx.draw_networkx_nodes(G, pos, node_size=50, node_color="skyblue")
-    nx.draw_networkx_edges(G, pos, alpha=0.4, arrows=dirigido)
+    nx.draw_networkx_nodes(H, pos, node_size=50, node_color="skyblue")
+    nx.draw_networkx_edges(H, pos, alpha=0.4, arrows=dirigido)
 
-    plt.title("Visualização do Grafo Gerado")
+    plt.title(titulo)
     plt.axis("off")
     plt.show()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Adjacência esparsa em formato CSR (compressed sparse row).
+
+Substitui a matriz densa numV × numV de utils.criaMatrizAdjacencias e o
+dicionário de listas de utils.criaListaAdjacencias por três vetores:
+
+- indptr (numV + 1): os vizinhos de u ocupam as posições
+  indptr[u]:indptr[u + 1] dos outros vetores
+- indices: vizinhos distintos de cada vértice, em ordem crescente
+- contagens: multiplicidade de cada par (u, vizinho)
+
+Arestas múltiplas e laços são preservados. A memória é O(V + E), contra
+8·V² bytes da matriz int64 (10k vértices: 800 MB).
+
+Grafos valorados guardam um quarto vetor, pesos, com um peso por cópia de
+aresta (ver gerador.geraPesos), em vez das listas de pesos por célula de
+utils.criaMatrizAdjacenciasValorada.
+"""
+import numpy as np
+
+from constants import TIPOS_DIRIGIDOS
+from exceptions import ParametrosInvalidosError
+from arestas import decodificaChaves, tipoVertices
+
+
+class AdjacenciaCSR:
+    """
+    Lista de adjacências compacta de um grafo com numV vértices.
+
+    Em grafos não dirigidos, cada aresta u != v aparece nas linhas u e v, e
+    um laço aparece uma única vez, na linha u (como na matriz de
+    criaMatrizAdjacencias).
+
+    Args:
+        numV (int): Número de vértices
+        indptr (np.ndarray): Deslocamentos int64 das linhas (numV + 1)
+        indices (np.ndarray): Vizinhos, ordenados dentro de cada linha
+        contagens (np.ndarray): Multiplicidade int64 de cada entrada
+        dirigido (bool): Se as linhas guardam apenas os sucessores
+        pesos (np.ndarray): Pesos das cópias, em ordem de entrada (as
+            contagens[k] cópias da entrada k são consecutivas), ou None
+
+    Example:
+        >>> adj = criaAdjacenciaCSR([(0, 1), (0, 1), (2, 2)], 3, 30)
+        >>> adj.vizinhos(1), adj.multiplicidades(1)
+        (array([0], dtype=int32), array([2]))
+        >>> adj.graus()
+        array([2, 2, 2])
+    """
+
+    def __init__(self, numV, indptr, indices, contagens, dirigido, pesos=None):
+        self.numV = int(numV)
+        self.indptr = indptr
+        self.indices = indices
+        self.contagens = contagens
+        self.dirigido = dirigido
+        self.pesos = pesos
+        self._inicios = None
+
+    def __len__(self):
+        return self.numV
+
+    @property
+    def nbytes(self):
+        """Memória ocupada pelos vetores, em bytes."""
+        total = self.indptr.nbytes + self.indices.nbytes + self.contagens.nbytes
+        return total + (self.pesos.nbytes if self.pesos is not None else 0)
+
+    @property
+    def valorado(self):
+        return self.pesos is not None
+
+    def vizinhos(self, u):
+        """Vizinhos distintos de u (sucessores em dirigidos), como visão dos índices."""
+        return self.indices[self.indptr[u]:self.indptr[u + 1]]
+
+    def multiplicidades(self, u):
+        """Multiplicidade de cada vizinho de u, na ordem de vizinhos(u)."""
+        return self.contagens[self.indptr[u]:self.indptr[u + 1]]
+
+    def pesosLinha(self, u):
+        """Pesos das arestas de u, uma por cópia, alinhados a np.repeat(vizinhos(u), multiplicidades(u))."""
+        inicio, fim = self._inicioPesos()[[self.indptr[u], self.indptr[u + 1]]]
+        return self.pesos[inicio:fim]
+
+    def _inicioPesos(self):
+        """Posição em pesos da primeira cópia de cada entrada (numEntradas + 1), calculada uma vez."""
+        if self._inicios is None:
+            self._inicios = np.zeros(self.contagens.size + 1, dtype=np.int64)
+            np.cumsum(self.contagens, out=self._inicios[1:])
+        return self._inicios
+
+    def linhas(self):
+        """Vértice de origem de cada entrada (expande indptr)."""
+        return np.repeat(np.arange(self.numV, dtype=self.indices.dtype), np.diff(self.indptr))
+
+    def arestas(self):
+        """
+        Arestas distintas com multiplicidade.
+
+        Returns:
+            tuple: Vetores (u, v, contagem); em grafos não dirigidos, cada
+            aresta aparece uma vez, com u <= v
+        """
+        u = self.linhas()
+        if self.dirigido:
+            return u, self.indices, self.contagens
+        mantidas = u <= self.indices
+        return u[mantidas], self.indices[mantidas], self.contagens[mantidas]
+
+    def numArestas(self):
+        """Número de arestas, incluindo cópias."""
+        return int(self.arestas()[2].sum())
+
+    def graus(self):
+        """Grau de cada vértice com as cópias, como nx.MultiGraph: entrada + saída em dirigidos, laços contam 2."""
+        u, v, contagem = self.arestas()
+        graus = np.bincount(u, weights=contagem, minlength=self.numV)
+        graus += np.bincount(v, weights=contagem, minlength=self.numV)
+        return graus.astype(np.int64)
+
+    def temLacos(self):
+        return bool(np.any(self.linhas() == self.indices))
+
+    def temMultiplas(self):
+        return bool(np.any(self.contagens > 1))
+
+    def simetrica(self):
+        """Se cada entrada (u, v, c) tem a entrada (v, u, c) correspondente."""
+        if not self.dirigido:
+            return True
+        u = self.linhas().astype(np.int64)
+        transpostas = self.indices.astype(np.int64) * self.numV + u
+        ordem = np.argsort(transpostas, kind='stable')
+        return bool(np.array_equal(u * self.numV + self.indices, transpostas[ordem])
+                    and np.array_equal(self.contagens, self.contagens[ordem]))
+
+    def arestasValoradas(self):
+        """
+        Uma linha por cópia de aresta, com o seu peso.
+
+        Returns:
+            tuple: Vetores (u, v, peso); em grafos não dirigidos, cada cópia
+            aparece uma vez, com u <= v
+        """
+        u = np.repeat(self.linhas(), self.contagens)
+        v = np.repeat(self.indices, self.contagens)
+        if self.dirigido:
+            return u, v, self.pesos
+        mantidas = u <= v
+        return u[mantidas], v[mantidas], self.pesos[mantidas]
+
+    def listaAdjacencias(self):
+        """
+        Dicionário no formato de utils.criaListaAdjacencias.
+
+        {u: [(v, contagem), ...]}, ou {u: [(v, peso), ...]} com um par por
+        cópia em grafos valorados.
+        """
+        if self.valorado:
+            linhas = self._inicioPesos()[self.indptr].tolist()
+            pares = list(zip(np.repeat(self.indices, self.contagens).tolist(), self.pesos.tolist()))
+        else:
+            linhas = self.indptr.tolist()
+            pares = list(zip(self.indices.tolist(), self.contagens.tolist()))
+        return {u: pares[linhas[u]:linhas[u + 1]] for u in range(self.numV)}
+
+    def matrizDensa(self):
+        """Matriz numV × numV de multiplicidades (apenas para grafos pequenos)."""
+        matriz = np.zeros((self.numV, self.numV), dtype=np.int64)
+        matriz[self.linhas(), self.indices] = self.contagens
+        return matriz
+
+    def matrizValorada(self):
+        """Matriz numV × numV de listas de pesos, como utils.criaMatrizAdjacenciasValorada (grafos pequenos)."""
+        matriz = [[[] for _ in range(self.numV)] for _ in range(self.numV)]
+        u = np.repeat(self.linhas(), self.contagens).tolist()
+        v = np.repeat(self.indices, self.contagens).tolist()
+        for origem, destino, peso in zip(u, v, self.pesos.tolist()):
+            matriz[origem][destino].append(peso)
+        return matriz
+
+
+def criaAdjacenciaCSR(arestas, numV, tipo, pesos=None):
+    """
+    Cria a adjacência CSR a partir das arestas, preservando arestas múltiplas e laços.
+
+    Equivalente esparso de utils.criaMatrizAdjacencias (e, com pesos, de
+    criaMatrizAdjacenciasValorada): uma ordenação das chaves das arestas
+    (arestas.codificaArestas), em O(E log E) e sem laços Python.
+
+    Args:
+        arestas: Array (E, 2) ou lista de tuplas (u, v)
+        numV (int): Número de vértices
+        tipo (int): Tipo do grafo (define se é dirigido)
+        pesos (np.ndarray): Peso de cada aresta, alinhado a arestas (ver
+            gerador.geraPesos), ou None; em grafos não dirigidos o peso vale
+            para as duas linhas
+
+    Returns:
+        AdjacenciaCSR: Adjacência do grafo
+    """
+    arestas = np.asarray(arestas, dtype=np.int64).reshape(-1, 2)
+    u, v = arestas[:, 0], arestas[:, 1]
+    dirigido = tipo in TIPOS_DIRIGIDOS
+    if pesos is not None:
+        pesos = np.asarray(pesos)
+        if pesos.shape != (len(arestas),):
+            raise ParametrosInvalidosError(f"Esperado um peso por aresta ({len(arestas)}), recebido {pesos.shape}")
+    if not dirigido:
+        # Cada aresta entra nas duas linhas; laços, uma vez
+        fora = u != v
+        u, v = np.concatenate((u, v[fora])), np.concatenate((v, u[fora]))
+        if pesos is not None:
+            pesos = np.concatenate((pesos, pesos[fora]))
+    chaves = u * numV + v
+    if pesos is not None:
+        # Ordem estável: as cópias de cada entrada mantêm a ordem das arestas
+        ordem = np.argsort(chaves, kind='stable')
+        pesos = pesos[ordem]
+        chaves = chaves[ordem]
+    chaves, contagens = np.unique(chaves, return_counts=True)
+    linhas, indices = decodificaChaves(chaves, numV)
+    indptr = np.zeros(numV + 1, dtype=np.int64)
+    np.cumsum(np.bincount(linhas, minlength=numV), out=indptr[1:])
+    return AdjacenciaCSR(numV, indptr, indices.astype(tipoVertices(numV)), contagens.astype(np.int64), dirigido,
+                         pesos)
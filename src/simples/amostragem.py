@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Amostragem sequencial sem reposição.
+
+Implementa o Método D de Vitter (1987), que seleciona n índices distintos de
+range(N) em ordem crescente, com custo esperado O(n) independente de N. Quando
+a razão n/N é alta, o algoritmo recai no Método A, cujo custo O(N) passa a ser
+da mesma ordem de n.
+
+Referência:
+    J. S. Vitter. An efficient algorithm for sequential random sampling.
+    ACM Transactions on Mathematical Software, 13(1):58-67, 1987.
+"""
+import math
+import numpy as np
+
+# Inverso do limiar alpha: usa o Método A quando n >= N / ALPHA_INV
+ALPHA_INV = 13
+
+
+def _metodoA(N, n, rng, atual, saida):
+    """Seleciona n de N registros restantes pelo Método A (custo O(N))."""
+    top = N - n
+    Nreal = float(N)
+    while n >= 2:
+        V = rng.random()
+        S = 0
+        quot = top / Nreal
+        while quot > V:
+            S += 1
+            top -= 1
+            Nreal -= 1
+            quot = (quot * top) / Nreal
+        # Pula S registros e seleciona o seguinte
+        atual += S + 1
+        saida.append(atual)
+        Nreal -= 1
+        n -= 1
+    if n == 1:
+        S = int(round(Nreal) * rng.random())
+        atual += S + 1
+        saida.append(atual)
+
+
+def amostraSequencial(N, n, rng):
+    """
+    Seleciona n índices distintos de range(N), uniformemente e já ordenados.
+    
+    Os índices são emitidos sequencialmente em ordem crescente, sem rejeição
+    por repetição e sem estruturas auxiliares proporcionais a N.
+    
+    Args:
+        N (int): Tamanho do espaço de índices
+        n (int): Número de índices a selecionar (0 <= n <= N)
+        rng: Fonte de aleatoriedade com método ``random()`` (ex.: módulo random)
+    
+    Returns:
+        np.ndarray: Vetor int64 ordenado com os n índices selecionados
+    
+    Example:
+        >>> amostraSequencial(10, 3, random.Random(1))
+        array([0, 2, 4])
+    """
+    if n < 0 or n > N:
+        raise ValueError(f"Não é possível selecionar {n} de {N} índices")
+    
+    saida = []
+    atual = -1
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+    
+    nreal = float(n)
+    ninv = 1.0 / nreal
+    Nreal = float(N)
+    Vprime = math.exp(math.log(1.0 - rng.random()) * ninv)
+    qu1 = -n + 1 + N
+    qu1real = -nreal + 1.0 + Nreal
+    threshold = ALPHA_INV * n
+    
+    while n > 1 and threshold < N:
+        nmin1inv = 1.0 / (-1.0 + nreal)
+        while True:
+            # Passo D2: gera U e X
+            while True:
+                X = Nreal * (-Vprime + 1.0)
+                S = int(X)
+                if S < qu1:
+                    break
+                Vprime = math.exp(math.log(1.0 - rng.random()) * ninv)
+            U = 1.0 - rng.random()
+            negSreal = float(-S)
+            # Passo D3: aceita S se U <= h(S) / c g(X)
+            y1 = math.exp(math.log(U * Nreal / qu1real) * nmin1inv)
+            Vprime = y1 * (-X / Nreal + 1.0) * (qu1real / (negSreal + qu1real))
+            if Vprime <= 1.0:
+                break
+            # Passo D4: aceita S se U <= f(S) / c g(X)
+            y2 = 1.0
+            top = -1.0 + Nreal
+            if n - 1 > S:
+                bottom = -nreal + Nreal
+                limite = -S + N
+            else:
+                bottom = -1.0 + negSreal + Nreal
+                limite = qu1
+            for _ in range(N - 1, limite - 1, -1):
+                y2 = (y2 * top) / bottom
+                top -= 1.0
+                bottom -= 1.0
+            if Nreal / (-X + Nreal) >= y1 * math.exp(math.log(y2) * nmin1inv):
+                Vprime = math.exp(math.log(1.0 - rng.random()) * nmin1inv)
+                break
+            Vprime = math.exp(math.log(1.0 - rng.random()) * ninv)
+        
+        # Pula S registros e seleciona o seguinte
+        atual += S + 1
+        saida.append(atual)
+        N = -S + (-1 + N)
+        Nreal = negSreal + (-1.0 + Nreal)
+        n -= 1
+        nreal -= 1.0
+        ninv = nmin1inv
+        qu1 = -S + qu1
+        qu1real = negSreal + qu1real
+        threshold -= ALPHA_INV
+    
+    if n > 1:
+        _metodoA(N, n, rng, atual, saida)
+    else:
+        S = int(N * Vprime)
+        atual += S + 1
+        saida.append(atual)
+    
+    return np.array(saida, dtype=np.int64)
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Utilitários vetorizados para manipulação de arestas.
+
+As arestas são representadas internamente por chaves inteiras int64
+``u * numV + v`` (com ``u < v`` para grafos não dirigidos), o que permite
+deduplicar, ordenar e decodificar grandes conjuntos de arestas com operações
+NumPy em vez de laços Python.
+"""
+import os
+import sys
+import numpy as np
+
+# Classificação de tipo compartilhada com o power-law (src/comum), reexportada
+# aqui para os módulos do simples
+_src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+if _src_dir not in sys.path:
+    sys.path.append(_src_dir)
+from comum.classificacao import classificaTipo, caracteristicasArestas, tipoArestas
+
+# Arestas decodificadas por bloco ao montar arrays (limita temporários)
+_LOTE_DECODIFICA = 1 << 22
+
+
+def codificaArestas(u, v, numV, dirigido=False):
+    """
+    Codifica pares (u, v) em chaves inteiras int64.
+    
+    Para grafos não dirigidos, o par é normalizado para ``u <= v`` antes da
+    codificação, de forma que (u, v) e (v, u) gerem a mesma chave.
+    
+    Args:
+        u (np.ndarray): Vértices de origem
+        v (np.ndarray): Vértices de destino
+        numV (int): Número de vértices
+        dirigido (bool): Se o grafo é dirigido
+    
+    Returns:
+        np.ndarray: Chaves int64 ``u * numV + v``
+    
+    Example:
+        >>> codificaArestas(np.array([3, 1]), np.array([1, 2]), 5)
+        array([8, 7])
+    """
+    u = np.asarray(u, dtype=np.int64)
+    v = np.asarray(v, dtype=np.int64)
+    if not dirigido:
+        u, v = np.minimum(u, v), np.maximum(u, v)
+    return u * numV + v
+
+
+def decodificaChaves(chaves, numV):
+    """Decodifica chaves int64 de volta para os vetores (u, v)."""
+    chaves = np.asarray(chaves, dtype=np.int64)
+    return chaves // numV, chaves % numV
+
+
+def chavesParaTuplas(chaves, numV):
+    """Converte chaves codificadas em lista de tuplas (u, v) de inteiros Python."""
+    u, v = decodificaChaves(chaves, numV)
+    return list(zip(u.tolist(), v.tolist()))
+
+
+def decodificaIndicesPares(indices, numV, dirigido=False, ordenados=False):
+    """
+    Decodifica índices do espaço de pares em vetores (u, v).
+    
+    O espaço de pares é enumerado em ordem lexicográfica:
+    - Não dirigido: pares u < v, totalizando numV(numV-1)/2 índices
+    - Dirigido: pares u != v, totalizando numV(numV-1) índices
+    
+    Índices ordenados produzem, portanto, arestas ordenadas.
+    
+    Com ordenados=True (indices em ordem crescente), a linha u de cada índice
+    vem de uma busca binária dos numV deslocamentos de linha nos índices e de
+    np.repeat, em O(E + numV log E), sem a raiz quadrada em ponto flutuante.
+    
+    Args:
+        indices (np.ndarray): Índices no intervalo [0, total de pares)
+        numV (int): Número de vértices
+        dirigido (bool): Se o espaço é de pares ordenados
+        ordenados (bool): Se indices está em ordem crescente
+    
+    Returns:
+        tuple: (u, v) como vetores int64
+    
+    Example:
+        >>> decodificaIndicesPares(np.array([0, 1, 3]), 4)
+        (array([0, 0, 1]), array([1, 2, 2]))
+    """
+    k = np.asarray(indices, dtype=np.int64)
+    if ordenados:
+        linhas = np.arange(numV, dtype=np.int64)
+        if dirigido:
+            deslocamentos = linhas * (numV - 1)
+        else:
+            deslocamentos = linhas * (2 * numV - linhas - 1) // 2
+        contagens = np.diff(np.searchsorted(k, deslocamentos), append=k.size)
+        u = np.repeat(linhas, contagens)
+        r = k - deslocamentos[u]
+        if dirigido:
+            return u, r + (r >= u)
+        return u, r + u + 1
+    
+    if dirigido:
+        u = k // (numV - 1)
+        r = k % (numV - 1)
+        v = r + (r >= u)
+        return u, v
+    
+    # Linha u começa no deslocamento u(2numV - u - 1)/2; inverte pela raiz
+    b = 2 * numV - 1
+    u = ((b - np.sqrt(b * b - 8.0 * k)) // 2).astype(np.int64)
+    # Corrige erros de arredondamento do ponto flutuante
+    deslocamento = u * (b - u) // 2
+    u -= deslocamento > k
+    deslocamento = u * (b - u) // 2
+    proximo = (u + 1) * (b - u - 1) // 2
+    u += proximo <= k
+    deslocamento = u * (b - u) // 2
+    v = k - deslocamento + u + 1
+    return u, v
+
+
+def codificaIndicesPares(u, v, numV, dirigido=False):
+    """
+    Inversa de decodificaIndicesPares: índice de (u, v) no espaço de pares.
+    
+    Para grafos não dirigidos os pares devem estar normalizados (u < v).
+    
+    Example:
+        >>> codificaIndicesPares(np.array([0, 0, 1]), np.array([1, 2, 2]), 4)
+        array([0, 1, 3])
+    """
+    u = np.asarray(u, dtype=np.int64)
+    v = np.asarray(v, dtype=np.int64)
+    if dirigido:
+        return u * (numV - 1) + v - (v > u)
+    return u * (2 * numV - u - 1) // 2 + (v - u - 1)
+
+
+def tipoVertices(numV):
+    """Menor tipo inteiro (int32 ou int64) capaz de representar numV vértices."""
+    return np.int32 if numV <= np.iinfo(np.int32).max else np.int64
+
+
+def arestasParaArray(u, v, numV, ordenar=True):
+    """
+    Monta o array contíguo (E, 2) de arestas a partir dos vetores (u, v).
+    
+    A ordenação lexicográfica é feita sobre as chaves int64 ``u * numV + v``
+    (sem normalizar a orientação), com um único np.sort, e equivale a
+    ``sorted`` sobre a lista de tuplas correspondente.
+    
+    Args:
+        u (np.ndarray): Vértices de origem
+        v (np.ndarray): Vértices de destino
+        numV (int): Número de vértices
+        ordenar (bool): Se False, mantém a ordem recebida (arestas já ordenadas)
+    
+    Returns:
+        np.ndarray: Array (E, 2) int32, ou int64 se numV não cabe em int32
+    
+    Example:
+        >>> arestasParaArray(np.array([2, 0]), np.array([1, 3]), 4)
+        array([[0, 3],
+               [2, 1]], dtype=int32)
+    """
+    u = np.asarray(u)
+    v = np.asarray(v)
+    saida = np.empty((u.size, 2), dtype=tipoVertices(numV))
+    if not ordenar:
+        saida[:, 0] = u
+        saida[:, 1] = v
+        return saida
+    
+    chaves = np.multiply(u, numV, dtype=np.int64)
+    chaves += v
+    chaves.sort()
+    # Decodifica por blocos para não alocar dois vetores int64 do tamanho total
+    for ini in range(0, chaves.size, _LOTE_DECODIFICA):
+        bloco = chaves[ini:ini + _LOTE_DECODIFICA]
+        saida[ini:ini + bloco.size, 0] = bloco // numV
+        saida[ini:ini + bloco.size, 1] = bloco % numV
+    return saida
+
+
+def tuplasParaArray(arestas, numV, ordenar=True):
+    """Converte uma lista de tuplas (u, v) no array (E, 2) de arestasParaArray."""
+    pares = np.asarray(arestas, dtype=np.int64).reshape(-1, 2)
+    return arestasParaArray(pares[:, 0], pares[:, 1], numV, ordenar)
+
+
+def arrayParaTuplas(arestas):
+    """Visão de compatibilidade: array (E, 2) como lista de tuplas (u, v) de inteiros Python."""
+    arestas = np.asarray(arestas)
+    return list(zip(arestas[:, 0].tolist(), arestas[:, 1].tolist()))
+
+
+def unicosOrdenados(valores):
+    """
+    Valores distintos em ordem crescente (equivale a np.unique para vetores 1-D).
+    
+    Ordena no próprio vetor e compara vizinhos; evita o caminho por hash de
+    np.unique, mais lento para vetores grandes de inteiros aleatórios.
+    """
+    valores = np.sort(np.asarray(valores))
+    if valores.size == 0:
+        return valores
+    primeiros = np.empty(valores.size, dtype=bool)
+    primeiros[0] = True
+    np.not_equal(valores[1:], valores[:-1], out=primeiros[1:])
+    return valores[primeiros]
+
+
+def temChaveRepetida(chaves):
+    """Indica se o vetor de chaves contém algum valor repetido (ordenando uma cópia)."""
+    ordenadas = np.sort(np.asarray(chaves))
+    return bool(np.any(ordenadas[1:] == ordenadas[:-1]))
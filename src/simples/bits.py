@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Conjuntos e matrizes de adjacência compactados em bits.
+
+Cada elemento (ou par de vértices) ocupa um único bit em um vetor uint8, no
+mesmo layout de ``np.packbits(..., bitorder='little')``. As operações de
+teste e marcação são vetorizadas sobre lotes de candidatos, o que permite
+verificar unicidade de arestas sem conjuntos Python de tuplas nem matrizes
+densas de inteiros.
+
+Memória para numV vértices (matriz completa numV × numV):
+- matriz int64: 8 * numV² bytes (10k vértices: 800 MB)
+- set de tuplas: ~100 bytes por aresta presente
+- MatrizAdjacenciaBits: numV² / 8 bytes (10k vértices: 12,5 MB)
+"""
+import numpy as np
+
+from arestas import codificaArestas, unicosOrdenados
+
+
+def _mascaras(indices):
+    """Byte e máscara de bit de cada índice."""
+    return indices >> 3, np.left_shift(1, indices & 7).astype(np.uint8)
+
+
+class ConjuntoBits:
+    """
+    Conjunto de inteiros em [0, tamanho) com um bit por elemento.
+
+    Args:
+        tamanho (int): Tamanho do universo de índices
+
+    Example:
+        >>> conjunto = ConjuntoBits(100)
+        >>> conjunto.testaEMarca(np.array([5, 7, 5, 9]))
+        array([ True,  True, False,  True])
+        >>> conjunto.testaEMarca(np.array([9, 10]))
+        array([False,  True])
+    """
+
+    def __init__(self, tamanho):
+        self.tamanho = int(tamanho)
+        self.bits = np.zeros((self.tamanho + 7) // 8, dtype=np.uint8)
+
+    @property
+    def nbytes(self):
+        """Memória ocupada pelos bits, em bytes."""
+        return self.bits.nbytes
+
+    def __len__(self):
+        """Número de elementos marcados."""
+        return int(np.unpackbits(self.bits).sum())
+
+    def __contains__(self, indice):
+        return bool((self.bits[indice >> 3] >> (indice & 7)) & 1)
+
+    def adiciona(self, indice):
+        """Marca um único índice (uso em laços escalares)."""
+        self.bits[indice >> 3] |= 1 << (indice & 7)
+
+    def contem(self, indices):
+        """Vetor booleano indicando quais índices já estão marcados."""
+        posicoes, mascaras = _mascaras(np.asarray(indices, dtype=np.int64))
+        return (self.bits[posicoes] & mascaras) != 0
+
+    def marca(self, indices, ordenados=False):
+        """
+        Marca um lote de índices.
+
+        Índices que caem no mesmo byte têm suas máscaras combinadas com
+        ``np.bitwise_or.reduceat`` antes da escrita, de modo que nenhuma
+        marcação do lote se perde. Com ordenados=True, indices já está
+        ordenado e sem repetições.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        if not ordenados:
+            indices = unicosOrdenados(indices)
+        posicoes, mascaras = _mascaras(indices)
+        inicios = np.flatnonzero(np.diff(posicoes, prepend=-1))
+        if inicios.size:
+            self.bits[posicoes[inicios]] |= np.bitwise_or.reduceat(mascaras, inicios)
+
+    def ineditos(self, indices):
+        """Índices distintos do lote ainda não marcados, em ordem crescente (sem marcar)."""
+        indices = unicosOrdenados(np.asarray(indices, dtype=np.int64))
+        return indices[~self.contem(indices)]
+
+    def testaEMarca(self, indices):
+        """
+        Teste-e-marca vetorizado de um lote, preservando a ordem do lote.
+
+        Returns:
+            np.ndarray: Vetor booleano com True para cada índice que não estava
+            marcado e é a primeira ocorrência no lote; esses índices são marcados
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        ordem = np.argsort(indices, kind='stable')
+        ordenados = indices[ordem]
+        novos = np.empty(indices.size, dtype=bool)
+        if indices.size:
+            novos[0] = True
+            np.not_equal(ordenados[1:], ordenados[:-1], out=novos[1:])
+            novos &= ~self.contem(ordenados)
+            self.marca(ordenados[novos], ordenados=True)
+        resultado = np.empty(indices.size, dtype=bool)
+        resultado[ordem] = novos
+        return resultado
+
+
+class MatrizAdjacenciaBits(ConjuntoBits):
+    """
+    Matriz de adjacência numV × numV com um bit por par (u, v).
+
+    O par (u, v) ocupa o bit ``u * numV + v`` (ver ``arestas.codificaArestas``);
+    em grafos não dirigidos o par é normalizado para u <= v. Laços são
+    representáveis.
+
+    Args:
+        numV (int): Número de vértices
+        dirigido (bool): Se (u, v) e (v, u) são pares distintos
+    """
+
+    def __init__(self, numV, dirigido=False):
+        super().__init__(numV * numV)
+        self.numV = numV
+        self.dirigido = dirigido
+
+    def _chaves(self, u, v):
+        return codificaArestas(u, v, self.numV, self.dirigido)
+
+    def existe(self, u, v):
+        """Verifica um único par (uso em laços escalares)."""
+        if not self.dirigido and u > v:
+            u, v = v, u
+        return (u * self.numV + v) in self
+
+    def adicionaAresta(self, u, v):
+        """Marca um único par (uso em laços escalares)."""
+        if not self.dirigido and u > v:
+            u, v = v, u
+        self.adiciona(u * self.numV + v)
+
+    def contemArestas(self, u, v):
+        """Vetor booleano indicando quais pares já estão marcados."""
+        return self.contem(self._chaves(u, v))
+
+    def marcaArestas(self, u, v):
+        """Marca um lote de pares."""
+        self.marca(self._chaves(u, v))
+
+    def testaEMarcaArestas(self, u, v):
+        """Teste-e-marca vetorizado de um lote de pares (ver ConjuntoBits.testaEMarca)."""
+        return self.testaEMarca(self._chaves(u, v))
@@ -49,6 +49,9 @@ DENSIDADE = {
     2: "Denso (densidade ≥ 0.8)"    # Prefere grafos densos
 }
 
+# Formatos de saída das arestas
+FORMATOS_ARESTAS = ('tuplas', 'array')  # Lista de tuplas (u, v) ou array NumPy (E, 2)
+
 # =============================================================================
 # PARÂMETROS PADRÃO
 # =============================================================================
@@ -56,6 +59,14 @@ DENSIDADE = {
 # Limites de tentativas e amostras
 MAX_TENTATIVAS = 1000       # Máximo de tentativas para gerar grafo válido
 MAX_AMOSTRAS_HOP = 10000    # Máximo de amostras para cálculo de distâncias
+LOTE_MAX_CANDIDATOS = 1 << 22  # Máximo de pares candidatos sorteados por lote (NumPy)
+LIMIAR_DENSIDADE_COMPLEMENTO = 0.5  # Acima disso, sorteia as arestas ausentes (complemento)
+LIMIAR_TAXA_REJEICAO = 0.5  # Taxa de rejeição por lote que faz o modo 'auto' trocar para o complemento
+MEMORIA_MAX_BITSET = 1 << 26  # Bytes máximos do bitset de pares no modo 'auto' (64 MB)
+METODOS_GERACAO = ('auto', 'rejeicao', 'indice', 'complemento', 'bitset')  # Algoritmos para tipos 0 e 1
+ARESTAS_MAX_REPLICAS_LOTE = 2048  # Até este numA, geraReplicas gera as réplicas em conjunto
+MEMORIA_MAX_DISCO = 1 << 30  # Orçamento de memória (bytes) da geração em disco (1 GB)
+FORMATOS_LOTE = ('npy', 'npz', 'txt')  # Formatos de arquivo da geração em lote (lote.py)
 
 # Pesos padrão para grafos valorados
 PESO_MIN_PADRAO = 1         # Peso mínimo das arestas
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Geração de grafos em disco, com memória limitada.
+
+As arestas são gravadas por blocos em um arquivo .npy mapeado em memória
+(np.lib.format.open_memmap), de forma que o grafo pode ser maior que a RAM.
+Nenhuma etapa mantém em memória mais que ~memoria_max bytes:
+
+- Multigrafos e pseudografos (tipos 20, 21, 30, 31): os pares são sorteados
+  em blocos; cada bloco é ordenado por chave (arestas.codificaArestas) e
+  gravado como uma sequência ordenada, e as sequências são intercaladas
+  (ordenação externa) no arquivo final.
+- Grafos simples e digrafos (tipos 0 e 1): índices i.i.d. do espaço de pares
+  (arestas.decodificaIndicesPares) passam pela mesma ordenação externa,
+  agora com remoção de repetidos. Como o conjunto de distintos de sorteios
+  i.i.d., dado seu tamanho, é uniforme, o excedente é descartado em posições
+  uniformes e o resultado é uma amostra uniforme sem reposição. Acima de
+  LIMIAR_DENSIDADE_COMPLEMENTO, amostra-se o complemento.
+
+O arquivo resultante é lido com np.load(caminho, mmap_mode='r'). Em disco,
+ocupa 8 bytes por aresta (int32) ou 16 (int64), mais ~16 bytes por aresta em
+arquivos temporários durante a geração.
+"""
+import math
+import os
+import tempfile
+import numpy as np
+
+from constants import (
+    TIPOS_VALIDOS, TIPOS_DIRIGIDOS, TIPOS_PSEUDOGRAFOS,
+    LIMIAR_DENSIDADE_COMPLEMENTO, MEMORIA_MAX_DISCO
+)
+from exceptions import ParametrosInvalidosError, ArestasInsuficientesError
+from arestas import codificaArestas, decodificaChaves, decodificaIndicesPares, tipoVertices
+from gerador import comoGenerator, sorteiaPares
+from estatisticas import EstatisticasArestas
+
+# Memória de trabalho por chave em um bloco (chave, vértices e temporários)
+_BYTES_POR_CHAVE = 64
+
+
+def intercalaSequencias(sequencias, lote):
+    """
+    Intercala sequências ordenadas de chaves int64 (arrays ou memmaps).
+    
+    Cada sequência é lida em blocos de até lote chaves. A cada passo, o
+    menor dos últimos valores em memória é um limite seguro: nenhuma chave
+    ainda não lida é menor que ele, então todas as chaves em memória até o
+    limite saem ordenadas. Cada passo esgota ao menos um bloco.
+    
+    Yields:
+        np.ndarray: Blocos ordenados; a concatenação é a intercalação completa
+    """
+    posicoes = [0] * len(sequencias)
+    blocos = [np.empty(0, dtype=np.int64) for _ in sequencias]
+    while True:
+        for k, seq in enumerate(sequencias):
+            if blocos[k].size == 0 and posicoes[k] < len(seq):
+                blocos[k] = np.asarray(seq[posicoes[k]:posicoes[k] + lote], dtype=np.int64)
+                posicoes[k] += blocos[k].size
+        ativos = [k for k in range(len(sequencias)) if blocos[k].size]
+        if not ativos:
+            return
+        
+        limite = min(blocos[k][-1] for k in ativos)
+        partes = []
+        for k in ativos:
+            n = np.searchsorted(blocos[k], limite, side='right')
+            partes.append(blocos[k][:n])
+            blocos[k] = blocos[k][n:]
+        yield np.sort(np.concatenate(partes))
+
+
+def _unicos(blocos):
+    """Remove chaves repetidas de blocos ordenados (inclusive entre blocos)."""
+    ultima = None
+    for chaves in blocos:
+        if chaves.size == 0:
+            continue
+        novas = np.empty(chaves.size, dtype=bool)
+        novas[0] = ultima is None or chaves[0] != ultima
+        np.not_equal(chaves[1:], chaves[:-1], out=novas[1:])
+        ultima = chaves[-1]
+        yield chaves[novas]
+
+
+def _gravaBlocos(blocos, destino):
+    """Grava blocos consecutivos em destino; retorna o total gravado."""
+    total = 0
+    for bloco in blocos:
+        destino[total:total + bloco.size] = bloco
+        total += bloco.size
+    return total
+
+
+def _sequenciasOrdenadas(destino, sorteia, quantidade, lote):
+    """
+    Preenche destino com quantidade chaves de sorteia(n), em sequências de
+    até lote chaves ordenadas individualmente.
+    
+    Returns:
+        list: Visões de destino, uma por sequência ordenada
+    """
+    sequencias = []
+    for inicio in range(0, quantidade, lote):
+        chaves = sorteia(min(lote, quantidade - inicio))
+        chaves.sort()
+        destino[inicio:inicio + chaves.size] = chaves
+        sequencias.append(destino[inicio:inicio + chaves.size])
+    return sequencias
+
+
+def amostraDistintosEmDisco(total, quantidade, gen, pasta, memoria_max=MEMORIA_MAX_DISCO):
+    """
+    Amostra quantidade inteiros distintos de [0, total), em ordem crescente, em disco.
+    
+    A cada rodada, sorteia inteiros i.i.d. em número suficiente para que o
+    número esperado de inéditos supere o que falta por ~6 desvios-padrão, e
+    os intercala (sem repetidos) com os distintos da rodada anterior. O
+    excedente é removido em posições sorteadas uniformemente. Por simetria,
+    o resultado é uma amostra uniforme sem reposição.
+    
+    Args:
+        total (int): Tamanho do universo
+        quantidade (int): Número de distintos (no máximo total)
+        gen (np.random.Generator): Gerador de números aleatórios
+        pasta (str): Diretório dos arquivos temporários
+        memoria_max (int): Orçamento de memória em bytes
+    
+    Returns:
+        np.memmap: Vetor int64 ordenado com quantidade inteiros distintos
+    """
+    lote = max(1, memoria_max // _BYTES_POR_CHAVE)
+    distintos = np.empty(0, dtype=np.int64)
+    rodada = 0
+    while distintos.size < quantidade:
+        faltam = quantidade - distintos.size
+        livres = total - distintos.size
+        margem = min(int(6 * math.sqrt(faltam)) + 64, (livres - faltam) // 2)
+        # Sorteios i.i.d. com faltam + margem inéditos esperados (fração < 1
+        # mesmo se quantidade == total)
+        fracao = min((faltam + margem) / livres, 1 - 1 / (2 * livres))
+        sorteios = max(faltam, math.ceil(-total * math.log1p(-fracao)))
+        
+        candidatos = np.lib.format.open_memmap(
+            os.path.join(pasta, f'candidatos_{rodada}.npy'), mode='w+', dtype=np.int64, shape=(sorteios,)
+        )
+        sequencias = _sequenciasOrdenadas(
+            candidatos, lambda n: gen.integers(0, total, size=n, dtype=np.int64), sorteios, lote
+        )
+        if distintos.size:
+            sequencias.append(distintos)
+        
+        destino = np.lib.format.open_memmap(
+            os.path.join(pasta, f'distintos_{rodada}.npy'), mode='w+', dtype=np.int64,
+            shape=(distintos.size + sorteios,)
+        )
+        lote_intercalacao = max(1, lote // (len(sequencias) + 1))
+        gravados = _gravaBlocos(_unicos(intercalaSequencias(sequencias, lote_intercalacao)), destino)
+        distintos = destino[:gravados]
+        rodada += 1
+    
+    excesso = distintos.size - quantidade
+    if excesso == 0:
+        return distintos
+    
+    remover = np.sort(gen.choice(distintos.size, excesso, replace=False))
+    amostra = np.lib.format.open_memmap(
+        os.path.join(pasta, 'amostra.npy'), mode='w+', dtype=np.int64, shape=(quantidade,)
+    )
+    gravados = 0
+    for inicio in range(0, distintos.size, lote):
+        bloco = np.asarray(distintos[inicio:inicio + lote])
+        mantidos = np.ones(bloco.size, dtype=bool)
+        a, b = np.searchsorted(remover, (inicio, inicio + bloco.size))
+        mantidos[remover[a:b] - inicio] = False
+        bloco = bloco[mantidos]
+        amostra[gravados:gravados + bloco.size] = bloco
+        gravados += bloco.size
+    return amostra
+
+
+def _gravaArestas(saida, inicio, u, v):
+    """Grava os vetores (u, v) nas linhas de saida a partir de inicio."""
+    saida[inicio:inicio + u.size, 0] = u
+    saida[inicio:inicio + u.size, 1] = v
+    return inicio + u.size
+
+
+def _insereOrdenada(saida, n, aresta, lote):
+    """
+    Insere aresta em saida[:n + 1], mantendo a ordem lexicográfica de saida[:n].
+    
+    A posição é obtida por busca binária nas linhas, e a cauda é deslocada
+    em blocos, do fim para o início. Retorna se a aresta já estava em
+    saida[:n] (as cópias iguais ficam logo antes da posição de inserção).
+    """
+    alvo = (int(aresta[0]), int(aresta[1]))
+    esq, direita = 0, n
+    while esq < direita:
+        meio = (esq + direita) // 2
+        if (int(saida[meio, 0]), int(saida[meio, 1])) <= alvo:
+            esq = meio + 1
+        else:
+            direita = meio
+    fim = n
+    while fim > esq:
+        inicio = max(esq, fim - lote)
+        saida[inicio + 1:fim + 1] = np.array(saida[inicio:fim])
+        fim = inicio
+    saida[esq] = alvo
+    return esq > 0 and (int(saida[esq - 1, 0]), int(saida[esq - 1, 1])) == alvo
+
+
+def geraGrafoEmDisco(tipo, numV, numA, caminho, rng=None, memoria_max=MEMORIA_MAX_DISCO, estatisticas=False):
+    """
+    Gera um grafo sem componentes (numC <= 1) diretamente em um arquivo .npy.
+    
+    A distribuição é a dos geradores em memória (geraGrafoSimples,
+    geraGrafoDirigido, geraMultigrafo, geraPseudografo), mas as sequências
+    aleatórias são outras: o mesmo rng não reproduz o grafo de geraDataset.
+    
+    Args:
+        tipo (int): Tipo do grafo (0, 1, 20, 21, 30, 31)
+        numV (int): Número de vértices
+        numA (int): Número de arestas
+        caminho (str): Arquivo .npy de saída (os temporários ficam no mesmo
+            diretório e são removidos ao final)
+        rng: random.Random ou np.random.Generator (ver gerador.comoGenerator)
+        memoria_max (int): Orçamento de memória em bytes
+        estatisticas (bool): Se True, acumula graus e contagens básicas
+            (estatisticas.EstatisticasArestas) enquanto os blocos são gravados
+    
+    Returns:
+        np.memmap: Array (numA, 2) int32/int64 somente leitura, com as arestas
+        em ordem lexicográfica, ou a tupla (arestas, EstatisticasArestas) com
+        estatisticas=True
+    
+    Raises:
+        ParametrosInvalidosError: Se o tipo de grafo é inválido
+        ArestasInsuficientesError: Se numA não é compatível com o tipo
+    
+    Example:
+        >>> arestas = geraGrafoEmDisco(0, 100_000, 5 * 10**7, 'grafo.npy', rng=np.random.default_rng(42),
+        ...                            memoria_max=256 << 20)
+        >>> graus = grausEmDisco(arestas, 100_000)
+    """
+    if tipo not in TIPOS_VALIDOS:
+        raise ParametrosInvalidosError(f"Tipo de grafo inválido: {tipo}")
+    gen = comoGenerator(rng)
+    dirigido = tipo in TIPOS_DIRIGIDOS
+    lacos = tipo in TIPOS_PSEUDOGRAFOS
+    lote = max(1, memoria_max // _BYTES_POR_CHAVE)
+    acumulador = EstatisticasArestas(numV, dirigido) if estatisticas else None
+    
+    def grava(inicio, u, v):
+        if acumulador is not None:
+            acumulador.adiciona(u, v, ordenadas=True)
+        return _gravaArestas(saida, inicio, u, v)
+    
+    if tipo in (0, 1):
+        total_pares = numV * (numV - 1) if dirigido else numV * (numV - 1) // 2
+        if numA > total_pares:
+            raise ArestasInsuficientesError(
+                f"Número de arestas ({numA}) excede o máximo de {total_pares} para o tipo {tipo}"
+            )
+    elif lacos and (numV < 1 or numA < 1):
+        raise ArestasInsuficientesError(
+            f"Pseudografo exige ao menos 1 vértice e 1 aresta (recebidos {numV} vértices e {numA} arestas)"
+        )
+    elif not lacos and (numV < 2 or numA < 2):
+        raise ArestasInsuficientesError(
+            f"Multigrafo exige ao menos 2 vértices e 2 arestas (recebidos {numV} vértices e {numA} arestas)"
+        )
+    
+    saida = np.lib.format.open_memmap(caminho, mode='w+', dtype=tipoVertices(numV), shape=(numA, 2))
+    pasta = os.path.dirname(os.path.abspath(caminho))
+    with tempfile.TemporaryDirectory(dir=pasta) as temporaria:
+        if tipo in (0, 1):
+            complemento = numA / total_pares > LIMIAR_DENSIDADE_COMPLEMENTO if total_pares else False
+            alvo = total_pares - numA if complemento else numA
+            indices = amostraDistintosEmDisco(total_pares, alvo, gen, temporaria, memoria_max)
+            gravadas = 0
+            if complemento:
+                # Percorre o espaço de pares omitindo os ausentes sorteados
+                for inicio in range(0, total_pares, lote):
+                    fim = min(total_pares, inicio + lote)
+                    presentes = np.ones(fim - inicio, dtype=bool)
+                    a, b = np.searchsorted(indices, (inicio, fim))
+                    presentes[np.asarray(indices[a:b]) - inicio] = False
+                    u, v = decodificaIndicesPares(np.flatnonzero(presentes) + inicio, numV, dirigido)
+                    gravadas = grava(gravadas, u, v)
+            else:
+                for inicio in range(0, numA, lote):
+                    u, v = decodificaIndicesPares(np.asarray(indices[inicio:inicio + lote]), numV, dirigido)
+                    gravadas = grava(gravadas, u, v)
+            del indices
+        else:
+            # As numA - 1 primeiras arestas são i.i.d.; a última garante a
+            # aresta múltipla ou o laço, como em geraMultigrafo/geraPseudografo
+            tem_laco = False
+            
+            def sorteia(n):
+                nonlocal tem_laco
+                u, v = sorteiaPares(numV, n, gen, lacos, dirigido)
+                tem_laco = tem_laco or bool(np.any(u == v))
+                return codificaArestas(u, v, numV, dirigido=True)
+            
+            chaves = np.lib.format.open_memmap(
+                os.path.join(temporaria, 'chaves.npy'), mode='w+', dtype=np.int64, shape=(numA - 1,)
+            )
+            sequencias = _sequenciasOrdenadas(chaves, sorteia, numA - 1, lote)
+            gravadas = 0
+            repetidas = False
+            ultima = None
+            for bloco in intercalaSequencias(sequencias, max(1, lote // (len(sequencias) + 1))):
+                if bloco.size == 0:
+                    continue
+                repetidas = repetidas or ultima == bloco[0] or bool(np.any(bloco[1:] == bloco[:-1]))
+                ultima = bloco[-1]
+                gravadas = grava(gravadas, *decodificaChaves(bloco, numV))
+            del sequencias, chaves
+            
+            if lacos and not tem_laco:
+                w = gen.integers(0, numV)
+                aresta = (w, w)
+            elif not lacos and not repetidas:
+                aresta = tuple(saida[gen.integers(0, numA - 1)])
+            else:
+                u, v = sorteiaPares(numV, 1, gen, lacos, dirigido)
+                aresta = (u[0], v[0])
+            repetida = _insereOrdenada(saida, numA - 1, aresta, lote)
+            if acumulador is not None:
+                acumulador.adicionaAresta(int(aresta[0]), int(aresta[1]), repetida)
+    
+    saida.flush()
+    del saida
+    arestas = np.load(caminho, mmap_mode='r')
+    return (arestas, acumulador) if estatisticas else arestas
+
+
+def grausEmDisco(arestas, numV, memoria_max=MEMORIA_MAX_DISCO):
+    """
+    Grau de cada vértice de um array de arestas (E, 2), lido em blocos.
+    
+    Conta as duas pontas de cada aresta (grau total em dirigidos; laços
+    contam 2 e arestas múltiplas contam todas as cópias).
+    
+    Returns:
+        np.ndarray: Vetor int64 de numV graus
+    """
+    lote = max(1, memoria_max // _BYTES_POR_CHAVE)
+    graus = np.zeros(numV, dtype=np.int64)
+    for inicio in range(0, len(arestas), lote):
+        bloco = np.asarray(arestas[inicio:inicio + lote])
+        graus += np.bincount(bloco[:, 0], minlength=numV)
+        graus += np.bincount(bloco[:, 1], minlength=numV)
+    return graus
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Estatísticas básicas de um grafo a partir das arestas, atualizadas por blocos.
+
+As métricas básicas de um grafo (número de arestas, densidade, graus, laços
+e arestas múltiplas) dependem apenas de contadores por vértice e de somas,
+que podem ser atualizados bloco a bloco. Em memória, geraDataset calcula
+esses contadores em uma passada NumPy sobre as arestas depois da geração
+(estatisticasGrafo); em disco, geraGrafoEmDisco os acumula à medida que os
+blocos são gravados, sem nunca carregar o grafo em memória. Em ambos os
+casos o estágio de métricas não precisa montar o grafo NetworkX.
+
+Os valores seguem a convenção do grafo NetworkX (nx.Graph / nx.DiGraph)
+montado pelos experimentos: arestas múltiplas contam uma única vez em
+num_arestas, densidade e graus, e um laço soma 2 ao grau do vértice. As
+cópias e os laços gerados são informados à parte.
+"""
+import numpy as np
+
+from arestas import codificaArestas
+
+
+class EstatisticasArestas:
+    """
+    Acumuladores de graus e contagens de um grafo, atualizados por blocos.
+
+    Repetições entre blocos são detectadas quando os blocos chegam em ordem
+    crescente de chave (adiciona com ordenadas=True, como na intercalação de
+    disco.geraGrafoEmDisco); um bloco avulso é ordenado internamente.
+
+    Args:
+        numV (int): Número de vértices
+        dirigido (bool): Se (u, v) e (v, u) são arestas distintas
+
+    Attributes:
+        graus (np.ndarray): Grau de cada vértice (int64), sem contar cópias
+        num_arestas (int): Arestas geradas, incluindo cópias
+        num_distintas (int): Arestas distintas
+        num_lacos (int): Laços gerados, incluindo cópias
+
+    Example:
+        >>> est = EstatisticasArestas(4)
+        >>> est.adiciona(np.array([0, 0, 1]), np.array([1, 1, 1]))
+        >>> est.num_distintas, est.num_lacos, est.graus.tolist()
+        (2, 1, [1, 3, 0, 0])
+    """
+
+    def __init__(self, numV, dirigido=False):
+        self.numV = int(numV)
+        self.dirigido = dirigido
+        self.graus = np.zeros(self.numV, dtype=np.int64)
+        self.num_arestas = 0
+        self.num_distintas = 0
+        self.num_lacos = 0
+        self._ultima = None
+
+    def adiciona(self, u, v, ordenadas=False):
+        """
+        Acumula um bloco de arestas (vetores u, v).
+
+        Com ordenadas=True, as chaves do bloco (arestas.codificaArestas) estão
+        em ordem crescente e não são menores que as do bloco anterior, e uma
+        aresta repetida na fronteira entre blocos conta como cópia.
+        """
+        chaves = codificaArestas(u, v, self.numV, self.dirigido)
+        if chaves.size == 0:
+            return
+        if not ordenadas:
+            if np.any(chaves[1:] < chaves[:-1]):
+                chaves = np.sort(chaves)
+            self._ultima = None
+        novas = np.empty(chaves.size, dtype=bool)
+        novas[0] = self._ultima is None or chaves[0] != self._ultima
+        np.not_equal(chaves[1:], chaves[:-1], out=novas[1:])
+        self._ultima = chaves[-1]
+
+        distintas = chaves[novas]
+        origem, destino = distintas // self.numV, distintas % self.numV
+        self.graus += np.bincount(origem, minlength=self.numV)
+        self.graus += np.bincount(destino, minlength=self.numV)
+        self.num_arestas += int(chaves.size)
+        self.num_distintas += int(distintas.size)
+        self.num_lacos += int(np.count_nonzero(chaves // self.numV == chaves % self.numV))
+
+    def adicionaAresta(self, u, v, repetida):
+        """
+        Acumula uma aresta avulsa, fora da ordem dos blocos.
+
+        repetida informa se ela já foi acumulada antes (é uma cópia).
+        """
+        self.num_arestas += 1
+        self.num_lacos += int(u == v)
+        if not repetida:
+            self.num_distintas += 1
+            self.graus[u] += 1
+            self.graus[v] += 1
+
+    @property
+    def num_arestas_multiplas(self):
+        """Cópias além da primeira ocorrência de cada aresta."""
+        return self.num_arestas - self.num_distintas
+
+    def densidade(self):
+        """Arestas distintas sobre o máximo de pares sem laços."""
+        max_arestas = self.numV * (self.numV - 1)
+        if not self.dirigido:
+            max_arestas //= 2
+        return self.num_distintas / max_arestas if max_arestas > 0 else 0.0
+
+    def metricas(self):
+        """
+        Métricas básicas e de grau, com os nomes usados pelos experimentos.
+
+        Returns:
+            dict: num_vertices, num_arestas, densidade, grau_medio, grau_max,
+            grau_min, grau_desvio, grau_mediana, num_arestas_geradas,
+            num_lacos e num_arestas_multiplas
+        """
+        metricas = {
+            'num_vertices': self.numV,
+            'num_arestas': self.num_distintas,
+            'densidade': self.densidade(),
+        }
+        if self.numV > 0:
+            metricas['grau_medio'] = float(np.mean(self.graus))
+            metricas['grau_max'] = int(self.graus.max())
+            metricas['grau_min'] = int(self.graus.min())
+            metricas['grau_desvio'] = float(np.std(self.graus))
+            metricas['grau_mediana'] = float(np.median(self.graus))
+        else:
+            metricas['grau_medio'] = metricas['grau_max'] = metricas['grau_min'] = 0
+            metricas['grau_desvio'] = metricas['grau_mediana'] = 0
+        metricas['num_arestas_geradas'] = self.num_arestas
+        metricas['num_lacos'] = self.num_lacos
+        metricas['num_arestas_multiplas'] = self.num_arestas_multiplas
+        return metricas
+
+
+def estatisticasGrafo(arestas, numV, dirigido=False):
+    """
+    EstatisticasArestas de um grafo já gerado.
+
+    Args:
+        arestas: Array (E, 2) ou lista de tuplas (u, v)
+        numV (int): Número de vértices
+        dirigido (bool): Se o grafo é dirigido
+
+    Returns:
+        EstatisticasArestas: Acumuladores com todas as arestas
+    """
+    estatisticas = EstatisticasArestas(numV, dirigido)
+    arestas = np.asarray(arestas, dtype=np.int64).reshape(-1, 2)
+    estatisticas.adiciona(arestas[:, 0], arestas[:, 1])
+    return estatisticas
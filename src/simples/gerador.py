@@ -4,15 +4,93 @@ import random
 import math
 import numpy as np
 import time
+from concurrent.futures import ProcessPoolExecutor
 from constants import (
-    TIPOS_DIRIGIDOS, TIPOS_MULTIGRAFOS, TIPOS_PSEUDOGRAFOS,
-    MAX_TENTATIVAS
+    TIPOS_VALIDOS, TIPOS_DIRIGIDOS, TIPOS_MULTIGRAFOS, TIPOS_PSEUDOGRAFOS,
+    MAX_TENTATIVAS, LOTE_MAX_CANDIDATOS, LIMIAR_DENSIDADE_COMPLEMENTO, FORMATOS_ARESTAS,
+    LIMIAR_TAXA_REJEICAO, MEMORIA_MAX_BITSET, METODOS_GERACAO, ARESTAS_MAX_REPLICAS_LOTE,
+    PESO_MIN_PADRAO, PESO_MAX_PADRAO
 )
 from exceptions import (
     ParametrosInvalidosError, TentativasExcedidasError,
     ArestasInsuficientesError, ComponentesInvalidasError
 )
 from utils import tipoGrafo, compConexas
+from arestas import (
+    codificaArestas, decodificaChaves, decodificaIndicesPares, codificaIndicesPares,
+    arestasParaArray, tuplasParaArray,
+    tipoVertices, temChaveRepetida
+)
+from bits import ConjuntoBits, MatrizAdjacenciaBits
+from estatisticas import estatisticasGrafo
+from amostragem import amostraSequencial
+
+
+def comoRandom(rng=None):
+    """
+    Normaliza a fonte de aleatoriedade para uma instância de random.Random.
+    
+    Os geradores não usam o estado global dos módulos random/np.random: cada
+    chamada recebe (ou cria) seu próprio objeto, o que permite gerar grafos em
+    paralelo no mesmo processo com fluxos reprodutíveis.
+    
+    Args:
+        rng: random.Random, np.random.Generator ou None (fluxo novo, não
+            reprodutível)
+    
+    Returns:
+        random.Random: A própria instância ou uma derivada de forma
+        determinística do np.random.Generator recebido
+    
+    Raises:
+        ParametrosInvalidosError: Se rng não é de um tipo suportado
+    """
+    if rng is None:
+        return random.Random()
+    if isinstance(rng, random.Random):
+        return rng
+    if isinstance(rng, np.random.Generator):
+        return random.Random(int(rng.integers(0, 2**63)))
+    raise ParametrosInvalidosError(f"Fonte de aleatoriedade inválida: {type(rng).__name__}")
+
+
+def comoGenerator(rng=None):
+    """
+    Normaliza a fonte de aleatoriedade para um np.random.Generator.
+    
+    Um random.Random é convertido em um Generator semeado com 64 bits do
+    próprio fluxo, de forma determinística (ver comoRandom).
+    """
+    if rng is None:
+        return np.random.default_rng()
+    if isinstance(rng, np.random.Generator):
+        return rng
+    if isinstance(rng, random.Random):
+        return np.random.default_rng(rng.getrandbits(64))
+    raise ParametrosInvalidosError(f"Fonte de aleatoriedade inválida: {type(rng).__name__}")
+
+
+def validaFormato(formato):
+    """Valida o formato de saída das arestas ('tuplas' ou 'array')."""
+    if formato not in FORMATOS_ARESTAS:
+        raise ParametrosInvalidosError(
+            f"Formato de arestas inválido: {formato} (use um de {FORMATOS_ARESTAS})"
+        )
+
+
+def formataArestas(u, v, numV, formato, ordenar=True):
+    """
+    Entrega os vetores (u, v) no formato pedido.
+    
+    'array' produz o array contíguo (E, 2) int32/int64 de arestasParaArray;
+    'tuplas' produz a lista de tuplas (u, v), a visão de compatibilidade.
+    Com ordenar=False os vetores já estão em ordem lexicográfica.
+    """
+    if formato == 'array':
+        return arestasParaArray(u, v, numV, ordenar)
+    if ordenar:
+        u, v = decodificaChaves(np.sort(codificaArestas(u, v, numV, dirigido=True)), numV)
+    return list(zip(np.asarray(u).tolist(), np.asarray(v).tolist()))
 
 
 def verificaAresta(tipo, numV, numC):
@@ -69,7 +147,7 @@ def verificaAresta(tipo, numV, numC):
     return minimo, maximo
 
 
-def alocaVertices(numV, numC, fator):
+def alocaVertices(numV, numC, fator, rng=None):
     """
     Aloca vértices para componentes conexas baseado na estratégia especificada.
     
@@ -78,13 +156,20 @@ def alocaVertices(numV, numC, fator):
     - fator = 1: Parcialmente Balanceado - Distribuição semi-aleatória
     - fator = 2: Balanceado - Distribuição o mais uniforme possível
     
+    Toda componente recebe ao menos um vértice; nas estratégias aleatórias
+    apenas os numV - numC vértices excedentes são sorteados.
+    
     Args:
         numV (int): Número total de vértices
         numC (int): Número de componentes conexas
         fator (int): Estratégia de alocação (0, 1, ou 2)
+        rng: random.Random ou np.random.Generator (ver comoRandom)
     
     Returns:
         list: Lista com número de vértices por componente
+    
+    Raises:
+        ComponentesInvalidasError: Se numV < numC
         
     Example:
         >>> alocaVertices(10, 3, 2)
@@ -92,7 +177,10 @@ def alocaVertices(numV, numC, fator):
         >>> alocaVertices(10, 3, 0)
         [3, 4, 3]  # Distribuição aleatória
     """
-    verticesComp = [0] * numC
+    if numV < numC:
+        raise ComponentesInvalidasError(
+            f"Número de vértices ({numV}) insuficiente para {numC} componentes conexas"
+        )
     
     if fator == 2:  # Balanceado: distribuição o mais uniforme possível
         resto = numV % numC
@@ -101,39 +189,88 @@ def alocaVertices(numV, numC, fator):
         # Adiciona o resto na primeira componente para manter balanceamento
         verticesComp[0] += resto
     else:  # Aleatório (fator=0) ou Parcialmente Balanceado (fator=1)
-        for _ in range(numV):
-            component = random.randint(0, numC - 1)
-            verticesComp[component] += 1
+        # Cada vértice excedente escolhe uma componente uniformemente: a contagem
+        # por componente é uma única amostra multinomial, sem laço por vértice
+        gen = comoGenerator(rng)
+        verticesComp = (gen.multinomial(numV - numC, np.full(numC, 1.0 / numC)) + 1).tolist()
     
     return verticesComp
 
 
+def limitesComponente(numVertices, tipo):
+    """Limites mínimo e máximo de arestas de uma componente com numVertices vértices."""
+    if tipo == 0:  # Simples
+        return numVertices - 1, (numVertices * (numVertices - 1)) / 2
+    elif tipo == 1:  # Dirigido
+        return numVertices - 1, numVertices * (numVertices - 1)
+    elif "2" in str(tipo):  # Multigrafo
+        if numVertices == 1:
+            return 0, 0
+        return numVertices, math.inf
+    elif "3" in str(tipo):  # Pseudografo
+        return numVertices, math.inf
+    return 0, 0
+
+
 def calculaLimitesArestas(verticesComp, tipo):
     """Calcula limites mínimo e máximo de arestas para cada componente."""
     minArestas = [0] * len(verticesComp)
     maxArestas = [0] * len(verticesComp)
     
     for i, numVertices in enumerate(verticesComp):
-        if tipo == 0:  # Simples
-            minArestas[i] = numVertices - 1
-            maxArestas[i] = (numVertices * (numVertices - 1)) / 2
-        elif tipo == 1:  # Dirigido
-            minArestas[i] = numVertices - 1
-            maxArestas[i] = numVertices * (numVertices - 1)
-        elif "2" in str(tipo):  # Multigrafo
-            if numVertices == 1:
-                minArestas[i] = 0
-                maxArestas[i] = 0
-            else:
-                minArestas[i] = numVertices
-                maxArestas[i] = math.inf
-        elif "3" in str(tipo):  # Pseudografo
-            minArestas[i] = numVertices
-            maxArestas[i] = math.inf
+        minArestas[i], maxArestas[i] = limitesComponente(numVertices, tipo)
     
     return minArestas, maxArestas
 
 
+def limitesGlobais(tipo, numV, numC):
+    """
+    Intervalo de numA viável para algum particionamento de numV vértices em numC componentes.
+    
+    Os limites por componente são monótonos no número de vértices e o máximo é
+    convexo, de modo que o particionamento mais concentrado (uma componente com
+    numV - numC + 1 vértices e as demais isoladas) atinge simultaneamente o
+    menor mínimo e o maior máximo. Pseudografos exigem ao menos um laço por
+    vértice isolado, portanto o mínimo deles não depende da partição.
+    
+    Returns:
+        tuple: (minimo, maximo) de arestas totais
+    """
+    grande = numV - numC + 1
+    minGrande, maxGrande = limitesComponente(grande, tipo)
+    minUnit, maxUnit = limitesComponente(1, tipo)
+    return minGrande + (numC - 1) * minUnit, maxGrande + (numC - 1) * maxUnit
+
+
+def concentraVertices(verticesComp, numA, tipo):
+    """
+    Torna viável uma alocação de vértices concentrando-os na maior componente.
+    
+    Esvazia (até 1 vértice) as menores componentes em favor da maior até que
+    sum(min) <= numA <= sum(max). Cada transferência só aumenta a soma dos
+    máximos e não aumenta a dos mínimos; se numA está em limitesGlobais, o
+    processo termina em uma alocação viável.
+    """
+    verticesComp = list(verticesComp)
+    minArestas, maxArestas = calculaLimitesArestas(verticesComp, tipo)
+    somaMin, somaMax = sum(minArestas), sum(maxArestas)
+    maior = max(range(len(verticesComp)), key=verticesComp.__getitem__)
+    
+    for i in sorted(range(len(verticesComp)), key=verticesComp.__getitem__):
+        if somaMin <= numA <= somaMax:
+            break
+        if i == maior or verticesComp[i] == 1:
+            continue
+        for j, delta in ((i, 1 - verticesComp[i]), (maior, verticesComp[i] - 1)):
+            minAntes, maxAntes = limitesComponente(verticesComp[j], tipo)
+            verticesComp[j] += delta
+            minDepois, maxDepois = limitesComponente(verticesComp[j], tipo)
+            somaMin += minDepois - minAntes
+            somaMax += maxDepois - maxAntes
+    
+    return verticesComp
+
+
 def alocaArestasBalanceado(numA, numC, minArestas, maxArestas):
     """Aloca arestas de forma balanceada entre componentes."""
     resto = numA % numC
@@ -145,52 +282,130 @@ def alocaArestasBalanceado(numA, numC, minArestas, maxArestas):
     for i in range(numC):
         if minArestas[i] > arestasComp[i]:
             raise ArestasInsuficientesError(
-                "Não é possível gerar um grafo balanceado com esse número de arestas, considere aumentar"
+                f"Não é possível gerar um grafo balanceado com esse número de arestas, considere aumentar: "
+                f"componente {i} recebe {arestasComp[i]} arestas e exige ao menos {minArestas[i]}"
             )
         elif maxArestas[i] < arestasComp[i]:
             raise ArestasInsuficientesError(
-                "Não é possível gerar um grafo balanceado com esse número de arestas, considere diminuir"
+                f"Não é possível gerar um grafo balanceado com esse número de arestas, considere diminuir: "
+                f"componente {i} recebe {arestasComp[i]} arestas e admite no máximo {int(maxArestas[i])}"
             )
     
     return arestasComp
 
 
-def alocaArestasAleatorio(numA, numC, minArestas, maxArestas):
-    """Aloca arestas de forma aleatória entre componentes."""
+def alocaArestasAleatorio(numA, numC, minArestas, maxArestas, rng=None):
+    """
+    Aloca arestas de forma aleatória entre componentes.
+    
+    A componente i sorteia em [max(min_i, R - maxSufixo), min(max_i, R - minSufixo)],
+    onde R são as arestas restantes e os sufixos somam os limites das
+    componentes seguintes. Assim toda alocação parcial permanece completável
+    e a última componente sempre recebe um valor dentro de seus limites.
+    
+    Raises:
+        ArestasInsuficientesError: Se sum(minArestas) <= numA <= sum(maxArestas) não vale
+    """
+    gen = comoGenerator(rng)
     arestasComp = [0] * numC
     arestasRestantes = numA
     
+    # Sufixos: arestas mínimas/máximas das componentes i..numC-1
+    minimos = np.asarray(minArestas, dtype=float)
+    maximos = np.asarray(maxArestas, dtype=float)
+    minSufixo = np.concatenate((np.cumsum(minimos[::-1])[::-1], [0])).tolist()
+    maxSufixo = np.concatenate((np.cumsum(maximos[::-1])[::-1], [0])).tolist()
+    if not minSufixo[0] <= numA <= maxSufixo[0]:
+        raise ArestasInsuficientesError(
+            f"{numA} arestas fora do intervalo viável [{int(minSufixo[0])}, {maxSufixo[0]:.0f}] "
+            f"para as componentes alocadas"
+        )
+    # Uniformes sorteadas em lote; o laço abaixo só faz aritmética escalar
+    uniformes = gen.random(numC).tolist()
+    
     for i in range(numC - 1):
-        if minArestas[i] < maxArestas[i]:
-            try:
-                max_possivel = min(
-                    maxArestas[i],
-                    arestasRestantes - sum(
-                        min(minArestas[j], maxArestas[j])
-                        for j in range(i + 1, numC)
-                    )
-                )
-                arestasComp[i] = random.randint(minArestas[i], int(max_possivel))
-            except ValueError as e:
-                raise ArestasInsuficientesError(
-                    f"Erro ao gerar valor aleatório para arestasComp[{i}]: {e}"
-                )
+        inferior = int(max(minArestas[i], arestasRestantes - maxSufixo[i + 1]))
+        superior = int(min(maxArestas[i], arestasRestantes - minSufixo[i + 1]))
+        arestasComp[i] = inferior + int(uniformes[i] * (superior - inferior + 1))
         arestasRestantes -= arestasComp[i]
     
-    # Última componente recebe o restante
-    arestasComp[numC - 1] = numA - sum(arestasComp)
-    
-    # Valida última componente
-    if (arestasComp[numC - 1] < minArestas[numC - 1] or 
-        arestasComp[numC - 1] > maxArestas[numC - 1]):
-        return None  # Indica que deve tentar novamente
+    # Última componente recebe o restante, já garantido dentro dos limites
+    arestasComp[numC - 1] = arestasRestantes
     
     return arestasComp
 
 
-def constroiComponentes(verticesComp, arestasComp, tipo, numV):
-    """Constrói as componentes do grafo."""
+def sorteiaExtrasComponente(vertices, necessarias, dirigido, gen):
+    """
+    Sorteia arestas extras distintas, sem laços, dentro de uma componente de tipo 0/1.
+    
+    A árvore geradora liga vertices[j] a vertices[j + 1]. Os pares são
+    sorteados em lotes sobre as posições locais e deduplicados, contra a
+    árvore e contra as extras anteriores, por teste-e-marca vetorizado em uma
+    MatrizAdjacenciaBits de len(vertices)² bits. Manter as primeiras
+    ocorrências na ordem de sorteio equivale à rejeição par a par.
+    
+    Returns:
+        tuple: Vetores (u, v) int64 com as necessarias arestas extras
+    """
+    nv = len(vertices)
+    posicoes = np.asarray(vertices, dtype=np.int64)
+    adjacencia = MatrizAdjacenciaBits(nv, dirigido)
+    adjacencia.marcaArestas(np.arange(nv - 1), np.arange(1, nv))
+    total_pares = nv * (nv - 1) if dirigido else nv * (nv - 1) // 2
+    
+    extrasU, extrasV = [], []
+    obtidas = 0
+    while obtidas < necessarias:
+        faltam = necessarias - obtidas
+        p_valido = (1 - 1 / nv) * (1 - (nv - 1 + obtidas) / total_pares)
+        lote = min(LOTE_MAX_CANDIDATOS, int(faltam / p_valido * 1.1) + 64)
+        a = gen.integers(0, nv, size=lote, dtype=np.int64)
+        b = gen.integers(0, nv, size=lote, dtype=np.int64)
+        a, b = a[a != b], b[a != b]
+        novas = adjacencia.testaEMarcaArestas(a, b)
+        a, b = a[novas][:faltam], b[novas][:faltam]
+        extrasU.append(a)
+        extrasV.append(b)
+        obtidas += a.size
+    
+    if not extrasU:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return posicoes[np.concatenate(extrasU)], posicoes[np.concatenate(extrasV)]
+
+
+def constroiComponentes(verticesComp, arestasComp, tipo, numV, rng=None):
+    """
+    Constrói as componentes do grafo usando uma estrutura esparsa de arestas.
+    
+    Em vez de uma matriz de adjacência numV×numV, as arestas são registradas em
+    um dicionário de multiplicidades indexado pela chave inteira ``u * numV + v``
+    (com ``u <= v`` para grafos não dirigidos). As invariantes de laços e arestas
+    múltiplas são mantidas durante a construção, sem varreduras finais O(V²).
+    
+    Em grafos simples e digrafos, as arestas extras de uma componente cuja
+    matriz de bits cabe em MEMORIA_MAX_BITSET (ou em 32 bytes por aresta extra)
+    são sorteadas em lote por sorteiaExtrasComponente; nas demais, o laço
+    par a par sobre o dicionário é mantido.
+    
+    Args:
+        verticesComp (list): Número de vértices de cada componente
+        arestasComp (list): Número de arestas de cada componente
+        tipo (int): Tipo do grafo (0, 1, 20, 21, 30, 31)
+        numV (int): Número total de vértices
+        rng: random.Random ou np.random.Generator (ver comoRandom)
+    
+    Returns:
+        list: Lista de tuplas (u, v) representando as arestas do grafo
+    
+    Complexity:
+        - Memória: O(V + E)
+    """
+    rng = comoRandom(rng)
     numC = len(verticesComp)
+    dirigido = tipo in TIPOS_DIRIGIDOS
+    unica = tipo in (0, 1)  # Simples/Digrafo: no máximo 1 aresta por par
+    gen = comoGenerator(rng) if unica else None
     
     # Calcula tamanhos acumulados
     tam = [0] * (numC + 1)
@@ -198,140 +413,127 @@ def constroiComponentes(verticesComp, arestasComp, tipo, numV):
         tam[j] = tam[j - 1] + verticesComp[j - 1]
     tam[numC] = numV
     
-    # Constrói matriz de adjacência
-    matriz = np.array([[0] * numV for _ in range(numV)])
+    # Multiplicidade de cada aresta, indexada pela chave codificada
+    multiplicidade = {}
+    tem_lacos = False
+    tem_multiplas = False
     arestas = []
+    ultima_extra = None  # Índice da última aresta extra (fora da árvore geradora)
+    
+    def registra(u, v):
+        """Registra a aresta (u, v) e atualiza as invariantes do grafo."""
+        nonlocal tem_lacos, tem_multiplas
+        if not dirigido and u > v:
+            u, v = v, u
+        chave = u * numV + v
+        contagem = multiplicidade.get(chave, 0) + 1
+        multiplicidade[chave] = contagem
+        if u == v:
+            tem_lacos = True
+        elif contagem > 1:
+            tem_multiplas = True
+    
+    def existe(u, v):
+        """Verifica se a aresta (u, v) já foi registrada."""
+        if not dirigido and u > v:
+            u, v = v, u
+        return (u * numV + v) in multiplicidade
     
     for i in range(numC):
         # Lista de vértices da componente atual
         vertices = list(range(tam[i], tam[i + 1]))
-        random.shuffle(vertices)
+        rng.shuffle(vertices)
         
         # Conecta vértices da componente
         for j in range(len(vertices) - 1):
             u, v = vertices[j], vertices[j + 1]
-            if tipo in [0, 20, 30]:  # Grafo não dirigido
-                arestas.append((u, v))
-                if tipo == 0:  # Simples: máximo 1 aresta
-                    matriz[u][v] = 1
-                    matriz[v][u] = 1
-                else:  # Multigrafo/Pseudografo: pode ter múltiplas
-                    matriz[u][v] += 1
-                    matriz[v][u] += 1
-            else:  # Grafo dirigido
-                arestas.append((u, v))
-                if tipo == 1:  # Digrafo: máximo 1 aresta
-                    matriz[u][v] = 1
-                else:  # Multigrafo-Dirigido/Pseudografo-Dirigido: pode ter múltiplas
-                    matriz[u][v] += 1
+            arestas.append((u, v))
+            registra(u, v)
         
         # Adiciona arestas extras se necessário
         arestas_necessarias = arestasComp[i] - (len(vertices) - 1)
         tentativas_aresta = 0
         arestas_adicionadas = 0
         
+        # Simples/Digrafo: extras em lote, deduplicadas na matriz de bits
+        if (unica and arestas_necessarias > 0
+                and len(vertices) ** 2 // 8 <= max(MEMORIA_MAX_BITSET, 32 * arestas_necessarias)):
+            u, v = sorteiaExtrasComponente(vertices, arestas_necessarias, dirigido, gen)
+            if not dirigido:
+                u, v = np.minimum(u, v), np.maximum(u, v)
+            arestas.extend(zip(u.tolist(), v.tolist()))
+            ultima_extra = len(arestas) - 1
+            continue
+        
         # Para pseudografos, garante pelo menos alguns loops
         loops_adicionados = 0
         if tipo in TIPOS_PSEUDOGRAFOS:
             num_loops = min(arestas_necessarias // 3, len(vertices) // 2)  # 1/3 das arestas ou metade dos vértices
             for _ in range(num_loops):
-                u = random.choice(vertices)
-                if tipo in [0, 20, 30]:  # Grafo não dirigido
-                    arestas.append((u, u))
-                    matriz[u][u] += 1
-                else:  # Grafo dirigido
-                    arestas.append((u, u))
-                    matriz[u][u] += 1
+                u = rng.choice(vertices)
+                arestas.append((u, u))
+                registra(u, u)
                 loops_adicionados += 1
             arestas_necessarias -= loops_adicionados
         
         # Limite proporcional ao número de arestas necessárias
         limite_tentativas = MAX_TENTATIVAS * max(1, arestas_necessarias)
         while arestas_adicionadas < arestas_necessarias and tentativas_aresta < limite_tentativas:
-            u = random.choice(vertices)
-            v = random.choice(vertices)
+            u = rng.choice(vertices)
+            v = rng.choice(vertices)
             tentativas_aresta += 1
             
             # Verifica se a aresta é válida
             if u != v or tipo in TIPOS_PSEUDOGRAFOS:
-                if tipo in [0, 20, 30]:  # Grafo não dirigido
-                    # Para grafos simples, verifica se a aresta já existe
-                    if tipo == 0 and matriz[u][v] > 0:
-                        continue  # Aresta já existe, tenta outra
-                    
-                    arestas.append((min(u, v), max(u, v)))
-                    if tipo == 0:  # Simples: máximo 1 aresta
-                        matriz[u][v] = 1
-                        matriz[v][u] = 1
-                    else:  # Multigrafo/Pseudografo: pode ter múltiplas
-                        matriz[u][v] += 1
-                        matriz[v][u] += 1
-                    arestas_adicionadas += 1
-                else:  # Grafo dirigido
-                    # Para digrafos, verifica se a aresta já existe
-                    if tipo == 1 and matriz[u][v] > 0:
-                        continue  # Aresta já existe, tenta outra
-                    
+                # Para grafos simples e digrafos, verifica se a aresta já existe
+                if unica and existe(u, v):
+                    continue  # Aresta já existe, tenta outra
+                
+                if dirigido:
                     arestas.append((u, v))
-                    if tipo == 1:  # Digrafo: máximo 1 aresta
-                        matriz[u][v] = 1
-                    else:  # Multigrafo-Dirigido/Pseudografo-Dirigido: pode ter múltiplas
-                        matriz[u][v] += 1
-                    arestas_adicionadas += 1
-    
-    # Verificação final: garante que pseudografos tenham loops
-    if tipo in TIPOS_PSEUDOGRAFOS:
-        # Verifica se há loops na matriz
-        tem_loops = False
-        for i in range(numV):
-            if matriz[i][i] > 0:
-                tem_loops = True
-                break
-        
-        # Se não há loops, adiciona pelo menos um
-        if not tem_loops:
-            u = random.choice(range(numV))
-            arestas.append((u, u))
-            matriz[u][u] += 1
-    
-    # Verificação final: garante que multigrafos tenham arestas múltiplas
-    if tipo in TIPOS_MULTIGRAFOS and tipo not in TIPOS_PSEUDOGRAFOS:
-        # Verifica se há arestas múltiplas na matriz
-        tem_multiplas = False
-        for i in range(numV):
-            for j in range(numV):
-                if matriz[i][j] > 1:
-                    tem_multiplas = True
-                    break
-            if tem_multiplas:
-                break
-        
-        # Se não há arestas múltiplas, adiciona pelo menos uma
-        if not tem_multiplas:
-            u = random.choice(range(numV))
-            v = random.choice(range(numV))
-            if u != v:  # Não adiciona loop para multigrafos não-pseudografos
-                arestas.append((min(u, v), max(u, v)) if tipo in [0, 20, 30] else (u, v))
-                matriz[u][v] += 1
-                if tipo in [0, 20, 30]:  # Grafo não dirigido
-                    matriz[v][u] += 1
+                else:
+                    arestas.append((min(u, v), max(u, v)))
+                registra(u, v)
+                ultima_extra = len(arestas) - 1
+                arestas_adicionadas += 1
+    
+    # Verificações finais: a característica ausente substitui a última aresta
+    # extra (que não pertence à árvore geradora), preservando o total de
+    # arestas e a conectividade. Os limites de calculaLimitesArestas garantem
+    # ao menos uma aresta extra em multigrafos e pseudografos com arestas.
+    
+    # Garante que pseudografos tenham loops
+    if tipo in TIPOS_PSEUDOGRAFOS and not tem_lacos and ultima_extra is not None:
+        u = arestas[ultima_extra][0]
+        arestas[ultima_extra] = (u, u)
+        tem_lacos = True
+    
+    # Garante que multigrafos tenham arestas múltiplas: a última aresta extra
+    # passa a repetir a aresta anterior, da mesma componente
+    if (tipo in TIPOS_MULTIGRAFOS and tipo not in TIPOS_PSEUDOGRAFOS and not tem_multiplas
+            and ultima_extra is not None and ultima_extra > 0):
+        arestas[ultima_extra] = arestas[ultima_extra - 1]
+        tem_multiplas = True
     
     return arestas
 
 
-def geraComponente(tipo, numV, numA, numC, fator):
+def geraComponente(tipo, numV, numA, numC, fator, rng=None, formato='tuplas', informar_componentes=False):
     """
     Gera um grafo com múltiplas componentes conexas.
     
     Esta função implementa o algoritmo principal de geração de grafos com componentes
-    conexas. Utiliza uma abordagem de tentativa e erro com validação rigorosa.
+    conexas. A alocação é construtiva: a viabilidade é verificada antes de
+    sortear e cada etapa só sorteia divisões (vértices, arestas) viáveis, de
+    modo que parâmetros possíveis geram o grafo na primeira passagem e
+    parâmetros impossíveis falham imediatamente com o motivo.
     
     Algoritmo:
-    1. Aloca vértices para componentes baseado na estratégia
-    2. Calcula limites válidos de arestas para cada componente
-    3. Aloca arestas respeitando os limites calculados
-    4. Constrói as componentes usando stub matching
-    5. Repete em caso de falha até MAX_TENTATIVAS
+    1. Verifica se numA está no intervalo viável (limitesGlobais)
+    2. Aloca vértices para componentes baseado na estratégia (ao menos 1 por componente)
+    3. Se a alocação aleatória não comporta numA, concentra vértices (concentraVertices)
+    4. Aloca arestas dentro do intervalo viável de cada componente
+    5. Constrói as componentes usando stub matching
     
     Args:
         tipo (int): Tipo do grafo (0, 1, 20, 21, 30, 31)
@@ -339,226 +541,1043 @@ def geraComponente(tipo, numV, numA, numC, fator):
         numA (int): Número total de arestas
         numC (int): Número de componentes conexas
         fator (int): Estratégia de alocação (0=aleatório, 1=parcial, 2=balanceado)
+        rng: random.Random ou np.random.Generator (ver comoRandom)
+        formato (str): 'tuplas' ou 'array' (array (E, 2) ordenado, ver formataArestas)
+        informar_componentes (bool): Se True, retorna também as alocações
     
     Returns:
-        list: Lista de tuplas (u, v) representando as arestas do grafo
+        list: Lista de tuplas (u, v) representando as arestas do grafo, ou
+        np.ndarray (E, 2) se formato='array'. Com informar_componentes=True,
+        a tupla (arestas, verticesComp, arestasComp): a componente i ocupa os
+        verticesComp[i] vértices seguintes aos das anteriores e tem
+        arestasComp[i] arestas
         
     Raises:
-        TentativasExcedidasError: Se não conseguir gerar após MAX_TENTATIVAS
-        ArestasInsuficientesError: Se parâmetros de arestas são inválidos
-        ComponentesInvalidasError: Se configuração de componentes é inválida
+        ParametrosInvalidosError: Se tipo de grafo é inválido
+        ComponentesInvalidasError: Se numV < numC
+        ArestasInsuficientesError: Se numA está fora do intervalo viável, ou se a
+            divisão balanceada (fator=2) viola os limites de alguma componente
+        TentativasExcedidasError: Se a construção não atingir numA arestas
         
     Example:
         >>> geraComponente(0, 10, 15, 2, 2)
         [(0, 1), (1, 2), (2, 3), (4, 5), ...]  # Grafo simples com 2 componentes
     """
-    tentativas = 0
+    if tipo not in TIPOS_VALIDOS:
+        raise ParametrosInvalidosError(f"Tipo de grafo inválido: {tipo}")
+    validaFormato(formato)
+    if numV < numC:
+        raise ComponentesInvalidasError(
+            f"Número de vértices ({numV}) insuficiente para {numC} componentes conexas"
+        )
+    rng = comoRandom(rng)
     
-    while tentativas < MAX_TENTATIVAS:
-        # Passo 1: Aloca vértices para componentes baseado na estratégia
-        verticesComp = alocaVertices(numV, numC, fator)
-        if not all(verticesComp):  # Valida se todas as componentes têm vértices
-            tentativas += 1
-            continue
-        
-        # Passo 2: Calcula limites válidos de arestas para cada componente
+    # Passo 1: Intervalo viável sobre todas as partições de vértices
+    minimo, maximo = limitesGlobais(tipo, numV, numC)
+    if not minimo <= numA <= maximo:
+        raise ArestasInsuficientesError(
+            f"{numA} arestas fora do intervalo viável [{int(minimo)}, {maximo:.0f}] "
+            f"para tipo {tipo} com {numV} vértices e {numC} componentes"
+        )
+    
+    # Passo 2: Aloca vértices para componentes baseado na estratégia
+    verticesComp = alocaVertices(numV, numC, fator, rng)
+    
+    # Passo 3: Calcula limites válidos de arestas e, se necessário, concentra vértices
+    minArestas, maxArestas = calculaLimitesArestas(verticesComp, tipo)
+    if fator != 2 and not sum(minArestas) <= numA <= sum(maxArestas):
+        verticesComp = concentraVertices(verticesComp, numA, tipo)
         minArestas, maxArestas = calculaLimitesArestas(verticesComp, tipo)
+    
+    # Passo 4: Aloca arestas respeitando os limites calculados
+    if fator == 2:  # Balanceado: distribuição uniforme
+        arestasComp = alocaArestasBalanceado(numA, numC, minArestas, maxArestas)
+    else:  # Aleatório ou Parcialmente Balanceado
+        arestasComp = alocaArestasAleatorio(numA, numC, minArestas, maxArestas, rng)
+    
+    # Ordena se parcialmente balanceado para consistência (os limites são
+    # monótonos no número de vértices, então o pareamento ordenado segue viável)
+    if fator == 1:
+        verticesComp = sorted(verticesComp)
+        arestasComp = sorted(arestasComp)
+    
+    # Passo 5: Constrói as componentes usando stub matching
+    arestas = constroiComponentes(verticesComp, arestasComp, tipo, numV, rng)
+    if len(arestas) != numA:
+        raise TentativasExcedidasError(
+            f"Construção gerou {len(arestas)} de {numA} arestas após o limite de tentativas por aresta"
+        )
+    if formato == 'array':
+        arestas = tuplasParaArray(arestas, numV)
+    if informar_componentes:
+        return arestas, list(verticesComp), list(arestasComp)
+    return arestas
+
+
+def registroGeracao(tipo, numV, numA, numC, fator, metodo, verticesComp=None, arestasComp=None):
+    """
+    Registro de geração: o que o gerador sabe sobre o grafo por construção.
+    
+    Permite ao estágio de métricas dispensar a redescoberta dessas
+    propriedades (componentes conexas, laços, arestas múltiplas). Valores
+    None indicam propriedades não garantidas pelo gerador.
+    
+    Returns:
+        dict: tipo, numV, numA, numC, fator, metodo, dirigido e
+        - num_componentes: numC para numC > 1 (cada componente é conexa por
+          construção; componentes fracas em dirigidos), senão None
+        - vertices_componentes, arestas_componentes: alocação por componente
+          (ver geraComponente), quando conhecida
+        - tem_lacos: True em pseudografos (garantido), False nos demais tipos
+        - tem_multiplas: True em multigrafos (20, 21), False em simples e
+          digrafos, None em pseudografos (permitidas, não garantidas)
+    """
+    return {
+        'tipo': tipo,
+        'numV': numV,
+        'numA': numA,
+        'numC': numC,
+        'fator': fator,
+        'metodo': metodo,
+        'dirigido': tipo in TIPOS_DIRIGIDOS,
+        'num_componentes': numC if numC > 1 else None,
+        'vertices_componentes': verticesComp,
+        'arestas_componentes': arestasComp,
+        'tem_lacos': tipo in TIPOS_PSEUDOGRAFOS,
+        'tem_multiplas': None if tipo in TIPOS_PSEUDOGRAFOS else tipo in TIPOS_MULTIGRAFOS,
+    }
+
+
+def amostraArestasRejeicao(numV, numA, dirigido, gen, limiar_rejeicao=None):
+    """
+    Amostra numA arestas distintas e sem laços por rejeição vetorizada em lotes.
+    
+    Os pares candidatos são sorteados em lotes com NumPy e codificados como
+    chaves int64 (ver ``arestas.codificaArestas``). Laços e repetições são
+    descartados com operações de vetor e novos lotes são sorteados até que
+    restem exatamente numA arestas. As arestas são mantidas na ordem em que
+    foram sorteadas, o que equivale à rejeição sequencial par a par e preserva
+    a uniformidade da amostra.
+    
+    Args:
+        numV (int): Número de vértices
+        numA (int): Número de arestas desejado
+        dirigido (bool): Se (u, v) e (v, u) são arestas distintas
+        gen (np.random.Generator): Gerador de números aleatórios
+        limiar_rejeicao (float): Se definido, interrompe a amostragem quando a
+            fração de candidatos rejeitados em um lote excede o limiar
+    
+    Returns:
+        np.ndarray: Chaves int64 das arestas aceitas, na ordem de sorteio
+        (menos de numA apenas se a amostragem foi interrompida)
+    """
+    total_pares = numV * (numV - 1) if dirigido else numV * (numV - 1) // 2
+    chaves = np.empty(0, dtype=np.int64)
+    
+    while chaves.size < numA:
+        faltam = numA - chaves.size
+        # Probabilidade de um candidato ser válido (não laço) e inédito
+        p_valido = (1 - 1 / numV) * (1 - chaves.size / total_pares)
+        lote = min(LOTE_MAX_CANDIDATOS, int(faltam / p_valido * 1.1) + 64)
         
-        # Passo 3: Aloca arestas respeitando os limites calculados
-        if fator == 2:  # Balanceado: distribuição uniforme
-            try:
-                arestasComp = alocaArestasBalanceado(numA, numC, minArestas, maxArestas)
-            except ArestasInsuficientesError:
-                tentativas += 1
-                continue
-        else:  # Aleatório ou Parcialmente Balanceado
-            arestasComp = alocaArestasAleatorio(numA, numC, minArestas, maxArestas)
-            if arestasComp is None:  # Falha na alocação
-                tentativas += 1
-                continue
+        u = gen.integers(0, numV, size=lote, dtype=np.int64)
+        v = gen.integers(0, numV, size=lote, dtype=np.int64)
+        validos = u != v
+        novas = codificaArestas(u[validos], v[validos], numV, dirigido)
         
-        # Passo 4: Ordena se parcialmente balanceado para consistência
-        if fator == 1:
-            verticesComp = sorted(verticesComp)
-            arestasComp = sorted(arestasComp)
+        # Mantém apenas a primeira ocorrência de cada chave, na ordem de sorteio
+        todas = np.concatenate((chaves, novas))
+        _, primeiras = np.unique(todas, return_index=True)
+        primeiras.sort()
+        # Taxa de rejeição do lote: laços e repetidas sobre os candidatos sorteados
+        ineditas = primeiras.size - chaves.size
+        chaves = todas[primeiras[:numA]]
         
-        # Passo 5: Constrói as componentes usando stub matching
-        try:
-            arestas = constroiComponentes(verticesComp, arestasComp, tipo, numV)
-            # Validação: verifica se número de arestas geradas corresponde ao solicitado
-            if len(arestas) != numA:
-                tentativas += 1
-                continue
-            return arestas
-        except Exception:  # Falha na construção
-            tentativas += 1
-            continue
+        if limiar_rejeicao is not None and 1 - ineditas / lote > limiar_rejeicao:
+            break
+    
+    return chaves
+
+
+def amostraArestasBitset(numV, numA, dirigido, gen, limiar_rejeicao=None, vistos=None, ocupados=0):
+    """
+    Amostra numA arestas por rejeição com deduplicação em um bitset de pares.
+    
+    Os candidatos são índices uniformes do espaço de pares (ver
+    ``arestas.decodificaIndicesPares``), portanto nunca são laços. Cada par
+    ocupa um bit; a verificação de repetição é um teste-e-marca vetorizado
+    sobre o lote, em O(lote) e sem reordenar as arestas já aceitas. Quando
+    um lote traz mais pares inéditos que o necessário, um subconjunto
+    uniforme deles é mantido, o que preserva a uniformidade da amostra.
+    
+    Usa total_pares / 8 bytes de memória (ver bits.ConjuntoBits e
+    MEMORIA_MAX_BITSET).
+    
+    Args:
+        Os de amostraArestasRejeicao, e ainda:
+        vistos (ConjuntoBits): Pares já ocupados, que não podem ser sorteados
+            (é atualizado com os novos pares)
+        ocupados (int): Quantos pares estão marcados em vistos
+    
+    Returns:
+        np.ndarray: Índices int64 ordenados dos pares aceitos (menos de numA
+        apenas se a amostragem foi interrompida pelo limiar)
+    """
+    total_pares = numV * (numV - 1) if dirigido else numV * (numV - 1) // 2
+    if vistos is None:
+        vistos = ConjuntoBits(total_pares)
+    aceitos = []
+    total = 0
+    
+    while total < numA:
+        faltam = numA - total
+        p_valido = 1 - (ocupados + total) / total_pares
+        lote = min(LOTE_MAX_CANDIDATOS, int(faltam / p_valido * 1.1) + 64)
+        
+        indices = vistos.ineditos(gen.integers(0, total_pares, size=lote, dtype=np.int64))
+        ineditos = indices.size
+        if indices.size > faltam:
+            indices = np.sort(gen.choice(indices, faltam, replace=False))
+        vistos.marca(indices, ordenados=True)
+        
+        aceitos.append(indices)
+        total += indices.size
+        
+        if limiar_rejeicao is not None and 1 - ineditos / lote > limiar_rejeicao:
+            break
+    
+    if not aceitos:
+        return np.empty(0, dtype=np.int64)
+    return np.sort(np.concatenate(aceitos))
+
+
+def completaComplemento(indices, numA, total_pares, gen):
+    """
+    Completa uma amostra parcial de pares até numA, sorteando entre os ausentes.
+    
+    Os numA - len(indices) pares restantes são uma amostra uniforme, sem
+    reposição, dos pares que ainda não estão em indices. Se indices é uma
+    amostra uniforme, o resultado também é. O posto r de um par ausente é
+    mapeado para seu índice somando quantos pares presentes o precedem.
+    
+    Args:
+        indices (np.ndarray): Índices de pares já aceitos (distintos)
+        numA (int): Tamanho final da amostra
+        total_pares (int): Tamanho do espaço de pares
+        gen (np.random.Generator): Gerador de números aleatórios
+    
+    Returns:
+        np.ndarray: numA índices int64 ordenados
+    """
+    presentes = np.sort(np.asarray(indices, dtype=np.int64))
+    faltam = numA - presentes.size
+    postos = np.sort(gen.choice(total_pares - presentes.size, faltam, replace=False, shuffle=False))
+    # lacunas[j] = número de pares ausentes antes do j-ésimo par presente
+    lacunas = presentes - np.arange(presentes.size, dtype=np.int64)
+    novos = postos + np.searchsorted(lacunas, postos, side='right')
+    return np.sort(np.concatenate((presentes, novos)))
+
+
+def estendeAmostraPares(indices, numA, numV, dirigido, gen):
+    """
+    Estende uma amostra ordenada de pares até numA pares, sorteando entre os ausentes.
+    
+    Se o destino é denso (acima de LIMIAR_DENSIDADE_COMPLEMENTO), sorteia em
+    uma máscara de pares quais ausentes continuam ausentes, em O(total_pares).
+    Caso contrário, sorteia os novos pares por rejeição no bitset já marcado
+    com os atuais (amostraArestasBitset) e intercala as duas listas
+    ordenadas. Em ambos os casos o incremento é uniforme entre os ausentes.
+    
+    Returns:
+        np.ndarray: numA índices int64 ordenados, contendo indices
+    """
+    total_pares = numV * (numV - 1) if dirigido else numV * (numV - 1) // 2
+    faltam = numA - indices.size
+    if faltam <= 0:
+        return indices
+    
+    if numA / total_pares > LIMIAR_DENSIDADE_COMPLEMENTO:
+        presentes = np.zeros(total_pares, dtype=bool)
+        presentes[indices] = True
+        ausentes = np.flatnonzero(~presentes)
+        continuam = gen.choice(ausentes.size, total_pares - numA, replace=False, shuffle=False)
+        presentes[ausentes] = True
+        presentes[ausentes[continuam]] = False
+        return np.flatnonzero(presentes)
+    
+    vistos = ConjuntoBits(total_pares)
+    vistos.marca(indices, ordenados=True)
+    novos = amostraArestasBitset(numV, faltam, dirigido, gen, vistos=vistos, ocupados=indices.size)
+    # Ordenação estável sobre duas sequências ordenadas: intercalação em O(n)
+    return np.sort(np.concatenate((indices, novos)), kind='stable')
+
+
+def escolheMetodoArestas(numV, numA, dirigido):
+    """
+    Escolhe o algoritmo de amostragem de arestas distintas para (numV, numA).
+    
+    - 'complemento': densidade acima de LIMIAR_DENSIDADE_COMPLEMENTO
+    - 'bitset': o bitset de pares cabe em MEMORIA_MAX_BITSET (ou em 32 bytes
+      por aresta); a deduplicação é por lote, sem reordenar as já aceitas
+    - 'rejeicao': demais casos (memória proporcional a numA, não aos pares)
+    
+    'indice' (Vitter, laço Python por aresta) não é escolhido
+    automaticamente: só compensa quando a saída ordenada sem memória extra
+    importa mais que a velocidade.
+    """
+    total_pares = numV * (numV - 1) if dirigido else numV * (numV - 1) // 2
+    densidade = numA / total_pares if total_pares > 0 else 0
+    if densidade > LIMIAR_DENSIDADE_COMPLEMENTO:
+        return 'complemento'
+    # O bitset também compensa quando não é maior que as chaves int64 que a
+    # rejeição manteria (várias cópias de 8 bytes por aresta)
+    if (total_pares + 7) // 8 <= max(MEMORIA_MAX_BITSET, 32 * numA):
+        return 'bitset'
+    return 'rejeicao'
+
+
+def geraArestasUnicas(numV, numA, dirigido, metodo='auto', rng=None):
+    """
+    Amostra numA arestas distintas e sem laços (tipos 0 e 1) pelo método pedido.
+    
+    Com metodo='auto', o algoritmo é escolhido por escolheMetodoArestas e,
+    na rejeição ou no bitset, a taxa de rejeição de cada lote é medida: se
+    passar de LIMIAR_TAXA_REJEICAO, as arestas restantes são sorteadas entre
+    os pares ausentes (completaComplemento). Com 'rejeicao' ou 'indice', grafos
+    acima de LIMIAR_DENSIDADE_COMPLEMENTO usam o complemento, como antes;
+    'complemento' e 'bitset' são aplicados em qualquer densidade.
+    
+    Returns:
+        tuple: (u, v, metodo_usado), com os vetores em ordem lexicográfica e
+        metodo_usado como 'bitset' ou, após troca, 'bitset>complemento'
+    """
+    if metodo not in METODOS_GERACAO:
+        raise ParametrosInvalidosError(f"Método de geração inválido: {metodo}")
+    rng = comoRandom(rng)
+    total_pares = numV * (numV - 1) if dirigido else numV * (numV - 1) // 2
+    densidade = numA / total_pares if total_pares > 0 else 0
+    
+    limiar = None
+    if metodo == 'auto':
+        metodo = escolheMetodoArestas(numV, numA, dirigido)
+        limiar = LIMIAR_TAXA_REJEICAO
+    elif metodo in ('rejeicao', 'indice') and densidade > LIMIAR_DENSIDADE_COMPLEMENTO:
+        metodo = 'complemento'
+    
+    if metodo == 'indice':
+        u, v = amostraArestasIndice(numV, numA, dirigido, rng)
+        return u, v, metodo
+    
+    gen = comoGenerator(rng)
+    if metodo == 'complemento':
+        u, v = amostraArestasComplemento(numV, numA, dirigido, gen)
+        return u, v, metodo
+    
+    if metodo == 'bitset':
+        indices = amostraArestasBitset(numV, numA, dirigido, gen, limiar)
+    else:
+        chaves = amostraArestasRejeicao(numV, numA, dirigido, gen, limiar)
+        if chaves.size == numA:
+            # Chaves ordenadas geram arestas já em ordem lexicográfica
+            u, v = decodificaChaves(np.sort(chaves), numV)
+            return u, v, metodo
+        indices = codificaIndicesPares(*decodificaChaves(chaves, numV), numV, dirigido)
     
-    return None
+    if indices.size < numA:
+        indices = completaComplemento(indices, numA, total_pares, gen)
+        metodo += '>complemento'
+    u, v = decodificaIndicesPares(indices, numV, dirigido, ordenados=True)
+    return u, v, metodo
 
 
-def geraGrafoSimples(numV, numA):
-    """Gera grafo simples com otimização para grafos densos."""
+def amostraArestasIndice(numV, numA, dirigido, rng):
+    """
+    Amostra numA arestas sorteando índices do espaço de pares sem reposição.
+    
+    Grafos simples e digrafos são amostras uniformes de numA pares de um espaço
+    conhecido (numV(numV-1)/2 ou numV(numV-1) pares). Os índices são sorteados
+    pelo método sequencial de Vitter, que os emite já ordenados, e decodificados
+    para (u, v). Não há rejeição e o custo é O(numA) para qualquer densidade.
+    
+    Args:
+        numV (int): Número de vértices
+        numA (int): Número de arestas desejado
+        dirigido (bool): Se (u, v) e (v, u) são arestas distintas
+        rng (random.Random): Gerador de números aleatórios
+    
+    Returns:
+        tuple: Vetores int64 (u, v) em ordem lexicográfica
+    """
+    total_pares = numV * (numV - 1) if dirigido else numV * (numV - 1) // 2
+    indices = amostraSequencial(total_pares, numA, rng)
+    return decodificaIndicesPares(indices, numV, dirigido, ordenados=True)
+
+
+def amostraArestasComplemento(numV, numA, dirigido, gen):
+    """
+    Amostra numA arestas de um grafo denso sorteando as arestas ausentes.
+    
+    Para densidades altas é mais barato sortear os total_pares - numA pares que
+    ficarão de fora (o complemento) e emitir todos os demais. O resultado é uma
+    amostra uniforme, com custo de O(total_pares - numA) sorteios, e as arestas
+    já saem em ordem lexicográfica.
+    
+    Args:
+        numV (int): Número de vértices
+        numA (int): Número de arestas desejado
+        dirigido (bool): Se (u, v) e (v, u) são arestas distintas
+        gen (np.random.Generator): Gerador de números aleatórios
+    
+    Returns:
+        tuple: Vetores int64 (u, v) em ordem lexicográfica
+    """
+    total_pares = numV * (numV - 1) if dirigido else numV * (numV - 1) // 2
+    ausentes = gen.choice(total_pares, total_pares - numA, replace=False, shuffle=False)
+    presentes = np.ones(total_pares, dtype=bool)
+    presentes[ausentes] = False
+    return decodificaIndicesPares(np.flatnonzero(presentes), numV, dirigido, ordenados=True)
+
+
+def geraGrafoSimples(numV, numA, metodo='auto', rng=None, formato='tuplas', informar_metodo=False):
+    """
+    Gera grafo simples com arestas distintas e sem laços.
+    
+    Args:
+        numV (int): Número de vértices
+        numA (int): Número de arestas
+        metodo (str): 'auto' (escolha adaptativa, ver geraArestasUnicas),
+            'rejeicao' (lotes NumPy), 'indice' (amostragem no espaço de pares),
+            'complemento' ou 'bitset'
+        rng: random.Random ou np.random.Generator (ver comoRandom)
+        formato (str): 'tuplas' (lista de tuplas) ou 'array' (array (E, 2)
+            int32/int64); em ambos as arestas saem ordenadas
+        informar_metodo (bool): Se True, retorna (arestas, metodo_usado)
+    """
+    validaFormato(formato)
     max_arestas = numV * (numV - 1) // 2
     if numA > max_arestas:
         raise ArestasInsuficientesError(
             "Número de arestas excede o máximo permitido para um grafo simples."
         )
     
-    # Para grafos muito densos (>80% da densidade máxima), usa algoritmo determinístico
-    densidade = numA / max_arestas if max_arestas > 0 else 0
-    if densidade > 0.8:
-        # Algoritmo determinístico para grafos densos (evita travamentos)
-        arestas = []
-        for u in range(numV):
-            for v in range(u + 1, numV):
-                if len(arestas) >= numA:
-                    break
-                arestas.append((u, v))
-            if len(arestas) >= numA:
-                break
-        return arestas[:numA]
-    
-    # Algoritmo aleatório para grafos esparsos (comportamento normal)
-    arestas_set = set()
-    tentativas = 0
-    limite = MAX_TENTATIVAS * max(1, numA)
-    while len(arestas_set) < numA and tentativas < limite:
-        u = random.randint(0, numV - 1)
-        v = random.randint(0, numV - 1)
-        tentativas += 1
-        if u != v:
-            aresta = (u, v) if u < v else (v, u)
-            if aresta not in arestas_set:
-                arestas_set.add(aresta)
-    
-    return list(arestas_set)
-
-
-def geraGrafoDirigido(numV, numA):
-    """Gera grafo dirigido."""
-    if numA > numV * (numV - 1):
+    u, v, metodo_usado = geraArestasUnicas(numV, numA, False, metodo, rng)
+    arestas = formataArestas(u, v, numV, formato, ordenar=False)
+    return (arestas, metodo_usado) if informar_metodo else arestas
+
+
+def geraGrafoDirigido(numV, numA, metodo='auto', rng=None, formato='tuplas', informar_metodo=False):
+    """Gera grafo dirigido (metodo, formato e informar_metodo como em geraGrafoSimples)."""
+    validaFormato(formato)
+    max_arestas = numV * (numV - 1)
+    if numA > max_arestas:
         raise ArestasInsuficientesError(
             "Número de arestas excede o máximo permitido para um digrafo."
         )
     
-    arestas_set = set()
-    tentativas = 0
-    limite = MAX_TENTATIVAS * max(1, numA)
-    while len(arestas_set) < numA and tentativas < limite:
-        u = random.randint(0, numV - 1)
-        v = random.randint(0, numV - 1)
-        tentativas += 1
-        if u != v:
-            aresta = (u, v)
-            if aresta not in arestas_set:
-                arestas_set.add(aresta)
+    u, v, metodo_usado = geraArestasUnicas(numV, numA, True, metodo, rng)
+    arestas = formataArestas(u, v, numV, formato, ordenar=False)
+    return (arestas, metodo_usado) if informar_metodo else arestas
+
+
+def sorteiaPares(numV, quantidade, gen, lacos, dirigido):
+    """
+    Sorteia quantidade pares (u, v) uniformes e independentes, em bloco.
+    
+    Sem laços, v é sorteado entre os numV - 1 vértices diferentes de u
+    (deslocando os valores >= u), o que dispensa rejeição. Para grafos não
+    dirigidos os pares saem normalizados com u <= v.
     
-    return list(arestas_set)
+    Returns:
+        tuple: Vetores (u, v) int32, ou int64 se numV não cabe em int32
+    """
+    tipo = tipoVertices(numV)
+    u = gen.integers(0, numV, size=quantidade, dtype=tipo)
+    if lacos:
+        v = gen.integers(0, numV, size=quantidade, dtype=tipo)
+    else:
+        v = gen.integers(0, numV - 1, size=quantidade, dtype=tipo)
+        v += (v >= u)
+    if not dirigido:
+        menor = np.minimum(u, v)
+        np.maximum(u, v, out=v)
+        u = menor
+    return u, v
 
 
-def geraMultigrafo(numV, numA, dirigido=False):
-    """Gera multigrafo simples ou dirigido."""
-    arestas = []
+def possuiArestaRepetida(u, v, numV, total_pares):
+    """
+    Verifica, de forma vetorizada, se há alguma aresta repetida em (u, v).
     
-    # Gera arestas normais
-    while len(arestas) < numA - 1:
-        u = random.randint(0, numV - 1)
-        v = random.randint(0, numV - 1)
-        if u != v:
-            if dirigido:
-                aresta = (u, v)
-            else:
-                aresta = (min(u, v), max(u, v))
-            arestas.append(aresta)
+    Pelo paradoxo do aniversário, um prefixo de k arestas uniformes já contém
+    repetição com probabilidade ~1 - exp(-k²/2P), P = total_pares. O prefixo
+    com k²/2P = 40 é verificado primeiro; o vetor inteiro só é ordenado no
+    caso (raro) de o prefixo não ter repetição. Mais arestas que pares
+    possíveis implicam repetição.
+    """
+    m = u.size
+    if m > total_pares:
+        return True
+    k = min(m, int(math.sqrt(80 * total_pares)) + 1)
+    if temChaveRepetida(codificaArestas(u[:k], v[:k], numV, dirigido=True)):
+        return True
+    if k == m:
+        return False
+    return temChaveRepetida(codificaArestas(u, v, numV, dirigido=True))
+
+
+def geraMultigrafo(numV, numA, dirigido=False, rng=None, formato='tuplas'):
+    """
+    Gera multigrafo simples ou dirigido.
+    
+    As numA arestas são sorteadas em bloco com NumPy, sem laços. Se as
+    primeiras numA - 1 já contêm uma aresta repetida, a última é um par
+    uniforme independente; caso contrário, ela repete uma aresta sorteada
+    entre as anteriores, garantindo ao menos uma aresta múltipla.
+    
+    Com formato='array', retorna o array (E, 2) ordenado (ver formataArestas);
+    com 'tuplas', a lista na ordem de geração.
+    
+    Raises:
+        ArestasInsuficientesError: Se numV < 2 ou numA < 2 (não há como
+            haver aresta múltipla)
+    """
+    validaFormato(formato)
+    if numV < 2 or numA < 2:
+        raise ArestasInsuficientesError(
+            f"Multigrafo exige ao menos 2 vértices e 2 arestas (recebidos {numV} vértices e {numA} arestas)"
+        )
+    gen = comoGenerator(rng)
+    total_pares = numV * (numV - 1) if dirigido else numV * (numV - 1) // 2
+    
+    u, v = sorteiaPares(numV, numA, gen, lacos=False, dirigido=dirigido)
     
     # Garante que há pelo menos uma aresta múltipla
-    if len(set(arestas)) == len(arestas):
-        aresta_existente = random.choice(arestas)
-        arestas.append(aresta_existente)
+    if not possuiArestaRepetida(u[:-1], v[:-1], numV, total_pares):
+        k = gen.integers(0, numA - 1)
+        u[-1], v[-1] = u[k], v[k]
     
-    return arestas
+    return formataArestas(u, v, numV, formato, ordenar=(formato == 'array'))
 
 
-def geraPseudografo(numV, numA, dirigido=False):
-    """Gera pseudografo simples ou dirigido."""
-    arestas = []
-    loop = False
-    
-    # Gera arestas normais
-    while len(arestas) < numA - 1:
-        u = random.randint(0, numV - 1)
-        v = random.randint(0, numV - 1)
-        if dirigido:
-            aresta = (u, v)
-        else:
-            aresta = (min(u, v), max(u, v))
-        arestas.append(aresta)
-        if u == v:
-            loop = True
+def geraPseudografo(numV, numA, dirigido=False, rng=None, formato='tuplas'):
+    """
+    Gera pseudografo simples ou dirigido (formato como em geraMultigrafo).
+    
+    As numA arestas são sorteadas em bloco, com laços permitidos. Se as
+    primeiras numA - 1 não contêm laço, a última é um laço em vértice
+    sorteado, garantindo ao menos um laço.
+    
+    Raises:
+        ArestasInsuficientesError: Se numV < 1 ou numA < 1
+    """
+    validaFormato(formato)
+    if numV < 1 or numA < 1:
+        raise ArestasInsuficientesError(
+            f"Pseudografo exige ao menos 1 vértice e 1 aresta (recebidos {numV} vértices e {numA} arestas)"
+        )
+    gen = comoGenerator(rng)
+    
+    u, v = sorteiaPares(numV, numA, gen, lacos=True, dirigido=dirigido)
     
     # Garante que há pelo menos um laço
-    if not loop:
-        u = random.randint(0, numV - 1)
-        arestas.append((u, u))
+    if not np.any(u[:-1] == v[:-1]):
+        u[-1] = v[-1] = gen.integers(0, numV)
     
-    return arestas
+    return formataArestas(u, v, numV, formato, ordenar=(formato == 'array'))
+
 
+def geraPesos(numArestas, minPeso=PESO_MIN_PADRAO, maxPeso=PESO_MAX_PADRAO, rng=None):
+    """
+    Sorteia os pesos de um grafo valorado em uma única chamada.
+
+    O vetor é alinhado às arestas: pesos[k] é o peso da k-ésima aresta, e
+    cada cópia de uma aresta múltipla tem o seu próprio peso. As visões
+    valoradas (adjacencia.criaAdjacenciaCSR, utils.criaMatrizAdjacenciasValorada)
+    são montadas a partir dele quando necessárias.
+
+    Args:
+        numArestas (int): Número de arestas (len do array de arestas)
+        minPeso (int): Peso mínimo (inclusivo)
+        maxPeso (int): Peso máximo (inclusivo)
+        rng: random.Random, np.random.Generator ou None (ver comoGenerator)
+
+    Returns:
+        np.ndarray: Pesos int64 uniformes em [minPeso, maxPeso]
 
-def geraDataset(tipo, numV, numA, seed, n, numC, fator, medir_tempo=False):
-    """Função principal para gerar datasets de grafos."""
-    random.seed(seed)
-    datasets = []
+    Raises:
+        ParametrosInvalidosError: Se minPeso > maxPeso
+    """
+    if minPeso > maxPeso:
+        raise ParametrosInvalidosError(f"Peso mínimo {minPeso} maior que o máximo {maxPeso}")
+    return comoGenerator(rng).integers(minPeso, maxPeso, size=numArestas, endpoint=True, dtype=np.int64)
+
+
+def geraDatasetIter(tipo, numV, numA, seed, n, numC, fator, medir_tempo=False, metodo='auto',
+                    rng=None, formato='tuplas', informar_metodo=False, estatisticas=False, registro=False):
+    """
+    Versão preguiçosa de geraDataset: produz um grafo por vez.
     
-    if numC > 1:
-        # Geração com múltiplas componentes
-        tentativas = 0
-        while len(datasets) != n and tentativas < MAX_TENTATIVAS:
-            tentativas += 1
-            t0 = time.perf_counter()
-            grafo = geraComponente(tipo, numV, numA, numC, fator)
-            if grafo is not None:
-                tempo_s = time.perf_counter() - t0
-                if medir_tempo:
-                    datasets.append((sorted(list(grafo)), tempo_s))
-                else:
-                    datasets.append(sorted(list(grafo)))
-                tentativas = 0
-            else:
-                continue
+    Cada grafo é gerado apenas quando solicitado, de forma que o chamador pode
+    gerar, medir e descartar um grafo antes de gerar o próximo. O pico de
+    memória passa a ser o de um grafo, e não o de n grafos.
+    
+    Args:
+        Os mesmos de geraDataset.
+    
+    Yields:
+        list ou tuple: Arestas ordenadas (lista de tuplas ou, com
+        formato='array', array (E, 2) int32/int64) ou, se medir_tempo=True,
+        a tupla (arestas, tempo_s) com o tempo de geração daquele grafo. Com
+        informar_metodo=True, o algoritmo usado é acrescentado:
+        (arestas, tempo_s, metodo) ou (arestas, metodo). Com
+        estatisticas=True, as estatísticas básicas do grafo
+        (estatisticas.EstatisticasArestas) vêm em seguida, calculadas por
+        estatisticasGrafo em uma passada NumPy sobre as arestas depois da
+        geração, fora de tempo_s. Com registro=True, o registro de geração
+        (registroGeracao) vem por último
+    
+    Raises:
+        ArestasInsuficientesError, ComponentesInvalidasError: Se os parâmetros
+            de componentes são impossíveis (ver geraComponente)
+        TentativasExcedidasError: Se a construção de um grafo com componentes
+            não atingir numA arestas
+        ParametrosInvalidosError: Se o tipo de grafo é inválido
+    
+    Note:
+        Sem rng, usa random.Random(seed), que reproduz o fluxo de
+        random.seed(seed) sem tocar no estado global. Com rng (random.Random
+        ou np.random.Generator), seed é ignorada.
+    
+    Example:
+        >>> for arestas, tempo_s in geraDatasetIter(0, 100, 300, 42, 50, 0, 0, medir_tempo=True):
+        ...     processa(arestas)  # apenas um grafo em memória por vez
+    """
+    validaFormato(formato)
+    rng = random.Random(seed) if rng is None else comoRandom(rng)
+    
+    for _ in range(n):
+        t0 = time.perf_counter()
+        verticesComp = arestasComp = None
+        if numC > 1:
+            # Múltiplas componentes (alocação construtiva, sem retentativas)
+            arestas, verticesComp, arestasComp = geraComponente(tipo, numV, numA, numC, fator, rng, formato,
+                                                                informar_componentes=True)
+            metodo_usado = 'componentes'
+        elif tipo == 0:
+            arestas, metodo_usado = geraGrafoSimples(numV, numA, metodo, rng, formato, informar_metodo=True)
+        elif tipo == 1:
+            arestas, metodo_usado = geraGrafoDirigido(numV, numA, metodo, rng, formato, informar_metodo=True)
+        elif tipo == 20:
+            arestas = geraMultigrafo(numV, numA, dirigido=False, rng=rng, formato=formato)
+            metodo_usado = 'lote'
+        elif tipo == 21:
+            arestas = geraMultigrafo(numV, numA, dirigido=True, rng=rng, formato=formato)
+            metodo_usado = 'lote'
+        elif tipo == 30:
+            arestas = geraPseudografo(numV, numA, dirigido=False, rng=rng, formato=formato)
+            metodo_usado = 'lote'
+        elif tipo == 31:
+            arestas = geraPseudografo(numV, numA, dirigido=True, rng=rng, formato=formato)
+            metodo_usado = 'lote'
+        else:
+            raise ParametrosInvalidosError(f"Tipo de grafo inválido: {tipo}")
+        tempo_s = time.perf_counter() - t0
+        
+        # Tipos 0 e 1 conexos, e qualquer tipo no formato 'array', já saem ordenados
+        if formato == 'tuplas' and (numC > 1 or tipo not in (0, 1)):
+            arestas = sorted(arestas)
         
-        if tentativas >= MAX_TENTATIVAS:
-            raise TentativasExcedidasError(
-                "Número máximo de tentativas atingido. Considere alterar parâmetros."
+        item = (arestas,)
+        if medir_tempo:
+            item += (tempo_s,)
+        if informar_metodo:
+            item += (metodo_usado,)
+        if estatisticas:
+            item += (estatisticasGrafo(arestas, numV, tipo in TIPOS_DIRIGIDOS),)
+        if registro:
+            item += (registroGeracao(tipo, numV, numA, numC, fator, metodo_usado, verticesComp, arestasComp),)
+        yield item if len(item) > 1 else arestas
+
+
+def geraVarreduraDensidade(tipo, numV, niveisA, rng=None, formato='tuplas'):
+    """
+    Gera uma família aninhada de grafos conexos com densidade crescente.
+    
+    Para tipos 0 e 1, o grafo de cada nível é um prefixo de uma permutação
+    aleatória do espaço de pares. A permutação não é materializada: cada
+    nível acrescenta ao anterior uma amostra uniforme dos pares ainda
+    ausentes (estendeAmostraPares), o que tem a mesma distribuição dos
+    prefixos de uma permutação uniforme. Cada nível é, isoladamente, uma
+    amostra uniforme com numA arestas, e só o incremento é sorteado.
+    
+    Para multigrafos e pseudografos, os níveis são prefixos de uma única
+    sequência de pares sorteados em lote (ver sorteiaPares). A garantia de
+    aresta múltipla ou laço é aplicada à última aresta de cada nível, como
+    em geraMultigrafo e geraPseudografo.
+    
+    Args:
+        tipo (int): Tipo do grafo (0, 1, 20, 21, 30, 31)
+        numV (int): Número de vértices
+        niveisA (list): Números de arestas desejados (qualquer ordem)
+        rng: random.Random ou np.random.Generator (ver comoRandom)
+        formato (str): 'tuplas' ou 'array' (ver formataArestas)
+    
+    Yields:
+        tuple: (numA, arestas, tempo_s) em ordem crescente de numA, com as
+        arestas ordenadas e tempo_s o custo incremental daquele nível
+    
+    Raises:
+        ParametrosInvalidosError: Se o tipo de grafo é inválido
+        ArestasInsuficientesError: Se algum nível excede o máximo de arestas
+            (tipos 0 e 1) ou não comporta a característica exigida
+    
+    Example:
+        >>> for numA, arestas, tempo_s in geraVarreduraDensidade(0, 1000, [1e4, 1e5, 4e5]):
+        ...     processa(arestas)  # o nível seguinte reaproveita estas arestas
+    """
+    if tipo not in TIPOS_VALIDOS:
+        raise ParametrosInvalidosError(f"Tipo de grafo inválido: {tipo}")
+    validaFormato(formato)
+    niveis = sorted({int(numA) for numA in niveisA})
+    if not niveis:
+        return
+    gen = comoGenerator(rng)
+    dirigido = tipo in TIPOS_DIRIGIDOS
+    
+    if tipo in (0, 1):
+        total_pares = numV * (numV - 1) if dirigido else numV * (numV - 1) // 2
+        if niveis[-1] > total_pares:
+            raise ArestasInsuficientesError(
+                f"Nível com {niveis[-1]} arestas excede o máximo de {total_pares} para o tipo {tipo}"
             )
+        indices = np.empty(0, dtype=np.int64)
+        for numA in niveis:
+            t0 = time.perf_counter()
+            indices = estendeAmostraPares(indices, numA, numV, dirigido, gen)
+            u, v = decodificaIndicesPares(indices, numV, dirigido, ordenados=True)
+            arestas = formataArestas(u, v, numV, formato, ordenar=False)
+            yield numA, arestas, time.perf_counter() - t0
+        return
+    
+    # Multigrafos e pseudografos: prefixos de uma sequência de pares i.i.d.
+    lacos = tipo in TIPOS_PSEUDOGRAFOS
+    minimo = 1 if lacos else 2
+    if numV < minimo or niveis[0] < minimo:
+        raise ArestasInsuficientesError(
+            f"Tipo {tipo} exige ao menos {minimo} vértices e {minimo} arestas por nível"
+        )
+    total_pares = numV * (numV - 1) if dirigido else numV * (numV - 1) // 2
+    t0 = time.perf_counter()
+    seqU, seqV = sorteiaPares(numV, niveis[-1], gen, lacos=lacos, dirigido=dirigido)
+    custo_sorteio = time.perf_counter() - t0
+    for numA in niveis:
+        t0 = time.perf_counter()
+        u, v = seqU[:numA].copy(), seqV[:numA].copy()
+        if lacos and not np.any(u[:-1] == v[:-1]):
+            u[-1] = v[-1] = gen.integers(0, numV)
+        elif not lacos and not possuiArestaRepetida(u[:-1], v[:-1], numV, total_pares):
+            k = gen.integers(0, numA - 1)
+            u[-1], v[-1] = u[k], v[k]
+        arestas = formataArestas(u, v, numV, formato, ordenar=True)
+        # O sorteio em lote é atribuído ao primeiro nível
+        yield numA, arestas, time.perf_counter() - t0 + custo_sorteio
+        custo_sorteio = 0.0
+
+
+def amostraParesReplicas(total_pares, quantidade, gens):
+    """
+    Amostra, para cada gerador de gens, quantidade pares distintos de [0, total_pares).
+    
+    As réplicas ocupam faixas disjuntas de um único ConjuntoBits (a réplica r
+    usa os índices r * total_pares + k), e cada rodada de rejeição deduplica
+    e marca os candidatos de todas as réplicas em uma única operação. Cada
+    réplica sorteia candidatos apenas do próprio gerador e, quando um lote
+    traz mais inéditos que o necessário, mantém um subconjunto uniforme deles
+    (como em amostraArestasBitset): sua amostra é uniforme e não depende das
+    demais réplicas.
+    
+    Returns:
+        np.ndarray: Chaves int64 r * total_pares + k em ordem crescente
+        (quantidade por réplica, agrupadas por réplica)
+    """
+    R = len(gens)
+    vistos = ConjuntoBits(R * total_pares)
+    faltam = np.full(R, quantidade, dtype=np.int64)
+    aceitos = []
+    
+    while faltam.any():
+        ativas = np.flatnonzero(faltam)
+        p_valido = 1 - (quantidade - faltam[ativas]) / total_pares
+        lotes = np.minimum(LOTE_MAX_CANDIDATOS, (faltam[ativas] / p_valido * 1.1).astype(np.int64) + 64)
+        chaves = np.concatenate([
+            gens[r].integers(0, total_pares, size=lote, dtype=np.int64) for r, lote in zip(ativas, lotes)
+        ])
+        chaves += np.repeat(ativas * total_pares, lotes)
+        
+        # Inéditos ordenados: os de cada réplica ficam contíguos
+        chaves = vistos.ineditos(chaves)
+        contagens = np.bincount(chaves // total_pares, minlength=R)
+        excedentes = np.flatnonzero(contagens > faltam)
+        if excedentes.size:
+            inicios = np.cumsum(contagens) - contagens
+            partes = []
+            anterior = 0
+            for r in excedentes:
+                partes.append(chaves[anterior:inicios[r]])
+                trecho = chaves[inicios[r]:inicios[r] + contagens[r]]
+                partes.append(np.sort(gens[r].choice(trecho, faltam[r], replace=False)))
+                anterior = inicios[r] + contagens[r]
+            partes.append(chaves[anterior:])
+            chaves = np.concatenate(partes)
+            contagens = np.minimum(contagens, faltam)
+        vistos.marca(chaves, ordenados=True)
+        
+        faltam -= contagens
+        aceitos.append(chaves)
+    
+    if not aceitos:
+        return np.empty(0, dtype=np.int64)
+    return np.sort(np.concatenate(aceitos))
+
+
+def decodificaReplicas(chaves, total_pares, numV, dirigido, R):
+    """
+    Decodifica chaves r * total_pares + k ordenadas em (u, v).
+    
+    Extensão de decodificaIndicesPares(ordenados=True) às R faixas: os
+    deslocamentos de linha de todas as réplicas formam um único vetor
+    crescente, e a linha de cada chave sai de uma busca e um np.repeat.
+    """
+    linhas = np.arange(numV, dtype=np.int64)
+    if dirigido:
+        deslocamentos = linhas * (numV - 1)
     else:
-        # Geração de grafo conexo
-        for _ in range(n):
-            if tipo == 0:
-                t0 = time.perf_counter()
-                arestas = geraGrafoSimples(numV, numA)
-            elif tipo == 1:
-                t0 = time.perf_counter()
-                arestas = geraGrafoDirigido(numV, numA)
-            elif tipo == 20:
-                t0 = time.perf_counter()
-                arestas = geraMultigrafo(numV, numA, dirigido=False)
-            elif tipo == 21:
-                t0 = time.perf_counter()
-                arestas = geraMultigrafo(numV, numA, dirigido=True)
-            elif tipo == 30:
-                t0 = time.perf_counter()
-                arestas = geraPseudografo(numV, numA, dirigido=False)
-            elif tipo == 31:
-                t0 = time.perf_counter()
-                arestas = geraPseudografo(numV, numA, dirigido=True)
-            else:
-                raise ParametrosInvalidosError(f"Tipo de grafo inválido: {tipo}")
-            
-            tempo_s = time.perf_counter() - t0
-            if medir_tempo:
-                datasets.append((sorted(list(arestas)), tempo_s))
-            else:
-                datasets.append(sorted(list(arestas)))
+        deslocamentos = linhas * (2 * numV - linhas - 1) // 2
+    deslocamentos = (np.arange(R, dtype=np.int64)[:, None] * total_pares + deslocamentos).ravel()
+    contagens = np.diff(np.searchsorted(chaves, deslocamentos), append=chaves.size)
+    linha = np.repeat(np.arange(deslocamentos.size, dtype=np.int64), contagens)
+    resto = chaves - deslocamentos[linha]
+    u = linha % numV
+    if dirigido:
+        return u, resto + (resto >= u)
+    return u, resto + u + 1
+
+
+def replicasEmConjunto(tipo, numV, numA, numC=0):
+    """
+    Se geraReplicas gera as réplicas de (tipo, numV, numA, numC) em conjunto.
+    
+    Exige numC <= 1 e numA <= ARESTAS_MAX_REPLICAS_LOTE; nos tipos 0 e 1,
+    também que o bitset conjunto (total_pares bits) não passe de 32 bytes por
+    aresta. Caso contrário, geraReplicas gera réplica a réplica.
+    
+    Example:
+        >>> replicasEmConjunto(0, 100, 300)
+        True
+        >>> replicasEmConjunto(0, 20000, 500)
+        False
+    """
+    if numC > 1 or numA > ARESTAS_MAX_REPLICAS_LOTE:
+        return False
+    if tipo in (0, 1):
+        total_pares = numV * (numV - 1) if tipo in TIPOS_DIRIGIDOS else numV * (numV - 1) // 2
+        return (total_pares + 7) // 8 <= 32 * numA
+    return True
+
+
+def geraReplicas(tipo, numV, numA, rngs, numC=0, fator=0, informar_metodo=False):
+    """
+    Gera len(rngs) réplicas independentes de (tipo, numV, numA, numC) em lote.
+    
+    A réplica r depende apenas de rngs[r], portanto qualquer subconjunto de
+    réplicas pode ser regenerado isoladamente com os mesmos geradores.
+    
+    Até ARESTAS_MAX_REPLICAS_LOTE arestas por réplica, o custo de cada
+    chamada de geraDataset é dominado pelo overhead Python, e as réplicas
+    são geradas em conjunto:
+    - tipos 0 e 1: rejeição conjunta em faixas disjuntas de um bitset
+      (amostraParesReplicas) ou, acima de LIMIAR_DENSIDADE_COMPLEMENTO, uma
+      matriz (R, total_pares) de presença; em ambos os casos, uma única
+      decodificação (decodificaReplicas)
+    - multigrafos e pseudografos: matriz (R, numA) de pares, com a garantia
+      de aresta múltipla ou laço verificada por linha; cada réplica é idêntica
+      a geraMultigrafo/geraPseudografo(formato='array') com o mesmo gerador
+    Acima do limite, com numC > 1, ou se o bitset conjunto for maior que 32
+    bytes por aresta (ver replicasEmConjunto), cada réplica é gerada por
+    geraDatasetIter.
+    
+    Args:
+        tipo (int): Tipo do grafo (0, 1, 20, 21, 30, 31)
+        numV (int): Número de vértices
+        numA (int): Número de arestas de cada réplica
+        rngs (list): Um gerador por réplica (random.Random ou
+            np.random.Generator, ver comoGenerator)
+        numC (int): Número de componentes (como em geraDataset)
+        fator (int): Fator de distribuição de vértices (como em geraDataset)
+        informar_metodo (bool): Se True, retorna também o algoritmo de cada
+            réplica ('bitset' ou 'complemento' na amostragem conjunta dos
+            tipos 0 e 1, 'lote' nos multigrafos; o de geraDatasetIter nas
+            réplicas geradas uma a uma)
+    
+    Returns:
+        tuple: (arestas, deslocamentos), com arestas o array (R * numA, 2)
+        int32/int64 das réplicas empilhadas, cada uma em ordem lexicográfica,
+        e deslocamentos o vetor int64 de R + 1 posições: a réplica r é
+        arestas[deslocamentos[r]:deslocamentos[r + 1]]; com informar_metodo,
+        (arestas, deslocamentos, metodos), metodos uma lista de R rótulos
+    
+    Raises:
+        ParametrosInvalidosError: Se o tipo de grafo é inválido
+        ArestasInsuficientesError: Se numA não é compatível com o tipo
+    
+    Example:
+        >>> rngs = [np.random.default_rng([42, r]) for r in range(50)]
+        >>> arestas, deslocamentos = geraReplicas(0, 100, 300, rngs)
+        >>> replica_7 = arestas[deslocamentos[7]:deslocamentos[8]]
+    """
+    if tipo not in TIPOS_VALIDOS:
+        raise ParametrosInvalidosError(f"Tipo de grafo inválido: {tipo}")
+    R = len(rngs)
+    dirigido = tipo in TIPOS_DIRIGIDOS
+    total_pares = numV * (numV - 1) if dirigido else numV * (numV - 1) // 2
+    deslocamentos = np.arange(R + 1, dtype=np.int64) * numA
+    if R == 0:
+        vazio = np.empty((0, 2), dtype=tipoVertices(numV))
+        return (vazio, deslocamentos, []) if informar_metodo else (vazio, deslocamentos)
+    
+    if tipo in (0, 1) and numA > total_pares:
+        raise ArestasInsuficientesError(
+            f"Número de arestas ({numA}) excede o máximo de {total_pares} para o tipo {tipo}"
+        )
+    if not replicasEmConjunto(tipo, numV, numA, numC):
+        blocos, metodos = zip(*(
+            next(geraDatasetIter(tipo, numV, numA, None, 1, numC, fator, rng=rng, formato='array',
+                                 informar_metodo=True))
+            for rng in rngs
+        ))
+        arestas = np.concatenate(blocos)
+        return (arestas, deslocamentos, list(metodos)) if informar_metodo else (arestas, deslocamentos)
+    
+    gens = [comoGenerator(rng) for rng in rngs]
+    if tipo in (0, 1):
+        metodo = 'complemento' if numA / total_pares > LIMIAR_DENSIDADE_COMPLEMENTO else 'bitset'
+        if metodo == 'complemento':
+            # Ausentes sorteados como em amostraArestasComplemento, réplica a réplica
+            presentes = np.ones((R, total_pares), dtype=bool)
+            for r, gen in enumerate(gens):
+                presentes[r, gen.choice(total_pares, total_pares - numA, replace=False, shuffle=False)] = False
+            chaves = np.flatnonzero(presentes)
+        else:
+            chaves = amostraParesReplicas(total_pares, numA, gens)
+        u, v = decodificaReplicas(chaves, total_pares, numV, dirigido, R)
+        arestas = formataArestas(u, v, numV, 'array', ordenar=False)
+        return (arestas, deslocamentos, [metodo] * R) if informar_metodo else (arestas, deslocamentos)
+    
+    lacos = tipo in TIPOS_PSEUDOGRAFOS
+    if lacos and (numV < 1 or numA < 1):
+        raise ArestasInsuficientesError(
+            f"Pseudografo exige ao menos 1 vértice e 1 aresta (recebidos {numV} vértices e {numA} arestas)"
+        )
+    if not lacos and (numV < 2 or numA < 2):
+        raise ArestasInsuficientesError(
+            f"Multigrafo exige ao menos 2 vértices e 2 arestas (recebidos {numV} vértices e {numA} arestas)"
+        )
+    
+    u = np.empty((R, numA), dtype=tipoVertices(numV))
+    v = np.empty_like(u)
+    for r, gen in enumerate(gens):
+        u[r], v[r] = sorteiaPares(numV, numA, gen, lacos, dirigido)
+    
+    # Mesma garantia de geraMultigrafo/geraPseudografo, verificada por linha
+    if lacos:
+        sem_garantia = ~np.any(u[:, :-1] == v[:, :-1], axis=1)
+    else:
+        chaves = np.sort(codificaArestas(u[:, :-1], v[:, :-1], numV, dirigido=True), axis=1)
+        sem_garantia = ~np.any(chaves[:, 1:] == chaves[:, :-1], axis=1)
+    for r in np.flatnonzero(sem_garantia):
+        if lacos:
+            u[r, -1] = v[r, -1] = gens[r].integers(0, numV)
+        else:
+            k = gens[r].integers(0, numA - 1)
+            u[r, -1], v[r, -1] = u[r, k], v[r, k]
+    
+    chaves = np.sort(codificaArestas(u, v, numV, dirigido=True), axis=1)
+    u, v = decodificaChaves(chaves.ravel(), numV)
+    arestas = formataArestas(u, v, numV, 'array', ordenar=False)
+    return (arestas, deslocamentos, ['lote'] * R) if informar_metodo else (arestas, deslocamentos)
+
+
+def sementeGrafo(seed, i):
+    """
+    Deriva a semente independente do i-ésimo grafo de um dataset.
+    
+    Usa np.random.SeedSequence com spawn_key=(i,), de forma que cada grafo tem
+    um fluxo aleatório próprio, determinado apenas por (seed, i) e não pelos
+    sorteios dos grafos anteriores.
+    """
+    estado = np.random.SeedSequence(seed, spawn_key=(i,)).generate_state(4)
+    return int.from_bytes(estado.tobytes(), "little")
+
+
+def _geraGrafoIndependente(args):
+    """Gera o i-ésimo grafo com semente própria (executado nos processos do pool)."""
+    tipo, numV, numA, seed, i, numC, fator, medir_tempo, metodo, formato, informar_metodo, estatisticas, registro = args
+    return next(geraDatasetIter(
+        tipo, numV, numA, sementeGrafo(seed, i), 1, numC, fator, medir_tempo, metodo,
+        formato=formato, informar_metodo=informar_metodo, estatisticas=estatisticas, registro=registro
+    ))
+
+
+def geraDataset(tipo, numV, numA, seed, n, numC, fator, medir_tempo=False, metodo='auto',
+                workers=None, rng=None, formato='tuplas', informar_metodo=False, estatisticas=False,
+                registro=False):
+    """
+    Função principal para gerar datasets de grafos.
+    
+    O parâmetro metodo seleciona o algoritmo usado para grafos conexos
+    simples (0) e dirigidos (1). 'auto' (padrão) escolhe entre rejeição,
+    bitset e complemento por (numV, numA) e troca para o complemento se a
+    taxa de rejeição medida passar de LIMIAR_TAXA_REJEICAO; 'rejeicao',
+    'indice', 'complemento' e 'bitset' fixam o algoritmo (ver
+    geraArestasUnicas). Com informar_metodo=True, cada item traz ao final o
+    algoritmo efetivamente usado ('lote' para multigrafos e pseudografos,
+    'componentes' para numC > 1), para correlacionar com tempo_s. Com
+    estatisticas=True, cada item traz também, por último, os graus e as
+    contagens básicas do grafo (estatisticas.EstatisticasArestas), obtidos
+    em uma passada NumPy sobre as arestas depois da geração (só
+    disco.geraGrafoEmDisco acumula enquanto emite), de forma que as métricas
+    básicas dispensam o grafo NetworkX montado.
+    Com registro=True, o último elemento é o registro de geração
+    (registroGeracao): componentes, laços e arestas múltiplas garantidos
+    por construção.
+    
+    Todos os n grafos são mantidos em memória; para processá-los um a um,
+    use geraDatasetIter.
+    
+    Com workers definido, cada grafo i usa a semente independente
+    sementeGrafo(seed, i) e os grafos são gerados em um pool de workers
+    processos. O resultado depende apenas de (seed, i), e não do número de
+    workers: workers=1 gera, sequencialmente, os mesmos grafos que workers=32.
+    Com workers=None (padrão), mantém o fluxo único de random.Random(seed).
+    
+    Um rng explícito (random.Random ou np.random.Generator) substitui a seed;
+    no modo com workers, a semente base é então sorteada desse rng.
+    
+    Com formato='array', cada grafo é um array NumPy contíguo (E, 2) int32
+    (int64 se numV não cabe em int32), ordenado lexicograficamente: cerca de
+    8 bytes por aresta, contra ~100 bytes por tupla de inteiros Python. A
+    lista de tuplas equivalente é obtida com arestas.arrayParaTuplas.
+    """
+    validaFormato(formato)
+    if workers is None:
+        return list(geraDatasetIter(tipo, numV, numA, seed, n, numC, fator, medir_tempo, metodo, rng,
+                                    formato, informar_metodo, estatisticas, registro))
     
-    return datasets
\ No newline at end of file
+    if rng is not None:
+        seed = comoRandom(rng).getrandbits(128)
+    tarefas = [(tipo, numV, numA, seed, i, numC, fator, medir_tempo, metodo, formato, informar_metodo,
+                estatisticas, registro) for i in range(n)]
+    if workers <= 1:
+        return [_geraGrafoIndependente(tarefa) for tarefa in tarefas]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_geraGrafoIndependente, tarefas))
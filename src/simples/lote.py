@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Geração em lote, não interativa, de datasets do gerador simples.
+
+Lê uma grade de parâmetros (arquivo JSON/CSV ou listas na linha de comando),
+gera todos os grafos em um pool de processos e grava cada grafo, no próprio
+worker, em formato compacto de lista de arestas:
+
+- npy: array (E, 2) int32/int64 (np.load), 8 bytes por aresta
+- npz: o mesmo array comprimido (np.savez_compressed, chave 'arestas')
+- txt: uma aresta "u v" por linha
+
+Cada grafo i de uma combinação usa a semente sementeGrafo(seed, i), de forma
+que o arquivo é idêntico a geraDataset(..., workers=k, formato='array')[i]
+para qualquer número de workers. Um manifesto CSV registra, por grafo, os
+parâmetros, o arquivo, o tempo de geração, o algoritmo usado ou o erro.
+
+Example:
+    $ python lote.py --tipos 0 20 --vertices 1000 10000 --densidades 0.01 0.1 \\
+          --seeds 1 2 --n 100 --workers 8 --saida ../datasets
+    $ python lote.py --grade grade.csv --formato npz --saida ../datasets
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+import numpy as np
+
+from constants import TIPOS_GRAFOS, TIPOS_VALIDOS, TIPOS_DIRIGIDOS, TIPOS_PSEUDOGRAFOS, GERACAO, FORMATOS_LOTE
+from exceptions import ParametrosInvalidosError
+from gerador import geraDatasetIter, sementeGrafo
+
+# Arestas convertidas para texto por vez (formato txt)
+_LOTE_TEXTO = 1 << 20
+
+# Colunas do manifesto, na ordem em que são gravadas
+COLUNAS_MANIFESTO = ['arquivo', 'tipo', 'numV', 'numA', 'numC', 'fator', 'seed', 'indice',
+                     'arestas_geradas', 'tempo_s', 'metodo', 'erro']
+
+
+def maxArestasDensidade(tipo, numV):
+    """Número de arestas de densidade 1 (laços contam para pseudografos), como em main.py."""
+    pares = numV * (numV - 1) if tipo in TIPOS_DIRIGIDOS else numV * (numV - 1) // 2
+    return pares + numV if tipo in TIPOS_PSEUDOGRAFOS else pares
+
+
+def nomeArquivo(tipo, numV, numA, seed, i, numC, fator, formato):
+    """Nome do arquivo do i-ésimo grafo (0-based), no padrão de main.py."""
+    return f"{TIPOS_GRAFOS[tipo]}-{GERACAO[fator][0]}-{numV}-{numA}-{seed}-{i + 1}-{numC}.{formato}"
+
+
+def normalizaCombinacao(linha):
+    """
+    Converte uma linha da grade (dict) em combinação (tipo, numV, numA, numC, fator, seed, n).
+
+    numA pode ser substituído por densidade (fração de maxArestasDensidade).
+    numC, fator e n são opcionais (padrões 0, 0 e 1).
+
+    Raises:
+        ParametrosInvalidosError: Se faltam colunas ou o tipo é inválido
+    """
+    try:
+        tipo = int(linha['tipo'])
+        numV = int(linha['numV'])
+        seed = int(linha['seed'])
+        if linha.get('numA') not in (None, ''):
+            numA = int(linha['numA'])
+        else:
+            numA = int(round(float(linha['densidade']) * maxArestasDensidade(tipo, numV)))
+    except KeyError as e:
+        raise ParametrosInvalidosError(f"Coluna obrigatória ausente na grade: {e.args[0]}") from e
+    if tipo not in TIPOS_VALIDOS:
+        raise ParametrosInvalidosError(f"Tipo de grafo inválido: {tipo}")
+    numC = int(linha.get('numC') or 0)
+    fator = int(linha.get('fator') or 0)
+    n = int(linha.get('n') or 1)
+    return tipo, numV, numA, numC, fator, seed, n
+
+
+def leGrade(caminho):
+    """
+    Lê a grade de um arquivo JSON (lista de objetos) ou CSV (com cabeçalho).
+
+    As chaves/colunas são as de normalizaCombinacao: tipo, numV, numA ou
+    densidade, seed e, opcionalmente, numC, fator e n.
+    """
+    with open(caminho, newline='') as arquivo:
+        if caminho.endswith('.json'):
+            linhas = json.load(arquivo)
+        else:
+            linhas = list(csv.DictReader(arquivo))
+    return [normalizaCombinacao(linha) for linha in linhas]
+
+
+def gradeArgumentos(args):
+    """Produto cartesiano das listas da linha de comando."""
+    quantidades = args.arestas if args.arestas else args.densidades
+    chave = 'numA' if args.arestas else 'densidade'
+    return [
+        normalizaCombinacao({'tipo': tipo, 'numV': numV, chave: q, 'numC': numC,
+                             'fator': fator, 'seed': seed, 'n': args.n})
+        for tipo, numV, q, numC, fator, seed in product(
+            args.tipos, args.vertices, quantidades, args.componentes, args.fatores, args.seeds)
+    ]
+
+
+def gravaArestas(arestas, caminho, formato):
+    """Grava o array (E, 2) de arestas no formato compacto pedido."""
+    if formato == 'npy':
+        np.save(caminho, arestas)
+    elif formato == 'npz':
+        np.savez_compressed(caminho, arestas=arestas)
+    else:
+        # str.format sobre listas é ~3x mais rápido que np.savetxt (laço por linha)
+        with open(caminho, 'w') as arquivo:
+            for inicio in range(0, len(arestas), _LOTE_TEXTO):
+                bloco = arestas[inicio:inicio + _LOTE_TEXTO]
+                arquivo.write(''.join(map('{} {}\n'.format, bloco[:, 0].tolist(), bloco[:, 1].tolist())))
+
+
+def _geraEGrava(tarefa):
+    """
+    Gera e grava um grafo (executado nos processos do pool).
+
+    Qualquer falha (geração, OSError ao gravar, MemoryError) fica na coluna
+    erro da linha do manifesto, sem interromper as demais tarefas; um
+    arquivo gravado pela metade é removido.
+    """
+    tipo, numV, numA, numC, fator, seed, i, formato, saida = tarefa
+    arquivo = nomeArquivo(tipo, numV, numA, seed, i, numC, fator, formato)
+    linha = {'arquivo': arquivo, 'tipo': tipo, 'numV': numV, 'numA': numA, 'numC': numC,
+             'fator': fator, 'seed': seed, 'indice': i, 'arestas_geradas': 0,
+             'tempo_s': 0.0, 'metodo': '', 'erro': ''}
+    try:
+        arestas, tempo_s, metodo = next(geraDatasetIter(
+            tipo, numV, numA, sementeGrafo(seed, i), 1, numC, fator, medir_tempo=True,
+            formato='array', informar_metodo=True
+        ))
+        gravaArestas(arestas, os.path.join(saida, arquivo), formato)
+        linha.update(arestas_geradas=len(arestas), tempo_s=tempo_s, metodo=metodo)
+    except Exception as e:
+        caminho = os.path.join(saida, arquivo)
+        if os.path.isfile(caminho):
+            try:
+                os.remove(caminho)
+            except OSError:
+                pass
+        linha.update(arquivo='', erro=f"{type(e).__name__}: {e}")
+    return linha
+
+
+def _gravaLinha(escritor, linha):
+    """Grava a linha no manifesto assim que o grafo termina."""
+    escritor.writerow(linha)
+    return linha
+
+
+def executaLote(combinacoes, saida, formato='npy', workers=None, manifesto='manifesto.csv'):
+    """
+    Gera e grava todos os grafos das combinações.
+
+    Args:
+        combinacoes (list): Tuplas (tipo, numV, numA, numC, fator, seed, n)
+        saida (str): Diretório de saída (criado se não existe)
+        formato (str): Um de FORMATOS_LOTE
+        workers (int): Processos do pool (None: os.cpu_count(); 1: sequencial)
+        manifesto (str): Nome do manifesto CSV dentro de saida
+
+    Returns:
+        list: Uma linha do manifesto (dict com COLUNAS_MANIFESTO) por grafo, na ordem da grade
+    """
+    if formato not in FORMATOS_LOTE:
+        raise ParametrosInvalidosError(f"Formato inválido: {formato} (use um de {FORMATOS_LOTE})")
+    os.makedirs(saida, exist_ok=True)
+    tarefas = [(tipo, numV, numA, numC, fator, seed, i, formato, saida)
+               for tipo, numV, numA, numC, fator, seed, n in combinacoes
+               for i in range(n)]
+
+    with open(os.path.join(saida, manifesto), 'w', newline='') as arquivo:
+        escritor = csv.DictWriter(arquivo, fieldnames=COLUNAS_MANIFESTO)
+        escritor.writeheader()
+        if workers == 1:
+            linhas = map(_geraEGrava, tarefas)
+            return [_gravaLinha(escritor, linha) for linha in linhas]
+        workers = workers or os.cpu_count() or 1
+        # Várias tarefas por envio amortizam o custo de IPC em grafos pequenos
+        bloco = max(1, len(tarefas) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return [_gravaLinha(escritor, linha) for linha in executor.map(_geraEGrava, tarefas, chunksize=bloco)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Geração em lote de datasets do gerador simples')
+    parser.add_argument('--grade', help='Arquivo JSON ou CSV com a grade de parâmetros '
+                                        '(tipo, numV, numA ou densidade, seed, numC, fator, n)')
+    parser.add_argument('--tipos', nargs='+', type=int, default=[0], help='Tipos de grafo (padrão: 0)')
+    parser.add_argument('--vertices', nargs='+', type=int, help='Números de vértices')
+    quantidade = parser.add_mutually_exclusive_group()
+    quantidade.add_argument('--arestas', nargs='+', type=int, help='Números de arestas')
+    quantidade.add_argument('--densidades', nargs='+', type=float, help='Densidades (fração do máximo de arestas)')
+    parser.add_argument('--componentes', nargs='+', type=int, default=[0], help='Números de componentes (padrão: 0)')
+    parser.add_argument('--fatores', nargs='+', type=int, default=[0], help='Fatores de balanceamento (padrão: 0)')
+    parser.add_argument('--seeds', nargs='+', type=int, default=[0], help='Sementes (padrão: 0)')
+    parser.add_argument('--n', type=int, default=1, help='Grafos por combinação (padrão: 1)')
+    parser.add_argument('--formato', choices=FORMATOS_LOTE, default='npy', help='Formato dos arquivos (padrão: npy)')
+    parser.add_argument('--workers', type=int, default=None, help='Processos do pool (padrão: todos os núcleos)')
+    parser.add_argument('--saida', default='../datasets', help='Diretório de saída (padrão: ../datasets)')
+    args = parser.parse_args(argv)
+
+    if args.grade:
+        combinacoes = leGrade(args.grade)
+    elif args.vertices and (args.arestas or args.densidades):
+        combinacoes = gradeArgumentos(args)
+    else:
+        parser.error('informe --grade ou --vertices com --arestas/--densidades')
+
+    t0 = time.perf_counter()
+    linhas = executaLote(combinacoes, args.saida, args.formato, args.workers)
+    falhas = sum(1 for linha in linhas if linha['erro'])
+    print(f"{len(linhas) - falhas} grafos gravados em {args.saida} ({time.perf_counter() - t0:.1f}s)")
+    if falhas:
+        print(f"{falhas} grafos falharam; ver manifesto.csv")
+    return 1 if falhas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,13 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-from gerador import geraDataset, verificaAresta
-from utils import (
-    criaMatrizAdjacencias,
-    criaMatrizAdjacenciasValorada,
-    criaListaAdjacencias,
-    escreveMatrizParaArquivo,
-)
+from gerador import geraDatasetIter, geraPesos, sementeGrafo, verificaAresta
+from utils import criaAdjacenciaCSR, escreveAdjacenciaParaArquivo
 from visualizacao import verGrafo
 from constants import TIPOS_GRAFOS, GERACAO, DENSIDADE, PESO_MIN_PADRAO, PESO_MAX_PADRAO
 import random
 import math
 import sys
+import numpy as np
 
 
 def main():
@@ -77,25 +73,27 @@ def main():
         else:
             fator = 0
 
-        datasets = geraDataset(tipo, numV, numA, seed, n, numComp, fator)
+        # Gera, grava e descarta um grafo por vez
+        datasets = geraDatasetIter(tipo, numV, numA, seed, n, numComp, fator)
         
         for i, dataset in enumerate(datasets):
             nomeArq = f"{TIPOS_GRAFOS[tipo]}-{GERACAO[fator][0]}-{numV}-{numA}-{seed}-{i+1}-{numComp}"
             arq = f"../plots/{nomeArq}.txt"
 
-            if valorado:
-                matriz = criaMatrizAdjacenciasValorada(dataset, numV, tipo, minPeso, maxPeso)
-            else:
-                matriz = criaMatrizAdjacencias(dataset, numV, tipo)
-
-            listaAdj = criaListaAdjacencias(matriz)
-
             totalArestas = len(dataset)
             densidade = totalArestas / g_max
             print(f"Densidade (|E|/g_max): {densidade:.3f}")
 
-            escreveMatrizParaArquivo(matriz, listaAdj, arq, numV, numA, seed, i + 1)
-            verGrafo(matriz, nomeArq)
+            # Pesos: um vetor alinhado às arestas, sorteado de uma vez com o fluxo
+            # próprio do grafo i (a mesma semente reproduz arestas e pesos)
+            if valorado:
+                pesos = geraPesos(len(dataset), minPeso, maxPeso, np.random.default_rng(sementeGrafo(seed, i)))
+            else:
+                pesos = None
+            # CSR: O(V + E) memória, sem a matriz numV × numV
+            adj = criaAdjacenciaCSR(dataset, numV, tipo, pesos)
+            escreveAdjacenciaParaArquivo(adj, arq, numV, numA, seed, i + 1)
+            verGrafo(adj, nomeArq)
 
         if input("\nDigite 'y' para gerar novamente, qualquer outra tecla para sair: ").strip().lower() != "y":
             break
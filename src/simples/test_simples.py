@@ -12,7 +12,7 @@ import numpy as np
 import networkx as nx
 import pandas as pd
 from datetime import datetime
-from gerador import geraDataset
+from gerador import geraDatasetIter
 from utils import tipoGrafo, compConexas
 from constants import *
 
@@ -420,16 +420,13 @@ def executa_teste(tipo, numV, numA, seed, n=1, numC=0, fator=1.0):
         import time
         start_time = time.time()
         
-        # Gera o grafo
-        datasets = geraDataset(tipo, numV, numA, seed, n, numC, fator)
+        # Gera apenas o primeiro grafo do dataset
+        arestas = next(geraDatasetIter(tipo, numV, numA, seed, n, numC, fator), None)
         
-        if not datasets:
+        if arestas is None:
             print(f"ERRO: Falha na geração do grafo")
             return None
         
-        # Pega o primeiro dataset
-        arestas = datasets[0]
-        
         # Cria matriz de adjacência
         from utils import criaMatrizAdjacencias
         matriz = criaMatrizAdjacencias(arestas, numV, tipo)
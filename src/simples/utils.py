@@ -1,96 +1,112 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import numpy as np
-import random
 
+from scipy.sparse import coo_matrix, csr_matrix
+from scipy.sparse.csgraph import connected_components
 
+from adjacencia import AdjacenciaCSR, criaAdjacenciaCSR
+from arestas import classificaTipo
 
-def dfs(matriz, inicio, visitados):
+
+def componentesConexas(grafo, numV=None):
     """
-    Implementa busca em profundidade (DFS) para detectar conectividade.
+    Rotula as componentes conexas a partir das arestas ou da AdjacenciaCSR.
     
-    Esta função percorre o grafo a partir de um vértice inicial usando DFS
-    iterativo (com pilha) para marcar todos os vértices alcançáveis.
+    Em grafos dirigidos as componentes são fracas (direção ignorada), como
+    as componentes que geraComponente constrói. Arestas múltiplas e laços
+    não alteram o resultado.
     
     Args:
-        matriz: Matriz de adjacências do grafo
-        inicio (int): Vértice inicial para iniciar a busca
-        visitados (set): Conjunto de vértices já visitados (modificado in-place)
+        grafo: Array (E, 2) ou lista de tuplas (u, v), ou AdjacenciaCSR
+        numV (int): Número de vértices (obrigatório para arestas)
     
-    Algorithm:
-        - Usa pilha para implementação iterativa (mais eficiente para grafos grandes)
-        - Suporta tanto grafos simples quanto multigrafos/pseudografos
-        - Marca vértices como visitados durante a busca
-        
-    Note:
-        - Modifica o conjunto visitados in-place
-        - Detecta arestas tanto em listas (grafos valorados) quanto números
+    Returns:
+        tuple: (numComponentes, rotulos, tamanhos)
+            - rotulos: np.ndarray (numV) com a componente de cada vértice,
+              numeradas a partir de 0 na ordem do menor vértice
+            - tamanhos: np.ndarray (numComponentes) com os vértices de cada uma
+    
+    Complexity:
+        - Time: O(V + E), em C (scipy.sparse.csgraph)
+        - Space: O(V + E)
+    
+    Example:
+        >>> componentesConexas([(0, 1), (3, 2)], 5)
+        (3, array([0, 0, 1, 1, 2], dtype=int32), array([2, 2, 1]))
     """
-    pilha = [inicio]
-    while pilha:
-        vertice = pilha.pop()
-        if vertice not in visitados:
-            visitados.add(vertice)
-            # Explora todos os vizinhos do vértice atual
-            for vizinho in range(len(matriz)):
-                cell = matriz[vertice][vizinho]
-                # Verifica se há conexão (suporta diferentes formatos)
-                if isinstance(cell, list):
-                    cond = len(cell) >= 1  # Lista não vazia = aresta existe
-                else:
-                    cond = cell >= 1       # Número >= 1 = aresta existe
-                if cond and vizinho not in visitados:
-                    pilha.append(vizinho)
+    if isinstance(grafo, AdjacenciaCSR):
+        numV = grafo.numV
+        grafo = csr_matrix((np.ones(grafo.indices.size, dtype=np.int32), grafo.indices, grafo.indptr),
+                           shape=(numV, numV))
+    else:
+        arestas = np.asarray(grafo, dtype=np.int64).reshape(-1, 2)
+        grafo = coo_matrix((np.ones(len(arestas), dtype=np.int32), (arestas[:, 0], arestas[:, 1])),
+                           shape=(numV, numV))
+    # directed + weak cobre os dois casos: uma direção por aresta basta
+    numComponentes, rotulos = connected_components(grafo, directed=True, connection='weak')
+    return numComponentes, rotulos, np.bincount(rotulos, minlength=numComponentes)
+
+
+def _contagensMatriz(matriz):
+    """Matriz numérica de multiplicidades (células com listas de pesos contam pelo tamanho)."""
+    if isinstance(matriz, np.ndarray) and matriz.dtype != object:
+        return matriz
+    n = len(matriz)
+    return np.array([[len(cell) if isinstance(cell, list) else cell for cell in linha]
+                     for linha in matriz]).reshape(n, n)
+
 
 def compConexas(matriz):
     """
     Calcula o número de componentes conexas em um grafo.
     
     Uma componente conexa é um subgrafo onde todos os vértices são alcançáveis
-    entre si. Esta função conta quantas dessas componentes existem no grafo.
+    entre si. Esta função conta quantas dessas componentes existem no grafo
+    (componentes fracas em grafos dirigidos).
     
     Args:
-        matriz: Matriz de adjacências do grafo
+        matriz: Matriz de adjacências do grafo ou AdjacenciaCSR
     
     Returns:
         int: Número de componentes conexas
         
     Algorithm:
-        - Inicializa conjunto de vértices visitados
-        - Para cada vértice não visitado, executa DFS
-        - Cada DFS marca uma componente conexa completa
-        - Conta o número de DFSs executados
+        - Extrai as posições não nulas da matriz (ou usa a CSR diretamente)
+        - Rotula as componentes com componentesConexas
         
     Complexity:
-        - Time: O(V²) onde V é o número de vértices
-        - Space: O(V) para o conjunto de visitados
+        - Time: O(V²) para ler a matriz; O(V + E) com AdjacenciaCSR
+        - Space: O(V + E)
         
     Example:
         >>> matriz = [[0, 1, 0], [1, 0, 0], [0, 0, 0]]
         >>> compConexas(matriz)
         2  # 2 componentes: {0,1} e {2}
     """
-    visitados = set()
-    componentes = 0
-    
-    # Para cada vértice não visitado, inicia uma nova busca
-    for vertice in range(len(matriz)):
-        if vertice not in visitados:
-            # DFS marca todos os vértices da componente atual
-            dfs(matriz, vertice, visitados)
-            componentes += 1
-    
-    return componentes
+    if isinstance(matriz, AdjacenciaCSR):
+        return componentesConexas(matriz)[0]
+
+    return componentesConexas(np.argwhere(_contagensMatriz(matriz) >= 1), len(matriz))[0]
 
 
 
-def atribuiPesos(matriz, minPeso, maxPeso):
-    for i in range(len(matriz)):
-        for j in range(len(matriz[i])):
-            if matriz[i][j] > 0:
-                matriz[i][j] = sum(
-                    [random.randint(minPeso, maxPeso) for _ in range(matriz[i][j])]
-                )
+def atribuiPesos(matriz, minPeso, maxPeso, rng=None):
+    """
+    Substitui cada contagem c > 0 da matriz pela soma de c pesos sorteados.
+
+    Os pesos de todas as cópias são sorteados de uma vez (gerador.geraPesos,
+    com o rng recebido: sem ele, os pesos não são reprodutíveis) e somados
+    por célula com np.add.reduceat. A matriz é alterada no lugar.
+    """
+    from gerador import geraPesos
+    matriz = np.asarray(matriz)
+    celulas = np.flatnonzero(matriz > 0)
+    contagens = matriz.flat[celulas]
+    if celulas.size:
+        pesos = geraPesos(int(contagens.sum()), minPeso, maxPeso, rng)
+        inicios = np.concatenate(([0], np.cumsum(contagens[:-1])))
+        matriz.flat[celulas] = np.add.reduceat(pesos, inicios)
     return matriz
 
 
@@ -99,7 +115,8 @@ def tipoGrafo(matriz):
     Detecta automaticamente o tipo de grafo baseado na matriz de adjacências.
     
     Esta função analisa a estrutura da matriz para determinar as características
-    do grafo e classifica em um dos 6 tipos suportados.
+    do grafo e classifica em um dos 6 tipos suportados. Para arrays de arestas,
+    sem matriz, ver arestas.tipoArestas.
     
     Características analisadas:
     - Dirigido: Matriz não é simétrica
@@ -107,7 +124,7 @@ def tipoGrafo(matriz):
     - Laços: Valores > 0 na diagonal principal
     
     Args:
-        matriz: Matriz de adjacências do grafo
+        matriz: Matriz de adjacências do grafo ou AdjacenciaCSR
     
     Returns:
         int: Tipo do grafo conforme codificação:
@@ -129,48 +146,27 @@ def tipoGrafo(matriz):
         >>> tipoGrafo(matriz)
         20  # Multigrafo (aresta múltipla entre 0 e 1)
     """
-    laco = False
-    multipla = False
-    vert = len(matriz)
-    
-    # Passo 1: Analisa cada célula da matriz
-    for i in range(vert):
-        for j in range(vert):
-            cell = matriz[i][j]
-            
-            # Verifica se é uma lista (para grafos valorados)
-            if isinstance(cell, list):
-                if len(cell) > 1:
-                    multipla = True  # Múltiplas arestas
-                if len(cell) > 0 and i == j:
-                    laco = True      # Laço detectado
-            # Verifica se é um número (suporta numpy.integer)
-            elif isinstance(cell, (int, float, np.integer)):
-                if cell > 1:
-                    multipla = True  # Múltiplas arestas
-                if cell > 0 and i == j:
-                    laco = True      # Laço detectado
-    
-    # Passo 2: Verifica se é dirigido (matriz não simétrica)
-    dirigido = not (np.transpose(matriz) == matriz).all()
+    if isinstance(matriz, AdjacenciaCSR):
+        # Mesmas verificações, vetorizadas sobre as entradas não nulas
+        laco = matriz.temLacos()
+        multipla = matriz.temMultiplas()
+        dirigido = not matriz.simetrica()
+    else:
+        contagens = _contagensMatriz(matriz)
+        # Passo 1: Laços na diagonal e arestas múltiplas (valores > 1)
+        laco = bool(np.any(np.diagonal(contagens) > 0))
+        multipla = bool(np.any(contagens > 1))
+        # Passo 2: Verifica se é dirigido (matriz não simétrica)
+        dirigido = not np.array_equal(contagens, contagens.T)
     
     # Passo 3: Classifica baseado nas características encontradas
-    if dirigido and multipla and laco:
-        tipo = 31  # Pseudografo-Dirigido
-    elif dirigido and multipla:
-        tipo = 21  # Multigrafo-Dirigido
-    elif dirigido:
-        tipo = 1   # Digrafo
-    elif laco:
-        tipo = 30  # Pseudografo
-    elif multipla:
-        tipo = 20  # Multigrafo
-    else:
-        tipo = 0   # Simples
+    tipo = classificaTipo(dirigido, multipla, laco)
     
     return tipo
 
 def criaListaAdjacencias(matriz):
+    if isinstance(matriz, AdjacenciaCSR):
+        return matriz.listaAdjacencias()
     n = len(matriz)
     lista = {}
     for u in range(n):
@@ -187,7 +183,11 @@ def criaListaAdjacencias(matriz):
 
 
 def criaMatrizAdjacencias(arestas, numV, tipo):
-    """Cria matriz de adjacências preservando arestas múltiplas e laços."""
+    """
+    Cria matriz de adjacências preservando arestas múltiplas e laços.
+
+    Ocupa O(V²) memória; para grafos grandes, usar criaAdjacenciaCSR.
+    """
     matriz = np.array([[0] * numV for _ in range(numV)])
     
     # Conta as ocorrências de cada aresta
@@ -207,10 +207,19 @@ def criaMatrizAdjacencias(arestas, numV, tipo):
     return matriz
 
 
-def criaMatrizAdjacenciasValorada(arestas, numV, tipo, minPeso, maxPeso):
+def criaMatrizAdjacenciasValorada(arestas, numV, tipo, minPeso, maxPeso, pesos=None, rng=None):
+    """
+    Cria matriz numV × numV de listas de pesos, um por cópia de aresta.
+
+    Ocupa O(V²) objetos Python; para grafos grandes, usar
+    criaAdjacenciaCSR(arestas, numV, tipo, pesos). Sem pesos, sorteia o
+    vetor de pesos em uma chamada (gerador.geraPesos) com o rng recebido.
+    """
+    if pesos is None:
+        from gerador import geraPesos
+        pesos = geraPesos(len(arestas), minPeso, maxPeso, rng)
     matriz = [[[] for _ in range(numV)] for _ in range(numV)]
-    for u, v in arestas:
-        peso = random.randint(minPeso, maxPeso)
+    for (u, v), peso in zip(arestas, np.asarray(pesos).tolist()):
         matriz[u][v].append(peso)
         if tipo in (0, 20, 30) and u != v:
             matriz[v][u].append(peso)
@@ -226,3 +235,17 @@ def escreveMatrizParaArquivo(matriz, listaAdj, nomeArq, numV, numA, seed, n):
         arquivo.write(f"{matriz}\n")
         for vertice, adjacencias in listaAdj.items():
             arquivo.write(f"{vertice}: {adjacencias}\n")
+
+
+def escreveAdjacenciaParaArquivo(adj, nomeArq, numV, numA, seed, n):
+    """
+    Grava o cabeçalho e a lista de adjacências de uma AdjacenciaCSR.
+
+    Mesmo formato de escreveMatrizParaArquivo sem a matriz densa: uma linha
+    "u: [(v, contagem), ...]" por vértice, ou "u: [(v, peso), ...]" com um
+    par por cópia em grafos valorados (ver AdjacenciaCSR.listaAdjacencias).
+    """
+    with open(nomeArq, "w") as arquivo:
+        arquivo.write(f"numV: {numV}, numA: {numA}, seed: {seed}, n: {n}\n")
+        for vertice, adjacencias in adj.listaAdjacencias().items():
+            arquivo.write(f"{vertice}: {adjacencias}\n")
@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import numpy as np
-from igraph import Graph, plot
+from igraph import Graph, Layout, plot
 
+# adjacencia importa arestas, que põe src no sys.path (pacote comum)
+from adjacencia import AdjacenciaCSR
+from comum.renderizacao import MAX_VERTICES_DESENHO, hashGrafo, carregaLayout, salvaLayout, renderizaGrafo
 
-def verGrafo(matriz, nomeArq):
+
+def _arestasMatriz(matriz):
+    """Dirigido, arestas e pesos da matriz de adjacências (contagens ou listas de pesos)."""
     n = len(matriz)
 
     # Detectar se é dirigido
@@ -34,6 +39,38 @@ def verGrafo(matriz, nomeArq):
             elif cell > 0:
                 edges.append((i, j))
                 weights.append(cell)
+    return dirigido, edges, weights
+
+
+def _arestasCSR(adj):
+    """Dirigido, arestas e contagens (ou pesos) de uma AdjacenciaCSR, sem varrer os n² pares."""
+    dirigido = not adj.simetrica()
+    if adj.valorado:
+        # Uma aresta por cópia, rotulada com o seu peso
+        u, v, rotulos = adj.arestasValoradas()
+    elif dirigido:
+        u, v, rotulos = adj.linhas(), adj.indices, adj.contagens
+    else:
+        # Cada aresta uma vez (a matriz desenha (i, j) e (j, i))
+        u, v, rotulos = adj.arestas()
+    return dirigido, list(zip(u.tolist(), v.tolist())), rotulos.tolist()
+
+
+def verGrafo(matriz, nomeArq):
+    n = len(matriz)
+    caminho = f"../plots/{nomeArq}.png"
+
+    if n > MAX_VERTICES_DESENHO and isinstance(matriz, AdjacenciaCSR):
+        # Grafo grande: desenha o grafo reduzido, sem rótulos (ver comum/renderizacao.py)
+        u, v, contagem = matriz.arestas()
+        arestas = np.repeat(np.column_stack((u, v)), contagem, axis=0)
+        renderizaGrafo(arestas, n, caminho, dirigido=not matriz.simetrica(), modo='reduzido')
+        return
+
+    if isinstance(matriz, AdjacenciaCSR):
+        dirigido, edges, weights = _arestasCSR(matriz)
+    else:
+        dirigido, edges, weights = _arestasMatriz(matriz)
 
     # Criar o grafo no igraph
     g = Graph(directed=dirigido)
@@ -43,8 +80,13 @@ def verGrafo(matriz, nomeArq):
     g.es["label"] = weights
     g.vs["label"] = g.vs.indices
 
-    # Layout e plotagem
-    layout = g.layout("kk")  # Kamada-Kawai
+    # Layout Kamada-Kawai, em cache pela hash do grafo
+    chave = f"{hashGrafo(edges, n)}-igraph-kk"
+    coords = carregaLayout(chave)
+    if coords is None:
+        coords = np.array(g.layout("kk").coords)
+        salvaLayout(chave, coords)
+    layout = Layout(coords.tolist())
     plot(
         g,
         bbox=(600, 600),
@@ -52,5 +94,5 @@ def verGrafo(matriz, nomeArq):
         edge_arrow_size=0.8,
         vertex_label_size=14,
         edge_label=g.es["label"],
-        target=f"../plots/{nomeArq}.png",
+        target=caminho,
     )